@@ -0,0 +1,36 @@
+"""add vehicle_lookup_stats table
+
+Revision ID: 0f07fd86261d
+Revises: b5ef55774c73
+Create Date: 2026-10-17 10:12:41.382907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0f07fd86261d'
+down_revision = 'b5ef55774c73'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('vehicle_lookup_stats',
+                    sa.Column('id', sa.Integer(), primary_key=True),
+                    sa.Column('latest_plate_lookup_id', sa.Integer(),
+                              sa.ForeignKey('plate_lookups.id'), nullable=False),
+                    sa.Column('num_lookups', sa.Integer(), nullable=False,
+                              server_default='0'),
+                    sa.Column('plate', sa.String(16), nullable=False),
+                    sa.Column('plate_types', sa.String(255), nullable=False,
+                              server_default=''),
+                    sa.Column('state', sa.String(8), nullable=False))
+    op.create_index('index_plate_state_plate_types', 'vehicle_lookup_stats',
+                    ['plate', 'state', 'plate_types'], unique=True)
+
+
+def downgrade():
+    op.drop_index('index_plate_state_plate_types', 'vehicle_lookup_stats')
+    op.drop_table('vehicle_lookup_stats')
@@ -0,0 +1,33 @@
+"""add latest_created_at to vehicle_lookup_stats
+
+Revision ID: 3e7b0d9c42a1
+Revises: 9a4e2c71d5b3
+Create Date: 2026-10-17 16:02:37.514208
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e7b0d9c42a1'
+down_revision = '9a4e2c71d5b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('vehicle_lookup_stats',
+                  sa.Column('latest_created_at', sa.DateTime(), nullable=True))
+
+    op.execute(
+        'UPDATE vehicle_lookup_stats '
+        'JOIN plate_lookups ON plate_lookups.id = vehicle_lookup_stats.latest_plate_lookup_id '
+        'SET vehicle_lookup_stats.latest_created_at = plate_lookups.created_at')
+
+    op.alter_column('vehicle_lookup_stats', 'latest_created_at',
+                    existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade():
+    op.drop_column('vehicle_lookup_stats', 'latest_created_at')
@@ -0,0 +1,29 @@
+"""add unique_identifier_sequence table
+
+Revision ID: 6cc8fb50e674
+Revises: 0f07fd86261d
+Create Date: 2026-10-17 11:03:27.514620
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6cc8fb50e674'
+down_revision = '0f07fd86261d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    sequence_table = op.create_table(
+        'unique_identifier_sequence',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('next_value', sa.BigInteger(), nullable=False,
+                  server_default='0'))
+    op.bulk_insert(sequence_table, [{'id': 1, 'next_value': 0}])
+
+
+def downgrade():
+    op.drop_table('unique_identifier_sequence')
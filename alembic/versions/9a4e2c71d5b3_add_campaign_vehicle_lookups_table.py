@@ -0,0 +1,36 @@
+"""add campaign_vehicle_lookups table
+
+Revision ID: 9a4e2c71d5b3
+Revises: 6cc8fb50e674
+Create Date: 2026-10-17 11:48:05.207316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4e2c71d5b3'
+down_revision = '6cc8fb50e674'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('campaign_vehicle_lookups',
+                    sa.Column('id', sa.Integer(), primary_key=True),
+                    sa.Column('campaign_id', sa.Integer(),
+                              sa.ForeignKey('campaigns.id'), nullable=False),
+                    sa.Column('latest_plate_lookup_id', sa.Integer(),
+                              sa.ForeignKey('plate_lookups.id'), nullable=False),
+                    sa.Column('num_tickets', sa.Integer(), nullable=False,
+                              server_default='0'),
+                    sa.Column('plate', sa.String(16), nullable=False),
+                    sa.Column('state', sa.String(8), nullable=False))
+    op.create_index('index_campaign_id_plate_state', 'campaign_vehicle_lookups',
+                    ['campaign_id', 'plate', 'state'], unique=True)
+
+
+def downgrade():
+    op.drop_index('index_campaign_id_plate_state', 'campaign_vehicle_lookups')
+    op.drop_table('campaign_vehicle_lookups')
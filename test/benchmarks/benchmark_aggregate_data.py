@@ -0,0 +1,144 @@
+"""Benchmark OpenDataService._calculate_aggregate_data on a synthetic plate
+with 10,000 tickets against the previous multi-pass implementation.
+
+Run from the repository root:
+
+    python -m test.benchmarks.benchmark_aggregate_data
+"""
+
+import random
+import timeit
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+from traffic_violations.constants.open_data.violations import \
+    CAMERA_VIOLATIONS
+from traffic_violations.models.fine_data import FineData
+from traffic_violations.models.plate_query import PlateQuery
+from traffic_violations.models.response.open_data_service_plate_lookup import (
+    OpenDataServicePlateLookup)
+from traffic_violations.models.summons import Summons
+from traffic_violations.services.apis.open_data_service import OpenDataService
+
+NUM_TICKETS = 10_000
+NUM_RUNS = 5
+
+
+def build_violations(num_tickets: int) -> dict[str, dict]:
+    violation_names = CAMERA_VIOLATIONS + [
+        'Double Parking', 'Expired Meter', 'Fire Hydrant', 'No Standing']
+
+    violations = {}
+    for summons_number in range(num_tickets):
+        issue_date = datetime(2014, 1, 1) + timedelta(days=random.randint(0, 3000))
+        fined = float(random.randint(50, 150))
+
+        violations[str(summons_number)] = {
+            'borough': random.choice(['BRONX', 'BROOKLYN', 'MANHATTAN', 'QUEENS']),
+            'fined': fined,
+            'has_date': True,
+            'issue_date': issue_date.strftime(OpenDataService.TIME_FORMAT),
+            'outstanding': fined / 2,
+            'paid': fined / 2,
+            'reduced': 0,
+            'summons_number': str(summons_number),
+            'violation': random.choice(violation_names)}
+
+    return violations
+
+
+def build_summonses(violations: dict[str, dict]) -> dict[str, Summons]:
+    return {
+        summons_number: Summons.create(
+            borough=v['borough'],
+            fined=Summons.to_cents(v['fined']),
+            issue_date=datetime.strptime(v['issue_date'], OpenDataService.TIME_FORMAT),
+            outstanding=Summons.to_cents(v['outstanding']),
+            paid=Summons.to_cents(v['paid']),
+            reduced=Summons.to_cents(v['reduced']),
+            summons_number=summons_number,
+            violation=v['violation'])
+        for summons_number, v in violations.items()}
+
+
+def legacy_calculate_aggregate_data(service: OpenDataService,
+                                    plate_query: PlateQuery,
+                                    violations) -> OpenDataServicePlateLookup:
+    """The multi-pass implementation over per-ticket dicts that the
+    single-pass one over Summons records replaced.
+    """
+
+    time_format = service.TIME_FORMAT
+
+    fines = FineData(
+        fined=round(sum(v['fined'] for v in violations.values() if v.get('fined')), 2),
+        reduced=round(sum(v['reduced'] for v in violations.values() if v.get('reduced')), 2),
+        paid=round(sum(v['paid'] for v in violations.values() if v.get('paid')), 2),
+        outstanding=round(sum(v['outstanding'] for v in violations.values() if v.get('outstanding')), 2))
+
+    tickets = Counter([v['violation'].title() for v in violations.values()
+                       if v.get('violation') is not None]).most_common()
+
+    years = Counter([datetime.strptime(v['issue_date'], time_format).strftime('%Y')
+                     if v.get('has_date') else 'No Year Available'
+                     for v in violations.values()]).most_common()
+
+    boroughs = Counter([v['borough'].title() for v in violations.values()
+                        if v.get('borough')]).most_common()
+
+    camera_violations_by_type = {
+        violation_type: service._find_max_camera_violations_streak(
+            sorted([datetime.strptime(v['issue_date'], time_format)
+                    for v in violations.values() if v.get('violation') == violation_type]))
+        for violation_type in CAMERA_VIOLATIONS}
+
+    camera_violations_by_type['Mixed'] = service._find_max_camera_violations_streak(
+        sorted([datetime.strptime(v['issue_date'], time_format)
+                for v in violations.values()
+                if v.get('violation') and v['violation'] in CAMERA_VIOLATIONS]))
+
+    return OpenDataServicePlateLookup(
+        boroughs=[{'count': v, 'title': k.title()} for k, v in boroughs],
+        camera_streak_data=camera_violations_by_type,
+        fines=fines,
+        num_violations=len(violations),
+        plate=plate_query.plate,
+        plate_types=plate_query.plate_types,
+        state=plate_query.state,
+        violations=[{'count': v, 'title': k.title()} for k, v in tickets],
+        years=sorted([{'count': v, 'title': k.title()} for k, v in years],
+                     key=lambda k: k['title']))
+
+
+def main():
+    random.seed(0)
+
+    service = OpenDataService()
+    violations = build_violations(NUM_TICKETS)
+    summonses = build_summonses(violations)
+    plate_query = PlateQuery(
+        created_at='Tue Dec 31 19:28:12 -0500 2019',
+        message_source='status',
+        plate='ABC1234',
+        state='NY')
+
+    assert service._calculate_aggregate_data(plate_query, summonses) == \
+        legacy_calculate_aggregate_data(service, plate_query, violations)
+
+    legacy_seconds = min(timeit.repeat(
+        lambda: legacy_calculate_aggregate_data(service, plate_query, violations),
+        number=1, repeat=NUM_RUNS))
+
+    single_pass_seconds = min(timeit.repeat(
+        lambda: service._calculate_aggregate_data(plate_query, summonses),
+        number=1, repeat=NUM_RUNS))
+
+    print(f'{NUM_TICKETS} tickets, best of {NUM_RUNS} runs')
+    print(f'multi-pass:  {legacy_seconds * 1000:.1f} ms')
+    print(f'single-pass: {single_pass_seconds * 1000:.1f} ms')
+    print(f'speedup:     {legacy_seconds / single_pass_seconds:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
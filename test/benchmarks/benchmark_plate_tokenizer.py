@@ -0,0 +1,87 @@
+"""Benchmark finding the plates in a synthetic batch of 10,000 tweets with
+plate_tokenizer.find_plate_strings, and checking their fields against
+frozensets of states and plate types, against PLATE_FORMAT_REGEX and the
+state and plate types patterns.
+
+Run from the repository root:
+
+    python -m test.benchmarks.benchmark_plate_tokenizer
+"""
+
+import random
+import re
+import timeit
+
+from traffic_violations.constants import regexps as regexp_constants
+from traffic_violations.utils.plate_tokenizer import find_plate_strings
+
+NUM_TWEETS = 10_000
+NUM_RUNS = 5
+
+WORDS = ['@HowsMyDrivingNY', 'this', 'car', 'was', 'blocking', 'the', 'bike',
+         'lane', 'again', 'on', '4th', 'Ave', 'at', '9:15am', 'https://t.co/Xy12Ab',
+         'please', 'check', '#SaferSkillman', 'thanks!', 'for', 'the', '3rd', 'time']
+
+
+def build_tweets(num_tweets: int) -> list[str]:
+    tweets = []
+
+    for _ in range(num_tweets):
+        words = random.sample(WORDS, random.randint(8, 20))
+
+        for _ in range(random.choice([0, 1, 1, 1, 2, 3])):
+            plate = ''.join(random.choice('ABCDEFGHJKLMNPRSTUVWXYZ0123456789')
+                            for _ in range(random.randint(5, 8)))
+            state = random.choice(regexp_constants.STATE_ABBREVIATIONS)
+            fields = [state, plate]
+
+            if random.random() < 0.2:
+                fields.append(random.choice(regexp_constants.PLATE_TYPES))
+
+            random.shuffle(fields)
+            words.insert(random.randint(0, len(words)), ':'.join(fields))
+
+        tweets.append(' '.join(words))
+
+    return tweets
+
+
+def classify_with_regexps(tweets: list[str]) -> list[list[tuple[bool, bool]]]:
+    return [[(regexp_constants.STATE_ABBREVIATIONS_PATTERN.search(field.upper()) is not None,
+              any(regexp_constants.PLATE_TYPES_PATTERN.search(part) is not None
+                  for part in field.upper().split(',')))
+             for match in re.findall(regexp_constants.PLATE_FORMAT_REGEX, tweet)
+             for field in match.split(':')]
+            for tweet in tweets]
+
+
+def classify_with_tokenizer(tweets: list[str]) -> list[list[tuple[bool, bool]]]:
+    return [[(field.upper() in regexp_constants.STATE_ABBREVIATIONS_SET,
+              any(part in regexp_constants.PLATE_TYPES_SET
+                  for part in field.upper().split(',')))
+             for match in find_plate_strings(tweet)
+             for field in match.split(':')]
+            for tweet in tweets]
+
+
+def main():
+    random.seed(0)
+
+    tweets = build_tweets(NUM_TWEETS)
+
+    assert classify_with_tokenizer(tweets) == classify_with_regexps(tweets)
+
+    regexp_seconds = min(timeit.repeat(
+        lambda: classify_with_regexps(tweets), number=1, repeat=NUM_RUNS))
+
+    tokenizer_seconds = min(timeit.repeat(
+        lambda: classify_with_tokenizer(tweets), number=1, repeat=NUM_RUNS))
+
+    print(f'{NUM_TWEETS} tweets, best of {NUM_RUNS} runs')
+    print(f'regexps:   {regexp_seconds * 1000:.1f} ms')
+    print(f'tokenizer: {tokenizer_seconds * 1000:.1f} ms')
+    print(f'speedup:   {regexp_seconds / tokenizer_seconds:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
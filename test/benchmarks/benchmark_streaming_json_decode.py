@@ -0,0 +1,135 @@
+"""Benchmark peak memory while decoding and normalizing a synthetic
+Open Parking and Camera Violations response of 10,000 rows, streaming the
+records one at a time against decoding the whole body at once.
+
+Run from the repository root:
+
+    python -m test.benchmarks.benchmark_streaming_json_decode
+"""
+
+import json
+import random
+import tracemalloc
+
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+
+from traffic_violations.constants.open_data.violations import \
+    HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS
+from traffic_violations.models.plate_query import PlateQuery
+from traffic_violations.services.apis.open_data_service import OpenDataService
+
+NUM_ROWS = [1_000, 10_000]
+QUERY_STRING = 'https://data.cityofnewyork.us/resource/uvbq-3m68.json?plate=ABC1234'
+
+
+class FakeResponse:
+    """ Just enough of a streamed requests response to decode """
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.status_code = 200
+
+    def close(self):
+        pass
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def build_body(num_rows: int) -> bytes:
+    violation_names = list(HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS)
+
+    records = []
+    for summons_number in range(num_rows):
+        issue_date = datetime(2014, 1, 1) + timedelta(days=random.randint(0, 3000))
+
+        records.append({
+            'amount_due': '0.00',
+            'county': random.choice(['BK', 'BX', 'K', 'NY', 'Q', 'QN']),
+            'fine_amount': '115.00',
+            'interest_amount': '0.00',
+            'issue_date': issue_date.strftime('%m/%d/%Y'),
+            'license_type': 'PAS',
+            'payment_amount': '115.00',
+            'penalty_amount': '0.00',
+            'plate': 'ABC1234',
+            'precinct': str(random.randint(1, 123)),
+            'reduction_amount': '0.00',
+            'state': 'NY',
+            'summons_number': str(1_000_000_000 + summons_number),
+            'violation': random.choice(violation_names)})
+
+    return json.dumps(records).encode('utf-8')
+
+
+def build_future(body: bytes) -> Future:
+    future = Future()
+    future.set_result(FakeResponse(body=body))
+    return future
+
+
+def decode_whole_body(service: OpenDataService, plate_query: PlateQuery, body: bytes):
+    """The previous path: read the whole body, decode every record, and
+    only then normalize them.
+    """
+    response = build_future(body).result()
+
+    records = json.loads(b''.join(response.iter_content(
+        chunk_size=service.RESPONSE_CHUNK_SIZE)))
+
+    return service._process_open_parking_and_camera_violations_records(
+        plate_query=plate_query, records=records, since=None, until=None)
+
+
+def decode_streamed_records(service: OpenDataService, plate_query: PlateQuery, body: bytes):
+    records = service._read_query_records(
+        future=build_future(body), query_string=QUERY_STRING)
+
+    return service._process_open_parking_and_camera_violations_records(
+        plate_query=plate_query, records=records, since=None, until=None)
+
+
+def measure(function, *args):
+    """Return (peak, retained) bytes allocated while calling function."""
+    tracemalloc.start()
+
+    result = function(*args)
+    retained, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del result
+
+    return peak, retained
+
+
+def main():
+    random.seed(0)
+
+    service = OpenDataService()
+    plate_query = PlateQuery(
+        created_at='Tue Dec 31 19:28:12 -0500 2019',
+        message_source='status',
+        plate='ABC1234',
+        state='NY')
+
+    for num_rows in NUM_ROWS:
+        body = build_body(num_rows)
+
+        assert decode_whole_body(service, plate_query, body) == \
+            decode_streamed_records(service, plate_query, body)
+
+        whole_peak, whole_retained = measure(decode_whole_body, service, plate_query, body)
+        streamed_peak, streamed_retained = measure(
+            decode_streamed_records, service, plate_query, body)
+
+        print(f'{num_rows} rows, {len(body) / 2 ** 20:.1f} MiB body')
+        print(f'whole body: {whole_peak / 2 ** 20:.1f} MiB peak, '
+              f'{(whole_peak - whole_retained) / 2 ** 20:.1f} MiB beyond the normalized result')
+        print(f'streamed:   {streamed_peak / 2 ** 20:.1f} MiB peak, '
+              f'{(streamed_peak - streamed_retained) / 2 ** 20:.1f} MiB beyond the normalized result')
+
+
+if __name__ == '__main__':
+    main()
@@ -64,7 +64,7 @@ class TestCovid19CameraOffenderJob(unittest.TestCase):
         }
     )
     @mock.patch(
-        'traffic_violations.jobs.covid_19_camera_offender_job.OpenDataService.look_up_vehicle')
+        'traffic_violations.jobs.covid_19_camera_offender_job.OpenDataService.look_up_vehicles')
     @mock.patch(
         'traffic_violations.jobs.covid_19_camera_offender_job.Covid19CameraOffender.get_by')
     @mock.patch(
@@ -76,7 +76,7 @@ class TestCovid19CameraOffenderJob(unittest.TestCase):
                                  mocked_open_data_covid_19_lookup: MagicMock,
                                  mocked_traffic_violations_tweeter_send_status: MagicMock,
                                  mocked_covid_19_camera_offender_get_by: MagicMock,
-                                 mocked_open_data_service_look_up_vehicle: MagicMock,
+                                 mocked_open_data_service_look_up_vehicles: MagicMock,
                                  open_data_results: dict[str, str],
                                  dry_run: bool = False,
                                  offender_record_exists: bool = False):
@@ -119,7 +119,8 @@ class TestCovid19CameraOffenderJob(unittest.TestCase):
             data=open_data_plate_lookup,
             success=True)
 
-        mocked_open_data_service_look_up_vehicle.return_value = open_data_response
+        mocked_open_data_service_look_up_vehicles.side_effect = (
+            lambda plate_queries, time_ranges: [open_data_response] * len(plate_queries))
 
         red_light_camera_violations_string = (
             f"{offender['red_light_camera_count']} | Red Light Camera Violations\n"
@@ -75,7 +75,7 @@ class TestRecklessDriverRetrospectiveJob(unittest.TestCase):
         }
     )
     @mock.patch(
-        'traffic_violations.jobs.reckless_driver_retrospective_job.OpenDataService.look_up_vehicle')
+        'traffic_violations.jobs.reckless_driver_retrospective_job.OpenDataService.look_up_vehicles')
     @mock.patch(
         'traffic_violations.jobs.reckless_driver_retrospective_job.PlateLookup.get_all_in')
     @mock.patch(
@@ -87,7 +87,7 @@ class TestRecklessDriverRetrospectiveJob(unittest.TestCase):
                                  mocked_tweet_detection_service_tweet_exists,
                                  mocked_traffic_violations_tweeter,
                                  mocked_plate_lookup_get_all_in,
-                                 mocked_open_data_service_look_up_vehicle,
+                                 mocked_open_data_service_look_up_vehicles,
                                  can_link_tweet=True,
                                  dry_run=False,
                                  new_camera_violations_string='10 new camera violations',
@@ -236,8 +236,9 @@ class TestRecklessDriverRetrospectiveJob(unittest.TestCase):
             data=open_data_plate_lookup_after_previous_lookup,
             success=True)
 
-        mocked_open_data_service_look_up_vehicle.side_effect = [
-            open_data_response_before_previous_lookup, open_data_response_after_previous_lookup]
+        mocked_open_data_service_look_up_vehicles.side_effect = [
+            [open_data_response_before_previous_lookup],
+            [open_data_response_after_previous_lookup]]
 
         can_link_tweet_string = (
           f' by @BarackObama: '
@@ -0,0 +1,21 @@
+import mock
+import unittest
+
+from unittest.mock import MagicMock
+
+from traffic_violations.jobs.sync_open_parking_and_camera_violations_job import (
+    SyncOpenParkingAndCameraViolationsJob)
+
+
+class TestSyncOpenParkingAndCameraViolationsJob(unittest.TestCase):
+
+    @mock.patch(
+        'traffic_violations.jobs.sync_open_parking_and_camera_violations_job.LocalOpenDataService')
+    def test_sync(self, mocked_local_open_data_service: MagicMock):
+        mocked_local_open_data_service().sync_open_parking_and_camera_violations.return_value = (2, 1)
+
+        job = SyncOpenParkingAndCameraViolationsJob()
+        job.run(since='2021-01-31T00:00:00.000Z')
+
+        mocked_local_open_data_service().sync_open_parking_and_camera_violations.assert_called_with(
+            since='2021-01-31T00:00:00.000Z')
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+from traffic_violations.constants.open_data.endpoints import \
+    FISCAL_YEAR_DATABASE_ENDPOINTS
+from traffic_violations.models.plate_query import PlateQuery
+from traffic_violations.services.fiscal_year_database_cache import \
+    FiscalYearDatabaseCache
+
+
+class TestFiscalYearDatabaseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, 'cache.sqlite3')
+        self.cache = FiscalYearDatabaseCache(path=self.cache_path)
+
+        self.endpoint = FISCAL_YEAR_DATABASE_ENDPOINTS[2016]
+        self.plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types='PAS',
+            state='NY')
+
+        self.records = [{
+            'borough': 'MANHATTAN',
+            'has_date': True,
+            'issue_date': '2016-01-15T00:00:00.000',
+            'summons_number': '1234567890',
+            'violation': 'Fire Hydrant',
+            'violation_county': 'NY',
+            'violation_precinct': '1'}]
+
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_get_returns_none_on_miss(self):
+        self.assertIsNone(self.cache.get(
+            endpoint=self.endpoint, plate_query=self.plate_query))
+
+    def test_set_and_get(self):
+        self.cache.set(endpoint=self.endpoint,
+                       plate_query=self.plate_query,
+                       records=self.records)
+
+        self.assertEqual(
+            self.cache.get(endpoint=self.endpoint, plate_query=self.plate_query),
+            self.records)
+
+    def test_empty_results_are_cached(self):
+        self.cache.set(endpoint=self.endpoint,
+                       plate_query=self.plate_query,
+                       records=[])
+
+        self.assertEqual(
+            self.cache.get(endpoint=self.endpoint, plate_query=self.plate_query),
+            [])
+
+    def test_entries_are_keyed_by_dataset_and_plate_query(self):
+        self.cache.set(endpoint=self.endpoint,
+                       plate_query=self.plate_query,
+                       records=self.records)
+
+        other_plate_types = PlateQuery(
+            created_at=self.plate_query.created_at,
+            message_source=self.plate_query.message_source,
+            plate=self.plate_query.plate,
+            plate_types='COM',
+            state=self.plate_query.state)
+
+        self.assertIsNone(self.cache.get(
+            endpoint=FISCAL_YEAR_DATABASE_ENDPOINTS[2017],
+            plate_query=self.plate_query))
+        self.assertIsNone(self.cache.get(
+            endpoint=self.endpoint, plate_query=other_plate_types))
+
+    def test_entries_survive_reopening(self):
+        self.cache.set(endpoint=self.endpoint,
+                       plate_query=self.plate_query,
+                       records=self.records)
+        self.cache.close()
+
+        self.cache = FiscalYearDatabaseCache(path=self.cache_path)
+
+        self.assertEqual(
+            self.cache.get(endpoint=self.endpoint, plate_query=self.plate_query),
+            self.records)
@@ -0,0 +1,355 @@
+import copy
+import csv
+import ddt
+import json
+import mock
+import os
+import tempfile
+import unittest
+
+from traffic_violations.constants.open_data.endpoints import \
+    FISCAL_YEAR_DATABASE_ENDPOINTS, MEDALLION_ENDPOINT, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT
+
+from traffic_violations.models.plate_query import PlateQuery
+
+from traffic_violations.scripts.load_local_open_data_store import \
+    LoadLocalOpenDataStoreJob
+
+from traffic_violations.services.apis.local_open_data_service import \
+    LocalOpenDataService
+from traffic_violations.services.apis.open_data_service import \
+    OpenDataService, create_open_data_service
+from traffic_violations.services.local_open_data_store import \
+    LocalOpenDataStore
+from traffic_violations.services.plate_lookup_cache import PlateLookupCache
+
+from test.traffic_violations.services.test_open_data_service import \
+    _build_completed_future, _build_violation_fixtures
+
+
+@ddt.ddt
+class TestLocalOpenDataService(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.store = LocalOpenDataStore(
+            path=os.path.join(self.temp_dir.name, 'open_data.sqlite3'))
+
+        self.local_open_data_service = LocalOpenDataService(
+            local_open_data_store=self.store)
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def _load_fixtures(self, plate, plate_type, state):
+        open_parking_and_camera_violations, fiscal_year_databases_violations = \
+            _build_violation_fixtures(plate=plate, plate_type=plate_type, state=state)
+
+        self.local_open_data_service.load_records(
+            endpoint=OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT,
+            records=copy.deepcopy(open_parking_and_camera_violations))
+
+        for endpoint, violations_list in zip(
+                FISCAL_YEAR_DATABASE_ENDPOINTS.values(), fiscal_year_databases_violations):
+            self.local_open_data_service.load_records(
+                endpoint=endpoint, records=copy.deepcopy(violations_list))
+
+        return open_parking_and_camera_violations, fiscal_year_databases_violations
+
+    @ddt.data(
+        {'plate': 'ABC1234'},
+        {'medallion_query_result': [
+            {'dmv_license_plate_number': '8A23B', 'license_number': '8A23'}],
+         'plate': '8A23'},
+    )
+    @ddt.unpack
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_matches_open_data_portal(self,
+                                                      mocked_submit_query,
+                                                      plate,
+                                                      medallion_query_result=None):
+        final_plate = plate if medallion_query_result is None else medallion_query_result[0][
+            'dmv_license_plate_number']
+
+        open_parking_and_camera_violations, fiscal_year_databases_violations = \
+            self._load_fixtures(plate=final_plate, plate_type='PAS', state='NY')
+
+        side_effects = []
+
+        if medallion_query_result:
+            self.local_open_data_service.load_records(
+                endpoint=MEDALLION_ENDPOINT, records=medallion_query_result)
+
+            side_effects.append(_build_completed_future(medallion_query_result))
+
+        side_effects.append(_build_completed_future(copy.deepcopy(
+            open_parking_and_camera_violations)))
+
+        for violations_list in fiscal_year_databases_violations:
+            side_effects.append(_build_completed_future(copy.deepcopy(violations_list)))
+
+        mocked_submit_query.side_effect = side_effects
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate=plate,
+            plate_types='PAS',
+            state='NY')
+
+        portal_response = OpenDataService().look_up_vehicle(plate_query)
+
+        mocked_submit_query.reset_mock()
+
+        local_response = self.local_open_data_service.look_up_vehicle(plate_query)
+
+        mocked_submit_query.assert_not_called()
+
+        self.assertTrue(local_response.success)
+        self.assertGreater(local_response.data.num_violations, 0)
+        self.assertEqual(local_response, portal_response)
+
+    def test_look_up_vehicle_loaded_from_csv_matches_json(self):
+        open_parking_and_camera_violations, _ = _build_violation_fixtures(
+            plate='ABC1234', plate_type='PAS', state='NY')
+
+        # The portal serves every value as a string and leaves out nulls,
+        # which a CSV export has as empty cells, so a CSV export can only
+        # match a JSON one without blank values.
+        records = [{field: str(value) for field, value in record.items() if value != ''}
+                   for record in open_parking_and_camera_violations]
+        del records[0]['precinct']
+        del records[1]['fine_amount']
+
+        fieldnames = sorted(set().union(*records))
+
+        csv_path = os.path.join(self.temp_dir.name, 'opacv.csv')
+        with open(csv_path, 'w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=fieldnames, restval='')
+            writer.writeheader()
+            writer.writerows(records)
+
+        json_path = os.path.join(self.temp_dir.name, 'opacv.json')
+        with open(json_path, 'w') as json_file:
+            json.dump(records, json_file)
+
+        csv_store = LocalOpenDataStore(
+            path=os.path.join(self.temp_dir.name, 'csv_open_data.sqlite3'))
+        self.addCleanup(csv_store.close)
+
+        csv_open_data_service = LocalOpenDataService(local_open_data_store=csv_store)
+
+        job = LoadLocalOpenDataStoreJob()
+
+        csv_open_data_service.load_records(
+            endpoint=OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT,
+            records=job._read_records(path=csv_path))
+        self.local_open_data_service.load_records(
+            endpoint=OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT,
+            records=job._read_records(path=json_path))
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types='PAS',
+            state='NY')
+
+        csv_response = csv_open_data_service.look_up_vehicle(plate_query)
+
+        self.assertTrue(csv_response.success)
+        self.assertEqual(csv_response.data.num_violations, len(records))
+        self.assertEqual(
+            csv_response, self.local_open_data_service.look_up_vehicle(plate_query))
+
+    def test_look_up_vehicle_filters_plate_types(self):
+        self._load_fixtures(plate='ABC1234', plate_type='COM', state='NY')
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types='PAS',
+            state='NY')
+
+        response = self.local_open_data_service.look_up_vehicle(plate_query)
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.data.num_violations, 0)
+
+    def test_look_up_vehicles_matches_single_lookups(self):
+        for plate, state in [('ABC1234', 'NY'), ('XYZ9876', 'NJ')]:
+            self._load_fixtures(plate=plate, plate_type='PAS', state=state)
+
+        plate_queries = [
+            PlateQuery(created_at='Tue Dec 31 19:28:12 -0500 2019',
+                       message_source='status',
+                       plate=plate,
+                       plate_types=plate_types,
+                       state=state)
+            for plate, plate_types, state in [('ABC1234', None, 'NY'),
+                                              ('XYZ9876', 'PAS', 'NJ'),
+                                              ('XYZ9876', 'COM', 'NJ')]]
+
+        self.assertEqual(
+            self.local_open_data_service.look_up_vehicles(plate_queries),
+            [self.local_open_data_service.look_up_vehicle(plate_query)
+             for plate_query in plate_queries])
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_sync_open_parking_and_camera_violations(self, mocked_submit_query):
+        def build_record(summons_number, plate, updated_at, amount_due):
+            return {':updated_at': updated_at,
+                    'amount_due': amount_due,
+                    'fine_amount': '115.00',
+                    'issue_date': '01/15/2020',
+                    'license_type': 'PAS',
+                    'plate': plate,
+                    'precinct': '1',
+                    'state': 'NY',
+                    'summons_number': summons_number,
+                    'violation': 'FIRE HYDRANT'}
+
+        self.local_open_data_service.load_records(
+            endpoint=OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT,
+            records=[build_record('1', 'ABC1234', '2021-01-01T00:00:00.000Z', '115.00'),
+                     build_record('2', 'ABC1234', '2021-01-01T00:00:00.000Z', '115.00')])
+
+        mocked_submit_query.side_effect = [
+            _build_completed_future([
+                build_record('1', 'ABC1234', '2021-02-03T04:05:06.000Z', '0.00'),
+                build_record('3', 'XYZ9876', '2021-02-01T00:00:00.000Z', '115.00')])]
+
+        with self.assertRaises(ValueError):
+            self.local_open_data_service.sync_open_parking_and_camera_violations()
+
+        self.assertEqual(
+            self.local_open_data_service.sync_open_parking_and_camera_violations(
+                since='2021-01-31T00:00:00.000Z'),
+            (2, 2))
+
+        query_string = mocked_submit_query.call_args.kwargs['query_string']
+        self.assertTrue(query_string.startswith(
+            f'{OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT}?$select=:updated_at,'))
+        self.assertIn(
+            '$where=:updated_at%20>=%20%272021-01-31T00:00:00.000Z%27', query_string)
+
+        self.assertEqual(
+            self.store.get_watermark(dataset=OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT),
+            '2021-02-03T04:05:06.000Z')
+
+        self.assertEqual(
+            self.local_open_data_service.get_vehicle_totals(plate='ABC1234', state='NY'),
+            {'fined': 23000, 'num_violations': 2, 'outstanding': 11500,
+             'paid': 0, 'reduced': 0})
+        self.assertEqual(
+            self.local_open_data_service.get_vehicle_totals(plate='XYZ9876', state='NY'),
+            {'fined': 11500, 'num_violations': 1, 'outstanding': 11500,
+             'paid': 0, 'reduced': 0})
+
+
+        # The next sync starts from the new watermark.
+        mocked_submit_query.side_effect = [_build_completed_future([])]
+
+        self.assertEqual(
+            self.local_open_data_service.sync_open_parking_and_camera_violations(),
+            (0, 0))
+        self.assertIn(
+            '$where=:updated_at%20>=%20%272021-02-03T04:05:06.000Z%27',
+            mocked_submit_query.call_args.kwargs['query_string'])
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_drops_cached_lookups_of_vehicles_synced_elsewhere(
+            self, mocked_submit_query):
+        def build_record(summons_number, plate, updated_at, amount_due):
+            return {':updated_at': updated_at,
+                    'amount_due': amount_due,
+                    'fine_amount': '115.00',
+                    'issue_date': '01/15/2020',
+                    'license_type': 'PAS',
+                    'plate': plate,
+                    'precinct': '1',
+                    'state': 'NY',
+                    'summons_number': summons_number,
+                    'violation': 'FIRE HYDRANT'}
+
+        self.local_open_data_service.load_records(
+            endpoint=OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT,
+            records=[build_record('1', 'ABC1234', '2021-01-01T00:00:00.000Z', '115.00'),
+                     build_record('2', 'XYZ9876', '2021-01-01T00:00:00.000Z', '115.00')])
+
+        # The sync job runs in a process of its own, with its own
+        # connection to the store and no cached lookups.
+        sync_store = LocalOpenDataStore(path=os.path.join(self.temp_dir.name, 'open_data.sqlite3'))
+        self.addCleanup(sync_store.close)
+
+        sync_open_data_service = LocalOpenDataService(local_open_data_store=sync_store)
+
+        plate_lookup_cache = PlateLookupCache(
+            max_size=10, ttl_seconds=3600, max_stale_seconds=0)
+
+        def build_plate_query(plate):
+            return PlateQuery(
+                created_at='Tue Dec 31 19:28:12 -0500 2019',
+                message_source='status',
+                plate=plate,
+                plate_types=None,
+                state='NY')
+
+        with mock.patch(
+                'traffic_violations.services.apis.open_data_service._PLATE_LOOKUP_CACHE',
+                plate_lookup_cache):
+            for plate in ['ABC1234', 'XYZ9876']:
+                self.assertEqual(
+                    self.local_open_data_service.look_up_vehicle(
+                        build_plate_query(plate)).data.fines.outstanding, 115)
+
+            mocked_submit_query.side_effect = [
+                _build_completed_future([
+                    build_record('1', 'ABC1234', '2021-02-03T04:05:06.000Z', '0.00')])]
+
+            with mock.patch(
+                    'traffic_violations.services.apis.open_data_service._PLATE_LOOKUP_CACHE',
+                    None):
+                sync_open_data_service.sync_open_parking_and_camera_violations(
+                    since='2021-01-31T00:00:00.000Z')
+
+            self.assertEqual(plate_lookup_cache.stats()['size'], 2)
+
+            # The changed vehicle is looked up again, the other still cached.
+            self.assertEqual(
+                self.local_open_data_service.look_up_vehicle(
+                    build_plate_query('ABC1234')).data.fines.outstanding, 0)
+            self.local_open_data_service.look_up_vehicle(build_plate_query('XYZ9876'))
+
+            self.assertEqual(plate_lookup_cache.stats()['misses'], 3)
+
+    def test_create_open_data_service_uses_configured_backend(self):
+        with mock.patch.dict(os.environ, {
+                'LOCAL_OPEN_DATA_STORE_PATH': os.path.join(self.temp_dir.name, 'open_data.sqlite3'),
+                'OPEN_DATA_SERVICE_BACKEND': 'local'}), \
+                mock.patch(
+                    'traffic_violations.services.apis.local_open_data_service.'
+                    '_LOCAL_OPEN_DATA_STORE', None):
+            open_data_service = create_open_data_service()
+
+        self.assertIsInstance(open_data_service, LocalOpenDataService)
+        open_data_service.local_open_data_store.close()
+
+        with mock.patch.dict(os.environ, {'OPEN_DATA_SERVICE_BACKEND': 'api'}):
+            open_data_service = create_open_data_service()
+
+        self.assertNotIsInstance(open_data_service, LocalOpenDataService)
+
+        with mock.patch.dict(os.environ, {'OPEN_DATA_SERVICE_BACKEND': 'ftp'}):
+            with self.assertRaises(ValueError):
+                create_open_data_service()
@@ -0,0 +1,150 @@
+import mock
+import os
+import tempfile
+import unittest
+
+from traffic_violations.services.local_open_data_store import \
+    LocalOpenDataStore
+
+
+class TestLocalOpenDataStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'open_data.sqlite3')
+
+        self.store = LocalOpenDataStore(path=self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_load_records_indexes_by_vehicle(self):
+        num_written = self.store.load_records(
+            dataset='dataset',
+            records=[
+                {'plate': 'ABC1234', 'state': 'NY', 'summons_number': '2'},
+                {'plate': 'ABC1234', 'state': 'NJ', 'summons_number': '3'},
+                {'plate': 'ABC1234', 'state': 'NY', 'summons_number': '1'},
+                {'plate': 'XYZ9876', 'state': 'NY', 'summons_number': '4'},
+            ],
+            key_fields=['summons_number'],
+            plate_field='plate',
+            state_field='state')
+
+        self.assertEqual(num_written, 4)
+
+        self.assertEqual(
+            self.store.get_records(dataset='dataset', plate='ABC1234', state='NY'),
+            [{'plate': 'ABC1234', 'state': 'NY', 'summons_number': '2'},
+             {'plate': 'ABC1234', 'state': 'NY', 'summons_number': '1'}])
+
+        self.assertEqual(
+            self.store.get_records(dataset='other_dataset', plate='ABC1234', state='NY'),
+            [])
+
+    def test_load_records_replaces_records_with_the_same_key(self):
+        for amount_due in ['115.00', '0.00']:
+            self.store.load_records(
+                dataset='dataset',
+                records=[{'amount_due': amount_due, 'plate': 'ABC1234',
+                          'state': 'NY', 'summons_number': '1'}],
+                key_fields=['summons_number'],
+                plate_field='plate',
+                state_field='state')
+
+        self.assertEqual(
+            self.store.get_records(dataset='dataset', plate='ABC1234', state='NY'),
+            [{'amount_due': '0.00', 'plate': 'ABC1234',
+              'state': 'NY', 'summons_number': '1'}])
+
+    def test_load_records_skips_records_without_a_key_or_plate(self):
+        num_written = self.store.load_records(
+            dataset='dataset',
+            records=[{'plate': 'ABC1234', 'state': 'NY'},
+                     {'state': 'NY', 'summons_number': '1'}],
+            key_fields=['summons_number'],
+            plate_field='plate',
+            state_field='state')
+
+        self.assertEqual(num_written, 0)
+
+    def test_records_persist_across_connections(self):
+        self.store.load_records(
+            dataset='dataset',
+            records=[{'license_number': '8A23', 'dmv_license_plate_number': '8A23B'}],
+            key_fields=['license_number', 'dmv_license_plate_number'],
+            plate_field='license_number')
+
+        self.store.close()
+        self.store = LocalOpenDataStore(path=self.path)
+
+        self.assertEqual(
+            self.store.get_records(dataset='dataset', plate='8A23', state=''),
+            [{'license_number': '8A23', 'dmv_license_plate_number': '8A23B'}])
+
+    def test_watermarks_and_vehicle_totals(self):
+        self.assertIsNone(self.store.get_watermark(dataset='dataset'))
+        self.assertIsNone(self.store.get_vehicle_totals(
+            dataset='dataset', plate='ABC1234', state='NY'))
+
+        self.store.set_watermark(dataset='dataset', updated_at='2021-02-03T04:05:06.000Z')
+        self.store.set_vehicle_totals(
+            dataset='dataset', totals_by_vehicle={('ABC1234', 'NY'): {'num_violations': 2}})
+
+        self.assertEqual(self.store.get_watermark(dataset='dataset'),
+                         '2021-02-03T04:05:06.000Z')
+        self.assertEqual(
+            self.store.get_vehicle_totals(dataset='dataset', plate='ABC1234', state='NY'),
+            {'num_violations': 2})
+
+    def test_load_records_calls_back_with_each_batch_of_vehicles(self):
+        batches = []
+
+        with mock.patch.object(LocalOpenDataStore, 'LOAD_BATCH_SIZE', 2):
+            self.store.load_records(
+                dataset='dataset',
+                records=[
+                    {'plate': 'ABC1234', 'state': 'NY', 'summons_number': '1'},
+                    {'plate': 'ABC1234', 'state': 'NY', 'summons_number': '2'},
+                    {'plate': 'XYZ9876', 'state': 'NJ', 'summons_number': '3'},
+                ],
+                key_fields=['summons_number'],
+                plate_field='plate',
+                state_field='state',
+                on_batch_written=batches.append)
+
+        self.assertEqual(batches, [{('ABC1234', 'NY')}, {('XYZ9876', 'NJ')}])
+
+    def test_get_new_vehicle_changes_across_connections(self):
+        def load(store, plate, summons_number):
+            store.load_records(
+                dataset='dataset',
+                records=[{'plate': plate, 'state': 'NY', 'summons_number': summons_number}],
+                key_fields=['summons_number'],
+                plate_field='plate',
+                state_field='state')
+
+        # Changes from before a store is opened are none of its business.
+        load(self.store, 'ABC1234', '1')
+
+        reader = LocalOpenDataStore(path=self.path)
+        self.addCleanup(reader.close)
+
+        self.assertEqual(reader.get_new_vehicle_changes(), set())
+
+        load(self.store, 'ABC1234', '2')
+        load(self.store, 'XYZ9876', '3')
+
+        self.assertEqual(reader.get_new_vehicle_changes(),
+                         {('dataset', 'ABC1234', 'NY'), ('dataset', 'XYZ9876', 'NY')})
+        self.assertEqual(reader.get_new_vehicle_changes(), set())
+
+        # A reader that falls behind the logged changes can't tell which
+        # vehicles changed.
+        with mock.patch.object(LocalOpenDataStore, 'MAX_LOGGED_VEHICLE_CHANGES', 1):
+            load(self.store, 'ABC1234', '4')
+            load(self.store, 'XYZ9876', '5')
+
+        self.assertIsNone(reader.get_new_vehicle_changes())
+        self.assertEqual(reader.get_new_vehicle_changes(), set())
@@ -1,7 +1,11 @@
-import requests
+import mock
 import unittest
 
-from traffic_violations.services.apis.location_service import LocationService
+from collections import OrderedDict
+
+from traffic_violations.services.apis.location_service import \
+    LocationService, close_geocoding_session
+from traffic_violations.services.street_gazetteer import StreetGazetteer
 from unittest.mock import MagicMock
 
 class TestLocationService(unittest.TestCase):
@@ -9,6 +13,14 @@ class TestLocationService(unittest.TestCase):
     def setUp(self):
         self.location_service = LocationService()
 
+        # Boroughs found for locations are shared by every LocationService,
+        # so give each test an empty cache of its own.
+        boroughs_by_location_patcher = mock.patch(
+            'traffic_violations.services.apis.location_service._BOROUGHS_BY_LOCATION',
+            new_callable=OrderedDict)
+        boroughs_by_location_patcher.start()
+        self.addCleanup(boroughs_by_location_patcher.stop)
+
     def test_get_borough_from_location_strings(self):
         bronx_comp = {
             'results': [
@@ -44,10 +56,142 @@ class TestLocationService(unittest.TestCase):
         get_mock = MagicMock(name='get')
         get_mock.return_value = req_mock
 
-        requests.get = get_mock
+        self.location_service = LocationService(
+            session=MagicMock(name='session', get=get_mock))
 
         self.assertEqual(self.location_service.get_borough_from_location_strings(['Da', 'Bronx']), 'Bronx')
 
         req_mock.json.return_value = empty_comp
 
         self.assertEqual(self.location_service.get_borough_from_location_strings(['no', 'match']), None)
+
+    def test_location_services_share_a_pooled_session(self):
+        other_location_service = LocationService()
+
+        self.assertIs(self.location_service.session, other_location_service.session)
+
+        adapter = self.location_service.session.get_adapter(
+            LocationService.GEOCODING_SERVICE_ENDPOINT)
+        self.assertGreaterEqual(
+            adapter._pool_maxsize, LocationService.MAX_CONCURRENT_GEOCODING_REQUESTS)
+
+        close_geocoding_session()
+
+        self.assertIsNot(LocationService().session, self.location_service.session)
+
+    @mock.patch.object(LocationService, '_save_new_geocodes')
+    @mock.patch.object(LocationService, '_make_geocoding_request')
+    @mock.patch.object(LocationService, '_get_existing_geocodes')
+    def test_get_boroughs_from_location_strings(self,
+                                                mocked_get_existing_geocodes,
+                                                mocked_make_geocoding_request,
+                                                mocked_save_new_geocodes):
+        mocked_get_existing_geocodes.return_value = {
+            'BROADWAY W 4 ST New York NY': 'Manhattan'}
+
+        def make_geocoding_request(params):
+            if params['address'].startswith('GRAND CONCOURSE'):
+                return [{'address_components': [
+                    {'long_name': 'Bronx', 'types': ['sublocality_level_1']}]}]
+
+            return None
+
+        mocked_make_geocoding_request.side_effect = make_geocoding_request
+
+        locations = [('BROADWAY', 'W 4 ST'),
+                     ('GRAND CONCOURSE', 'E 161 ST'),
+                     ('NOWHERE', ''),
+                     ('BROADWAY', 'W 4 ST')]
+
+        self.assertEqual(
+            self.location_service.get_boroughs_from_location_strings(locations=locations),
+            {('BROADWAY', 'W 4 ST'): 'Manhattan',
+             ('GRAND CONCOURSE', 'E 161 ST'): 'Bronx',
+             ('NOWHERE', ''): None})
+
+        # The unique locations are looked up in one query, and only those
+        # not already known are geocoded and then saved together.
+        mocked_get_existing_geocodes.assert_called_once()
+        self.assertCountEqual(
+            mocked_get_existing_geocodes.call_args.kwargs['query_strings'],
+            ['BROADWAY W 4 ST New York NY',
+             'GRAND CONCOURSE E 161 ST New York NY',
+             'NOWHERE  New York NY'])
+
+        self.assertCountEqual(
+            [call.kwargs['params']['address']
+             for call in mocked_make_geocoding_request.call_args_list],
+            ['GRAND CONCOURSE E 161 ST New York NY', 'NOWHERE  New York NY'])
+
+        mocked_save_new_geocodes.assert_called_once_with(
+            boroughs_by_query_string={'GRAND CONCOURSE E 161 ST New York NY': 'Bronx'})
+
+        # Boroughs that were found are remembered, but locations that
+        # couldn't be geocoded are tried again.
+        mocked_get_existing_geocodes.reset_mock()
+        mocked_get_existing_geocodes.return_value = {}
+        mocked_make_geocoding_request.reset_mock()
+
+        self.assertEqual(
+            self.location_service.get_boroughs_from_location_strings(locations=locations),
+            {('BROADWAY', 'W 4 ST'): 'Manhattan',
+             ('GRAND CONCOURSE', 'E 161 ST'): 'Bronx',
+             ('NOWHERE', ''): None})
+
+        mocked_get_existing_geocodes.assert_called_once_with(
+            query_strings=['NOWHERE  New York NY'])
+        mocked_make_geocoding_request.assert_called_once()
+
+    @mock.patch.object(LocationService, 'MAX_CACHED_LOCATIONS', 1)
+    @mock.patch.object(LocationService, '_get_existing_geocodes')
+    def test_get_boroughs_from_location_strings_evicts_least_recently_used(
+            self, mocked_get_existing_geocodes):
+        mocked_get_existing_geocodes.return_value = {
+            'BROADWAY W 4 ST New York NY': 'Manhattan',
+            'GRAND CONCOURSE E 161 ST New York NY': 'Bronx'}
+
+        for location in [('BROADWAY', 'W 4 ST'), ('GRAND CONCOURSE', 'E 161 ST')]:
+            self.location_service.get_borough_from_location_strings(list(location))
+
+        self.assertEqual(mocked_get_existing_geocodes.call_count, 2)
+
+        self.assertEqual(
+            self.location_service.get_borough_from_location_strings(
+                ['GRAND CONCOURSE', 'E 161 ST']), 'Bronx')
+        self.assertEqual(mocked_get_existing_geocodes.call_count, 2)
+
+        self.assertEqual(
+            self.location_service.get_borough_from_location_strings(
+                ['BROADWAY', 'W 4 ST']), 'Manhattan')
+        self.assertEqual(mocked_get_existing_geocodes.call_count, 3)
+
+    @mock.patch('traffic_violations.services.apis.location_service.get_street_gazetteer')
+    @mock.patch.object(LocationService, '_make_geocoding_request')
+    @mock.patch.object(LocationService, '_get_existing_geocodes')
+    def test_get_boroughs_from_location_strings_with_street_gazetteer(
+            self,
+            mocked_get_existing_geocodes,
+            mocked_make_geocoding_request,
+            mocked_get_street_gazetteer):
+        street_gazetteer = StreetGazetteer()
+        for street, borough in [('GRAND CONCOURSE', 'Bronx'),
+                                ('BROADWAY', 'Manhattan'),
+                                ('BROADWAY', 'Brooklyn')]:
+            street_gazetteer.add(
+                street=street, borough=borough, count=StreetGazetteer.MIN_SIGHTINGS)
+
+        mocked_get_street_gazetteer.return_value = street_gazetteer
+        mocked_get_existing_geocodes.return_value = {}
+        mocked_make_geocoding_request.return_value = None
+
+        self.assertEqual(
+            self.location_service.get_boroughs_from_location_strings(
+                locations=[('GRAND CONCOURSE', 'E 161 ST'), ('BROADWAY', '')]),
+            {('GRAND CONCOURSE', 'E 161 ST'): 'Bronx',
+             ('BROADWAY', ''): None})
+
+        # only the location the gazetteer couldn't place is geocoded.
+        self.assertEqual(
+            [call.kwargs['params']['address']
+             for call in mocked_make_geocoding_request.call_args_list],
+            ['BROADWAY  New York NY'])
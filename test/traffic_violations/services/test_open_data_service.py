@@ -1,18 +1,28 @@
 import copy
 import ddt
+import json
 import math
 import mock
+import os
 import random
+import requests
+import tempfile
+import threading
 import unittest
 
 from collections import Counter
+from concurrent.futures import Future
 from datetime import datetime, timedelta
+from unittest.mock import MagicMock
 
 from traffic_violations.constants import regexps as regexp_constants
 from traffic_violations.constants.borough_codes import BOROUGH_CODES
 from traffic_violations.constants.open_data.endpoints import \
-    FISCAL_YEAR_DATABASE_ENDPOINTS, MEDALLION_ENDPOINT, \
+    CLOSED_FISCAL_YEARS, FISCAL_YEAR_DATABASE_ENDPOINTS, MEDALLION_ENDPOINT, \
     OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT
+from traffic_violations.constants.open_data.needed_fields import \
+    FISCAL_YEAR_DATABASE_SELECTED_FIELDS, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS
 from traffic_violations.constants.open_data.violations import \
     HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS, \
     HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS
@@ -25,8 +35,172 @@ from traffic_violations.models.response.open_data_service_plate_lookup \
     import OpenDataServicePlateLookup
 from traffic_violations.models.response.open_data_service_response \
     import OpenDataServiceResponse
+from traffic_violations.models.summons import Summons
 
-from traffic_violations.services.apis.open_data_service import OpenDataService
+from traffic_violations.services.apis.open_data_service import \
+    OpenDataService, close_open_data_session
+from traffic_violations.services.fiscal_year_database_cache import \
+    FiscalYearDatabaseCache
+from traffic_violations.services.open_data_throttle import OpenDataThrottle
+from traffic_violations.services.plate_lookup_cache import PlateLookupCache
+
+
+def _build_response_body(data):
+    """Return an iter_content for a response with data as its JSON body."""
+    body = json.dumps(data, default=str).encode('utf-8')
+
+    def iter_content(chunk_size=1):
+        for start in range(0, len(body), chunk_size):
+            yield body[start:start + chunk_size]
+
+    return iter_content
+
+
+def _build_completed_future(data, status_code=200) -> Future:
+    response = MagicMock(name='response')
+    response.iter_content.side_effect = _build_response_body(data)
+    response.status_code = status_code
+
+    future = Future()
+    future.set_result(response)
+
+    return future
+
+
+def _build_violation_fixtures(plate, plate_type, state):
+    """Build random raw records for a vehicle as the portal would return
+    them, as (Open Parking and Camera Violations records, list of records
+    for each fiscal year database).
+    """
+    all_borough_codes = [code for borough_list in list(
+        BOROUGH_CODES.values()) for code in borough_list]
+    all_precincts = [precinct for sublist in list(
+        PRECINCTS_BY_BOROUGH.values()) for precinct in sublist]
+
+    summons_numbers = set()
+
+    fiscal_year_databases_violations = []
+    for year, _ in FISCAL_YEAR_DATABASE_ENDPOINTS.items():
+        fy_violations = []
+        for _ in range(random.randint(10, 20)):
+            date = datetime(
+                year,
+                random.randint(1, 12),
+                random.randint(1, 28))
+
+            random_borough_code_index = random.randint(
+                0, len(all_borough_codes) - 1)
+            random_precinct_index = random.randint(
+                0, len(all_precincts) - 1)
+            random_violation_string_index = random.randint(
+                0, len(HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.keys())-1)
+
+            summons_number = random.randint(
+                1000000000,
+                9999999999)
+            while summons_number in summons_numbers:
+                summons_number = random.randint(
+                    1000000000,
+                    9999999999)
+
+            summons_numbers.add(summons_number)
+
+            fy_violations.append({
+                'date_first_observed': date.strftime('%Y-%m-%dT%H:%M:%S.%f'),
+                'feet_from_curb': '0 ft',
+                'from_hours_in_effect': '0800',
+                'house_number': '123',
+                'intersecting_street': '',
+                'issue_date': date.strftime('%Y-%m-%dT%H:%M:%S.%f'),
+                'issuer_code': '43',
+                'issuer_command': 'C',
+                'issuer_precinct': all_precincts[random_precinct_index],
+                'issuing_agency': 'TRAFFIC',
+                'law_section': '123 ABC',
+                'plate_id': plate,
+                'plate_type': plate_type,
+                'registration_state': state,
+                'street_code1': '123',
+                'street_code2': '456',
+                'street_code3': '789',
+                'street_name': 'Fake Street',
+                'sub_division': '23',
+                'summons_image': '',
+                'summons_number': summons_number,
+                'to_hours_in_effect': '2200',
+                'vehicle_body_type': 'SUV',
+                'vehicle_color': 'BLACK',
+                'vehicle_expiration_date': date + timedelta(days=180),
+                'vehicle_make': 'FORD',
+                'vehicle_year': '2017',
+                'violation_code': list(HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.keys())[random_violation_string_index],
+                'violation_county': all_borough_codes[random_borough_code_index],
+                'violation_in_front_of_or_opposite': '',
+                'violation_legal_code': '4-08',
+                'violation_location': '',
+                'violation_post_code': '12345',
+                'violation_precinct': all_precincts[random_precinct_index]})
+
+        fiscal_year_databases_violations.append(fy_violations)
+
+    open_parking_and_camera_violations = []
+    for _ in range(random.randint(10, 20)):
+        fine_amount = random.randint(10, 200)
+        interest_amount = round(float(random.randint(
+            0, math.floor(fine_amount/2)) + random.random()), 2)
+        penalty_amount = round(float(random.randint(
+            0, math.floor(fine_amount/2)) + random.random()), 2)
+        reduction_amount = round(float(random.randint(
+            0, math.floor(fine_amount/2)) + random.random()), 2)
+
+        payment_amount = round(float(random.randint(0, math.floor(
+            fine_amount + interest_amount + penalty_amount - reduction_amount))), 2)
+        amount_due = fine_amount + interest_amount + \
+            penalty_amount - reduction_amount - payment_amount
+
+        date = datetime(
+            random.randint(1999, 2020),
+            random.randint(1, 12),
+            random.randint(1, 28))
+
+        random_borough_code_index = random.randint(
+            0, len(all_borough_codes) - 1)
+        random_precinct_index = random.randint(
+            0, len(all_precincts) - 1)
+        random_violation_string_index = random.randint(
+            0, len(HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS.keys())-1)
+
+        summons_number = random.randint(1000000000, 9999999999)
+        summons_numbers.add(summons_number)
+
+        open_parking_and_camera_violations.append({
+            'amount_due': amount_due,
+            'county': all_borough_codes[random_borough_code_index],
+            'fine_amount': fine_amount,
+            'interest_amount': interest_amount,
+            'issue_date': date.strftime('%m/%d/%Y'),
+            'issuing_agency': 'TRAFFIC',
+            'license_type': plate_type,
+            'payment_amount': payment_amount,
+            'penalty_amount': penalty_amount,
+            'plate': plate,
+            'precinct': all_precincts[random_precinct_index],
+            'reduction_amount': reduction_amount,
+            'state': state,
+            'summons': (f'http://nycserv.nyc.gov/NYCServWeb/'
+                        f'ShowImage?searchID=VDBSVmQwNVVaekZ'
+                        f'OZWxreFQxRTlQUT09&locationName='
+                        f'_____________________'),
+            'summons_image_description': 'View Summons',
+            'summons_number': summons_number,
+            'violation': list(
+                HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS.keys())[
+                    random_violation_string_index],
+            'violation_status': 'HEARING HELD-GUILTY',
+            'violation_time': f'0{random.randint(1,9)}:{random.randint(10,59)}P'
+        })
+
+    return open_parking_and_camera_violations, fiscal_year_databases_violations
 
 
 @ddt.ddt
@@ -35,6 +209,107 @@ class TestOpenDataService(unittest.TestCase):
     def setUp(self):
         self.open_data_service = OpenDataService()
 
+    def test_build_query_strings_select_only_needed_fields(self):
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types='COM,PAS',
+            state='NY')
+
+        fiscal_year_endpoint = FISCAL_YEAR_DATABASE_ENDPOINTS[2020]
+
+        self.assertEqual(
+            self.open_data_service._build_fiscal_year_database_query_string(
+                endpoint=fiscal_year_endpoint, plate_query=plate_query),
+            (f'{fiscal_year_endpoint}?'
+             f"$select={','.join(FISCAL_YEAR_DATABASE_SELECTED_FIELDS)}&"
+             f'plate_id=ABC1234&registration_state=NY&'
+             f'$where=plate_type%20in(%27COM%27,%27PAS%27)'))
+
+        self.assertEqual(
+            self.open_data_service._build_open_parking_and_camera_violations_query_string(
+                plate_query=plate_query),
+            (f'{OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT}?'
+             f"$select={','.join(OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS)}&"
+             f'plate=ABC1234&state=NY&'
+             f'$where=license_type%20in(%27COM%27,%27PAS%27)'))
+
+    def test_build_query_strings_with_time_range(self):
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types='PAS',
+            state='NY')
+
+        fiscal_year_endpoint = FISCAL_YEAR_DATABASE_ENDPOINTS[2020]
+
+        since = datetime(2019, 11, 3, 14, 30)
+        until = datetime(2021, 2, 1)
+
+        self.assertEqual(
+            self.open_data_service._build_fiscal_year_database_query_string(
+                endpoint=fiscal_year_endpoint,
+                plate_query=plate_query,
+                since=since,
+                until=until),
+            (f'{fiscal_year_endpoint}?'
+             f"$select={','.join(FISCAL_YEAR_DATABASE_SELECTED_FIELDS)}&"
+             f'plate_id=ABC1234&registration_state=NY&'
+             f'$where=plate_type%20in(%27PAS%27)%20and%20'
+             f'issue_date%20>=%20%272019-11-03T14:30:00%27%20and%20'
+             f'issue_date%20<=%20%272021-02-01T00:00:00%27'))
+
+        self.assertEqual(
+            self.open_data_service._build_open_parking_and_camera_violations_query_string(
+                plate_query=plate_query,
+                since=since,
+                until=until),
+            (f'{OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT}?'
+             f"$select={','.join(OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS)}&"
+             f'plate=ABC1234&state=NY&'
+             f'$where=license_type%20in(%27PAS%27)%20and%20('
+             f'issue_date%20LIKE%20%27__/__/2019%27%20or%20'
+             f'issue_date%20LIKE%20%27__/__/2020%27%20or%20'
+             f'issue_date%20LIKE%20%27__/__/2021%27)'))
+
+        # Without both bounds, the years can't be enumerated.
+        self.assertNotIn(
+            'LIKE',
+            self.open_data_service._build_open_parking_and_camera_violations_query_string(
+                plate_query=plate_query,
+                until=until))
+
+    @ddt.data(
+        {'expected': True, 'since': None, 'until': None, 'year': 2016},
+        {'expected': True, 'since': datetime(2015, 6, 30), 'until': None, 'year': 2016},
+        {'expected': False, 'since': datetime(2016, 7, 1), 'until': None, 'year': 2016},
+        {'expected': True, 'since': None, 'until': datetime(2015, 7, 1), 'year': 2016},
+        {'expected': False, 'since': None, 'until': datetime(2015, 6, 30, 23, 59), 'year': 2016},
+        {'expected': True, 'since': datetime(2016, 1, 1), 'until': datetime(2016, 2, 1), 'year': 2016},
+        {'expected': False, 'since': datetime(2017, 1, 1), 'until': datetime(2017, 2, 1), 'year': 2016},
+    )
+    @ddt.unpack
+    def test_fiscal_year_overlaps_time_range(self, expected, since, until, year):
+        self.assertEqual(
+            self.open_data_service._fiscal_year_overlaps_time_range(
+                year=year, since=since, until=until),
+            expected)
+
+    def test_open_data_services_share_a_pooled_session(self):
+        other_open_data_service = OpenDataService()
+
+        self.assertIs(self.open_data_service.api, other_open_data_service.api)
+
+        adapter = self.open_data_service.api.get_adapter('https://data.cityofnewyork.us')
+        self.assertGreaterEqual(
+            adapter._pool_maxsize, OpenDataService.MAX_CONCURRENT_QUERIES)
+
+        close_open_data_session()
+
+        self.assertIsNot(OpenDataService().api, self.open_data_service.api)
+
     def test_find_max_camera_streak(self):
         list_of_camera_times = [
             datetime(2015, 9, 18, 0, 0),
@@ -71,6 +346,29 @@ class TestOpenDataService(unittest.TestCase):
         self.assertEqual(self.open_data_service._find_max_camera_violations_streak(
             list_of_camera_times), result)
 
+    def test_find_max_camera_streak_with_window(self):
+        list_of_camera_times = [
+            datetime(2016, 1, 1, 0, 0),
+            datetime(2016, 1, 20, 0, 0),
+            datetime(2016, 3, 1, 0, 0),
+            datetime(2016, 3, 1, 0, 0),
+            datetime(2016, 3, 15, 0, 0),
+            datetime(2016, 3, 30, 0, 0),
+            datetime(2016, 4, 2, 0, 0),
+        ]
+
+        result = CameraStreakData(
+            min_streak_date='March 1, 2016',
+            max_streak=4,
+            max_streak_date='March 30, 2016')
+
+        self.assertEqual(self.open_data_service._find_max_camera_violations_streak(
+            list_of_camera_times, window=timedelta(days=30)), result)
+
+    def test_find_max_camera_streak_with_no_violations(self):
+        self.assertIsNone(
+            self.open_data_service._find_max_camera_violations_streak([]))
+
     @ddt.data(
         {
             'plate': 'ABC1234'
@@ -86,9 +384,9 @@ class TestOpenDataService(unittest.TestCase):
     @ddt.unpack
     @mock.patch(
         f'traffic_violations.services.apis.open_data_service.'
-        f'OpenDataService._perform_query')
+        f'OpenDataService._submit_query')
     def test_look_up_vehicle_with_violations(self,
-                                            mocked_perform_query,
+                                            mocked_submit_query,
                                             plate,
                                             state=None,
                                             medallion_query_result=None):
@@ -103,146 +401,21 @@ class TestOpenDataService(unittest.TestCase):
         plate_type = regexp_constants.PLATE_TYPES[random_plate_type_index]
         state = state if state else regexp_constants.STATE_ABBREVIATIONS[random_state_index]
 
-        all_borough_codes = [code for borough_list in list(
-            BOROUGH_CODES.values()) for code in borough_list]
-        all_precincts = [precinct for sublist in list(
-            PRECINCTS_BY_BOROUGH.values()) for precinct in sublist]
-
-        summons_numbers = set()
-
-        fiscal_year_databases_violations = []
-        for year, _ in FISCAL_YEAR_DATABASE_ENDPOINTS.items():
-            fy_violations = []
-            for _ in range(random.randint(10, 20)):
-                date = datetime(
-                    year,
-                    random.randint(1, 12),
-                    random.randint(1, 28))
-
-                random_borough_code_index = random.randint(
-                    0, len(all_borough_codes) - 1)
-                random_precinct_index = random.randint(
-                    0, len(all_precincts) - 1)
-                random_violation_string_index = random.randint(
-                    0, len(HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.keys())-1)
-
-                summons_number = random.randint(
-                    1000000000,
-                    9999999999)
-                while summons_number in summons_numbers:
-                    summons_number = random.randint(
-                        1000000000,
-                        9999999999)
-
-                summons_numbers.add(summons_number)
-
-                fy_violations.append({
-                    'date_first_observed': date.strftime('%Y-%m-%dT%H:%M:%S.%f'),
-                    'feet_from_curb': '0 ft',
-                    'from_hours_in_effect': '0800',
-                    'house_number': '123',
-                    'intersecting_street': '',
-                    'issue_date': date.strftime('%Y-%m-%dT%H:%M:%S.%f'),
-                    'issuer_code': '43',
-                    'issuer_command': 'C',
-                    'issuer_precinct': all_precincts[random_precinct_index],
-                    'issuing_agency': 'TRAFFIC',
-                    'law_section': '123 ABC',
-                    'plate_id': plate,
-                    'plate_type': plate_type,
-                    'registration_state': state,
-                    'street_code1': '123',
-                    'street_code2': '456',
-                    'street_code3': '789',
-                    'street_name': 'Fake Street',
-                    'sub_division': '23',
-                    'summons_image': '',
-                    'summons_number': summons_number,
-                    'to_hours_in_effect': '2200',
-                    'vehicle_body_type': 'SUV',
-                    'vehicle_color': 'BLACK',
-                    'vehicle_expiration_date': date + timedelta(days=180),
-                    'vehicle_make': 'FORD',
-                    'vehicle_year': '2017',
-                    'violation_code': list(HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.keys())[random_violation_string_index],
-                    'violation_county': all_borough_codes[random_borough_code_index],
-                    'violation_in_front_of_or_opposite': '',
-                    'violation_legal_code': '4-08',
-                    'violation_location': '',
-                    'violation_post_code': '12345',
-                    'violation_precinct': all_precincts[random_precinct_index]})
-
-            fiscal_year_databases_violations.append(fy_violations)
-
-        open_parking_and_camera_violations = []
-        for _ in range(random.randint(10, 20)):
-            fine_amount = random.randint(10, 200)
-            interest_amount = round(float(random.randint(
-                0, math.floor(fine_amount/2)) + random.random()), 2)
-            penalty_amount = round(float(random.randint(
-                0, math.floor(fine_amount/2)) + random.random()), 2)
-            reduction_amount = round(float(random.randint(
-                0, math.floor(fine_amount/2)) + random.random()), 2)
-
-            payment_amount = round(float(random.randint(0, math.floor(
-                fine_amount + interest_amount + penalty_amount - reduction_amount))), 2)
-            amount_due = fine_amount + interest_amount + \
-                penalty_amount - reduction_amount - payment_amount
-
-            date = datetime(
-                random.randint(1999, 2020),
-                random.randint(1, 12),
-                random.randint(1, 28))
-
-            random_borough_code_index = random.randint(
-                0, len(all_borough_codes) - 1)
-            random_precinct_index = random.randint(
-                0, len(all_precincts) - 1)
-            random_violation_string_index = random.randint(
-                0, len(HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS.keys())-1)
-
-            summons_number = random.randint(1000000000, 9999999999)
-            summons_numbers.add(summons_number)
-
-            open_parking_and_camera_violations.append({
-                'amount_due': amount_due,
-                'county': all_borough_codes[random_borough_code_index],
-                'fine_amount': fine_amount,
-                'interest_amount': interest_amount,
-                'issue_date': date.strftime('%m/%d/%Y'),
-                'issuing_agency': 'TRAFFIC',
-                'license_type': plate_type,
-                'payment_amount': payment_amount,
-                'penalty_amount': penalty_amount,
-                'plate': plate,
-                'precinct': all_precincts[random_precinct_index],
-                'reduction_amount': reduction_amount,
-                'state': state,
-                'summons': (f'http://nycserv.nyc.gov/NYCServWeb/'
-                            f'ShowImage?searchID=VDBSVmQwNVVaekZ'
-                            f'OZWxreFQxRTlQUT09&locationName='
-                            f'_____________________'),
-                'summons_image_description': 'View Summons',
-                'summons_number': summons_number,
-                'violation': list(
-                    HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS.keys())[
-                        random_violation_string_index],
-                'violation_status': 'HEARING HELD-GUILTY',
-                'violation_time': f'0{random.randint(1,9)}:{random.randint(10,59)}P'
-            })
+        open_parking_and_camera_violations, fiscal_year_databases_violations = \
+            _build_violation_fixtures(plate=plate, plate_type=plate_type, state=state)
 
         side_effects = []
 
         if medallion_query_result:
-            side_effects.append({'data': medallion_query_result})
+            side_effects.append(_build_completed_future(medallion_query_result))
 
-        side_effects.append({'data': copy.deepcopy(
-            open_parking_and_camera_violations)})
+        side_effects.append(_build_completed_future(copy.deepcopy(
+            open_parking_and_camera_violations)))
 
         for violations_list in fiscal_year_databases_violations:
-            side_effects.append({'data': copy.deepcopy(violations_list)})
+            side_effects.append(_build_completed_future(copy.deepcopy(violations_list)))
 
-        mocked_perform_query.side_effect = side_effects
+        mocked_submit_query.side_effect = side_effects
 
         open_parking_and_camera_violations_dict = {}
         for summons in open_parking_and_camera_violations:
@@ -388,15 +561,16 @@ class TestOpenDataService(unittest.TestCase):
 
     @mock.patch(
         f'traffic_violations.services.apis.open_data_service.'
-        f'OpenDataService._perform_query')
+        f'OpenDataService._submit_query')
     def test_look_up_vehicle_with_no_violations(self,
-                                            mocked_perform_query):
+                                            mocked_submit_query):
 
         plate = 'ABC1234'
         plate_types = 'PAS'
         state = 'NY'
 
-        mocked_perform_query.side_effects = [{'data': {}} for _ in range(0, 8)]
+        mocked_submit_query.side_effect = [
+            _build_completed_future([]) for _ in range(len(FISCAL_YEAR_DATABASE_ENDPOINTS) + 1)]
 
         plate_query = PlateQuery(
             created_at='Tue Dec 31 19:28:12 -0500 2019',
@@ -427,3 +601,695 @@ class TestOpenDataService(unittest.TestCase):
 
         self.assertEqual(self.open_data_service.look_up_vehicle(plate_query),
                          result)
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_submits_all_queries_before_reading_any(self,
+                                                                   mocked_submit_query):
+        num_queries = len(FISCAL_YEAR_DATABASE_ENDPOINTS) + 1
+        submitted_before_read = []
+
+        class RecordingFuture(Future):
+            def result(self, timeout=None):
+                submitted_before_read.append(mocked_submit_query.call_count)
+                return super().result(timeout=timeout)
+
+        def submit_query(query_string):
+            future = RecordingFuture()
+            future.set_result(_build_completed_future([]).result())
+            return future
+
+        mocked_submit_query.side_effect = submit_query
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_id=random.randint(
+                1000000000000000000,
+                2000000000000000000),
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY',
+            username='@bdhowald')
+
+        response = self.open_data_service.look_up_vehicle(plate_query)
+
+        self.assertTrue(response.success)
+        self.assertEqual(mocked_submit_query.call_count, num_queries)
+        self.assertEqual(submitted_before_read, [num_queries] * num_queries)
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_with_failed_query(self,
+                                              mocked_submit_query):
+        num_queries = len(FISCAL_YEAR_DATABASE_ENDPOINTS) + 1
+
+        mocked_submit_query.side_effect = [
+            _build_completed_future([], status_code=(503 if i == 3 else 200))
+            for i in range(num_queries)]
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_id=random.randint(
+                1000000000000000000,
+                2000000000000000000),
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY',
+            username='@bdhowald')
+
+        response = self.open_data_service.look_up_vehicle(plate_query)
+
+        self.assertFalse(response.success)
+        self.assertRegex(str(response.message), 'server error when accessing')
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_with_truncated_response(self,
+                                                     mocked_submit_query):
+        truncated_future = _build_completed_future([])
+        truncated_future.result().iter_content.side_effect = \
+            lambda chunk_size: iter([b'[{"summons_number": "1234567890", "pla'])
+
+        mocked_submit_query.side_effect = [truncated_future] + [
+            _build_completed_future([])
+            for _ in FISCAL_YEAR_DATABASE_ENDPOINTS]
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY')
+
+        response = self.open_data_service.look_up_vehicle(plate_query)
+
+        self.assertFalse(response.success)
+        self.assertRegex(str(response.message), 'invalid response when accessing')
+        truncated_future.result().close.assert_called()
+
+    def test_look_up_vehicle_fails_when_queries_time_out(self):
+        def time_out(url, stream, timeout):
+            self.assertEqual(timeout, OpenDataService.QUERY_TIMEOUT_SECONDS)
+
+            future = Future()
+            future.set_exception(requests.exceptions.ReadTimeout('read timed out'))
+            return future
+
+        session = MagicMock(name='session')
+        session.get.side_effect = time_out
+
+        throttle = OpenDataThrottle(
+            requests_per_second=100,
+            burst=100,
+            max_concurrent_requests=OpenDataService.MAX_CONCURRENT_QUERIES,
+            failure_threshold=100,
+            reset_seconds=30)
+
+        open_data_service = OpenDataService(session=session, throttle=throttle)
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY')
+
+        response = open_data_service.look_up_vehicle(plate_query, use_cache=False)
+
+        self.assertFalse(response.success)
+        self.assertRegex(str(response.message), 'timed out when accessing')
+
+        # The queries that timed out gave back their request slots.
+        self.assertEqual(throttle.concurrency_limiter._in_flight, 0)
+
+    def test_look_up_vehicle_fails_fast_while_circuit_breaker_is_open(self):
+        session = MagicMock(name='session')
+        session.get.side_effect = lambda url, stream, timeout: _build_completed_future(
+            [], status_code=503)
+
+        throttle = OpenDataThrottle(
+            requests_per_second=100,
+            burst=100,
+            max_concurrent_requests=OpenDataService.MAX_CONCURRENT_QUERIES,
+            failure_threshold=1,
+            reset_seconds=30)
+
+        open_data_service = OpenDataService(session=session, throttle=throttle)
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY')
+
+        response = open_data_service.look_up_vehicle(plate_query, use_cache=False)
+
+        self.assertFalse(response.success)
+        self.assertRegex(str(response.message), 'server error when accessing')
+        self.assertEqual(session.get.call_count, OpenDataService.MAX_CONCURRENT_QUERIES)
+
+        response = open_data_service.look_up_vehicle(plate_query, use_cache=False)
+
+        self.assertFalse(response.success)
+        self.assertRegex(str(response.message), 'circuit breaker open for')
+        self.assertEqual(session.get.call_count, OpenDataService.MAX_CONCURRENT_QUERIES)
+
+        # Every query gave back its slot.
+        self.assertEqual(throttle.concurrency_limiter._in_flight, 0)
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_requests_pages_past_max_results(self,
+                                                            mocked_submit_query):
+        def build_summons(summons_number):
+            return {
+                'issue_date': '01/15/2020',
+                'precinct': '1',
+                'summons_number': summons_number,
+                'violation': 'FIRE HYDRANT'}
+
+        opacv_pages = {
+            '0': [build_summons(1), build_summons(2)],
+            '2': [build_summons(3), build_summons(4)],
+            '4': [build_summons(5)],
+        }
+
+        def submit_query(query_string):
+            offset = query_string.split('$offset=')[-1]
+
+            if query_string.startswith(OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT):
+                return _build_completed_future(opacv_pages[offset])
+
+            return _build_completed_future([])
+
+        mocked_submit_query.side_effect = submit_query
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_id=random.randint(
+                1000000000000000000,
+                2000000000000000000),
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY',
+            username='@bdhowald')
+
+        with mock.patch.object(OpenDataService, 'MAX_RESULTS', 2):
+            response = self.open_data_service.look_up_vehicle(plate_query)
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.data.num_violations, 5)
+        self.assertEqual(
+            mocked_submit_query.call_count,
+            len(FISCAL_YEAR_DATABASE_ENDPOINTS) + len(opacv_pages))
+
+        for query_call in mocked_submit_query.call_args_list:
+            self.assertIn('$order=:id', query_call.kwargs['query_string'])
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_uses_cache_for_closed_fiscal_years(self,
+                                                               mocked_submit_query):
+        def submit_query(query_string):
+            if query_string.startswith(FISCAL_YEAR_DATABASE_ENDPOINTS[2016]):
+                return _build_completed_future([{
+                    'issue_date': '2016-01-15T00:00:00.000',
+                    'summons_number': '1234567890',
+                    'violation_code': '40',
+                    'violation_precinct': '1'}])
+
+            return _build_completed_future([])
+
+        mocked_submit_query.side_effect = submit_query
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_id=random.randint(
+                1000000000000000000,
+                2000000000000000000),
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY',
+            username='@bdhowald')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FiscalYearDatabaseCache(
+                path=os.path.join(temp_dir, 'cache.sqlite3'))
+
+            open_data_service = OpenDataService(
+                fiscal_year_database_cache=cache)
+
+            first_response = open_data_service.look_up_vehicle(plate_query)
+
+            self.assertEqual(
+                mocked_submit_query.call_count,
+                len(FISCAL_YEAR_DATABASE_ENDPOINTS) + 1)
+
+            mocked_submit_query.reset_mock()
+
+            second_response = open_data_service.look_up_vehicle(plate_query)
+
+            cache.close()
+
+        open_fiscal_year_endpoints = [
+            endpoint for year, endpoint in FISCAL_YEAR_DATABASE_ENDPOINTS.items()
+            if year not in CLOSED_FISCAL_YEARS]
+
+        queried_endpoints = sorted(
+            query_call.kwargs['query_string'].split('?')[0]
+            for query_call in mocked_submit_query.call_args_list)
+
+        self.assertEqual(
+            queried_endpoints,
+            sorted([OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT] + open_fiscal_year_endpoints))
+
+        self.assertEqual(first_response.data.num_violations, 1)
+        self.assertEqual(first_response, second_response)
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_does_not_cache_unresolved_boroughs(self,
+                                                                mocked_submit_query):
+        def submit_query(query_string):
+            if query_string.startswith(FISCAL_YEAR_DATABASE_ENDPOINTS[2016]):
+                return _build_completed_future([{
+                    'intersecting_street': 'W 4 ST',
+                    'issue_date': '2016-01-15T00:00:00.000',
+                    'street_name': 'BROADWAY',
+                    'summons_number': '1234567890',
+                    'violation_code': '40',
+                    'violation_precinct': '999'}])
+
+            return _build_completed_future([])
+
+        mocked_submit_query.side_effect = submit_query
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FiscalYearDatabaseCache(
+                path=os.path.join(temp_dir, 'cache.sqlite3'))
+
+            open_data_service = OpenDataService(
+                fiscal_year_database_cache=cache)
+
+            with mock.patch.object(
+                    open_data_service.location_service,
+                    'get_boroughs_from_location_strings') as mocked_get_boroughs:
+                # Geocoding fails at first, so the records aren't cached...
+                mocked_get_boroughs.return_value = {('BROADWAY', 'W 4 ST'): None}
+
+                open_data_service.look_up_vehicle(plate_query, use_cache=False)
+
+                self.assertIsNone(cache.get(
+                    endpoint=FISCAL_YEAR_DATABASE_ENDPOINTS[2016], plate_query=plate_query))
+
+                # ...until it finds the borough.
+                mocked_get_boroughs.return_value = {('BROADWAY', 'W 4 ST'): 'Manhattan'}
+
+                open_data_service.look_up_vehicle(plate_query, use_cache=False)
+
+                cached_records = cache.get(
+                    endpoint=FISCAL_YEAR_DATABASE_ENDPOINTS[2016], plate_query=plate_query)
+
+            cache.close()
+
+        self.assertEqual([record['borough'] for record in cached_records], ['manhattan'])
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicle_with_time_range_skips_fiscal_years_outside_it(
+            self, mocked_submit_query):
+        mocked_submit_query.side_effect = lambda query_string: _build_completed_future([])
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_id=random.randint(
+                1000000000000000000,
+                2000000000000000000),
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY',
+            username='@bdhowald')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FiscalYearDatabaseCache(
+                path=os.path.join(temp_dir, 'cache.sqlite3'))
+
+            open_data_service = OpenDataService(
+                fiscal_year_database_cache=cache)
+
+            response = open_data_service.look_up_vehicle(
+                plate_query=plate_query,
+                since=datetime(2017, 3, 1),
+                until=datetime(2018, 3, 1))
+
+            # Range-limited results must not be cached as a full history.
+            cached_records = [
+                cache.get(endpoint=endpoint, plate_query=plate_query)
+                for endpoint in FISCAL_YEAR_DATABASE_ENDPOINTS.values()]
+
+            cache.close()
+
+        self.assertTrue(response.success)
+        self.assertEqual(
+            cached_records, [None] * len(FISCAL_YEAR_DATABASE_ENDPOINTS))
+
+        queried_endpoints = sorted(
+            query_call.kwargs['query_string'].split('?')[0]
+            for query_call in mocked_submit_query.call_args_list)
+
+        self.assertEqual(
+            queried_endpoints,
+            sorted([OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT,
+                    FISCAL_YEAR_DATABASE_ENDPOINTS[2017],
+                    FISCAL_YEAR_DATABASE_ENDPOINTS[2018]]))
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicles_batches_plates_into_shared_queries(self,
+                                                              mocked_submit_query):
+        plate_queries = [
+            PlateQuery(created_at='Tue Dec 31 19:28:12 -0500 2019',
+                       message_source='status',
+                       plate='ABC1234',
+                       plate_types=None,
+                       state='NY'),
+            PlateQuery(created_at='Tue Dec 31 19:28:12 -0500 2019',
+                       message_source='status',
+                       plate='XYZ9876',
+                       plate_types='COM',
+                       state='NJ'),
+            PlateQuery(created_at='Tue Dec 31 19:28:12 -0500 2019',
+                       message_source='status',
+                       plate='DEF5555',
+                       plate_types=None,
+                       state='NY')]
+
+        def submit_query(query_string):
+            if query_string.startswith(OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT):
+                return _build_completed_future([
+                    {'issue_date': '01/15/2020', 'license_type': 'PAS',
+                     'plate': 'ABC1234', 'precinct': '1', 'state': 'NY',
+                     'summons_number': '1', 'violation': 'FIRE HYDRANT'},
+                    {'issue_date': '01/16/2020', 'license_type': 'COM',
+                     'plate': 'XYZ9876', 'precinct': '1', 'state': 'NJ',
+                     'summons_number': '2', 'violation': 'FIRE HYDRANT'},
+                    {'issue_date': '01/17/2020', 'license_type': 'PAS',
+                     'plate': 'XYZ9876', 'precinct': '1', 'state': 'NJ',
+                     'summons_number': '3', 'violation': 'FIRE HYDRANT'},
+                    {'issue_date': '01/18/2020', 'license_type': 'PAS',
+                     'plate': 'ABC1234', 'precinct': '1', 'state': 'NY',
+                     'summons_number': '4', 'violation': 'FIRE HYDRANT'}])
+
+            if query_string.startswith(FISCAL_YEAR_DATABASE_ENDPOINTS[2020]):
+                return _build_completed_future([
+                    {'issue_date': '2020-01-18T00:00:00.000', 'plate_id': 'ABC1234',
+                     'plate_type': 'PAS', 'registration_state': 'NY',
+                     'summons_number': '4', 'violation_code': '40',
+                     'violation_precinct': '1'},
+                    {'issue_date': '2020-01-19T00:00:00.000', 'plate_id': 'ABC1234',
+                     'plate_type': 'PAS', 'registration_state': 'NJ',
+                     'summons_number': '5', 'violation_code': '40',
+                     'violation_precinct': '1'}])
+
+            return _build_completed_future([])
+
+        mocked_submit_query.side_effect = submit_query
+
+        responses = self.open_data_service.look_up_vehicles(plate_queries)
+
+        self.assertEqual(
+            mocked_submit_query.call_count,
+            len(FISCAL_YEAR_DATABASE_ENDPOINTS) + 1)
+
+        opacv_query_string = mocked_submit_query.call_args_list[0].kwargs['query_string']
+        self.assertIn(
+            '$where=((state=%27NY%27%20and%20plate%20in(%27ABC1234%27,%27DEF5555%27))'
+            '%20or%20(state=%27NJ%27%20and%20plate%20in(%27XYZ9876%27)))',
+            opacv_query_string)
+
+        self.assertTrue(all(response.success for response in responses))
+        self.assertEqual(
+            [(response.data.plate, response.data.state, response.data.num_violations)
+             for response in responses],
+            [('ABC1234', 'NY', 2), ('XYZ9876', 'NJ', 1), ('DEF5555', 'NY', 0)])
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService._submit_query')
+    def test_look_up_vehicles_reports_failures_per_chunk(self,
+                                                        mocked_submit_query):
+        plate_queries = [
+            PlateQuery(created_at='Tue Dec 31 19:28:12 -0500 2019',
+                       message_source='status',
+                       plate=plate,
+                       plate_types=None,
+                       state='NY') for plate in ['ABC1234', 'DEF5555', 'XYZ9876']]
+
+        def submit_query(query_string):
+            if 'plate=DEF5555' in query_string:
+                return _build_completed_future([], status_code=503)
+
+            return _build_completed_future([])
+
+        mocked_submit_query.side_effect = submit_query
+
+        with mock.patch.object(OpenDataService, 'MAX_PLATES_PER_QUERY', 1):
+            responses = self.open_data_service.look_up_vehicles(plate_queries)
+
+        self.assertEqual(
+            [response.success for response in responses], [True, False, True])
+        self.assertRegex(str(responses[1].message), 'server error when accessing')
+
+    @mock.patch('traffic_violations.services.single_flight.LOG')
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService.look_up_vehicles')
+    def test_look_up_vehicle_coalesces_concurrent_lookups(self,
+                                                          mocked_look_up_vehicles,
+                                                          mocked_single_flight_log):
+        started = threading.Event()
+        release = threading.Event()
+        waiting = threading.Event()
+
+        response = OpenDataServiceResponse(success=True)
+
+        def look_up_vehicles(plate_queries, time_ranges):
+            started.set()
+            release.wait(timeout=5)
+            return [response]
+
+        mocked_look_up_vehicles.side_effect = look_up_vehicles
+        mocked_single_flight_log.debug.side_effect = lambda message: waiting.set()
+
+        responses = []
+
+        def look_up_vehicle(message_id, state='NY'):
+            responses.append(OpenDataService().look_up_vehicle(
+                PlateQuery(created_at='Tue Dec 31 19:28:12 -0500 2019',
+                           message_id=message_id,
+                           message_source='status',
+                           plate='ABC1234',
+                           plate_types='PAS',
+                           state=state)))
+
+        leader = threading.Thread(target=look_up_vehicle, args=(1,))
+        leader.start()
+        self.assertTrue(started.wait(timeout=5))
+
+        # A lookup for the same vehicle from another message joins the
+        # in-flight one.
+        follower = threading.Thread(target=look_up_vehicle, args=(2,))
+        follower.start()
+        self.assertTrue(waiting.wait(timeout=5))
+
+        release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+
+        self.assertEqual(mocked_look_up_vehicles.call_count, 1)
+        self.assertEqual(responses, [response, response])
+
+        # Once it finishes, lookups query again, as do those of other vehicles.
+        look_up_vehicle(3)
+        look_up_vehicle(4, state='NJ')
+
+        self.assertEqual(mocked_look_up_vehicles.call_count, 3)
+
+    @mock.patch(
+        f'traffic_violations.services.apis.open_data_service.'
+        f'OpenDataService.look_up_vehicles')
+    def test_look_up_vehicle_uses_plate_lookup_cache(self, mocked_look_up_vehicles):
+        mocked_look_up_vehicles.side_effect = lambda plate_queries, time_ranges: [
+            OpenDataServiceResponse(success=True)]
+
+        plate_query = PlateQuery(created_at='Tue Dec 31 19:28:12 -0500 2019',
+                                 message_source='status',
+                                 plate='ABC1234',
+                                 plate_types=None,
+                                 state='NY')
+
+        plate_lookup_cache = PlateLookupCache(
+            max_size=10, ttl_seconds=60, max_stale_seconds=600)
+
+        with mock.patch(
+                'traffic_violations.services.apis.open_data_service._PLATE_LOOKUP_CACHE',
+                plate_lookup_cache):
+            for _ in range(3):
+                self.open_data_service.look_up_vehicle(plate_query=plate_query)
+
+            self.assertEqual(mocked_look_up_vehicles.call_count, 1)
+
+            self.open_data_service.look_up_vehicle(
+                plate_query=plate_query, use_cache=False)
+
+            self.assertEqual(mocked_look_up_vehicles.call_count, 2)
+
+        self.assertEqual(plate_lookup_cache.stats()['hits'], 2)
+
+    def test_normalize_fiscal_year_database_records_geocodes_in_one_batch(self):
+        def build_record(summons_number, street_name, violation_county=None):
+            return {'issue_date': '2019-01-01T00:00:00.000',
+                    'street_name': street_name,
+                    'intersecting_street': 'W 4 ST',
+                    'summons_number': summons_number,
+                    'violation_county': violation_county,
+                    'violation_precinct': '999'}
+
+        records = [build_record('1', 'BROADWAY'),
+                   build_record('2', 'GRAND CONCOURSE'),
+                   build_record('3', 'BROADWAY'),
+                   build_record('4', 'NOWHERE'),
+                   build_record('5', 'BROADWAY', violation_county='K')]
+
+        plate_query = PlateQuery(
+            created_at='Tue Dec 31 19:28:12 -0500 2019',
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY')
+
+        with mock.patch.object(
+                self.open_data_service.location_service,
+                'get_boroughs_from_location_strings') as mocked_get_boroughs:
+            mocked_get_boroughs.return_value = {
+                ('BROADWAY', 'W 4 ST'): 'Manhattan',
+                ('GRAND CONCOURSE', 'W 4 ST'): 'Bronx',
+                ('NOWHERE', 'W 4 ST'): None}
+
+            summonses, num_unresolved = self.open_data_service._normalize_fiscal_year_database_records(
+                endpoint=FISCAL_YEAR_DATABASE_ENDPOINTS[2019],
+                plate_query=plate_query,
+                records=iter(records))
+
+        mocked_get_boroughs.assert_called_once()
+        self.assertEqual(
+            list(mocked_get_boroughs.call_args.kwargs['locations']),
+            [('BROADWAY', 'W 4 ST'), ('GRAND CONCOURSE', 'W 4 ST'),
+             ('BROADWAY', 'W 4 ST'), ('NOWHERE', 'W 4 ST')])
+
+        self.assertEqual(
+            [(summons.summons_number, summons.borough) for summons in summonses],
+            [('1', 'manhattan'), ('2', 'bronx'), ('3', 'manhattan'),
+             ('4', None), ('5', 'brooklyn')])
+        self.assertEqual(num_unresolved, 1)
+
+    @ddt.data(
+        {'expected': 'Feeding Meter', 'issue_date': '2019-06-11T00:00:00.000',
+         'violation_code': '33', 'violation_description': None},
+        {'expected': 'Misuse of Parking Permit', 'issue_date': '2019-06-12T00:00:00.000',
+         'violation_code': '33', 'violation_description': None},
+        {'expected': None, 'issue_date': '1970-01-01T00:00:00.000',
+         'violation_code': '33', 'violation_description': None},
+        {'expected': None, 'issue_date': None,
+         'violation_code': '33', 'violation_description': None},
+        {'expected': 'Fire Hydrant', 'issue_date': None,
+         'violation_code': '40', 'violation_description': None},
+        {'expected': None, 'issue_date': None,
+         'violation_code': 'XX', 'violation_description': None},
+        {'expected': 'Bus Parking in Lower Manhattan - Non-Bus', 'issue_date': None,
+         'violation_code': '04A', 'violation_description': '04A-Downtown Bus Area,Non-Bus'},
+        {'expected': 'Unknown Violation', 'issue_date': None,
+         'violation_code': None, 'violation_description': '99-Unknown Violation'},
+    )
+    @ddt.unpack
+    def test_normalize_fiscal_year_database_summons_violation(self,
+                                                              expected,
+                                                              issue_date,
+                                                              violation_code,
+                                                              violation_description):
+        summons = self.open_data_service._normalize_fiscal_year_database_summons(
+            summons={'issue_date': issue_date,
+                     'summons_number': '1',
+                     'violation_code': violation_code,
+                     'violation_description': violation_description})
+
+        self.assertEqual(summons.violation, expected)
+
+    @ddt.data(
+        {'county': None, 'expected': 'MANHATTAN', 'precinct': '1'},
+        {'county': 'K', 'expected': 'BRONX', 'precinct': 40},
+        {'county': 'K', 'expected': 'brooklyn', 'precinct': '999'},
+        {'county': 'XX', 'expected': None, 'precinct': '999'},
+        {'county': None, 'expected': None, 'precinct': '999'},
+    )
+    @ddt.unpack
+    def test_find_borough(self, county, expected, precinct):
+        self.assertEqual(
+            self.open_data_service._find_borough(county=county, precinct=precinct),
+            expected)
+
+    def test_merge_violations(self):
+        opacv_summons = Summons.create(
+            borough='MANHATTAN',
+            county='NY',
+            fined=Summons.to_cents('115.00'),
+            issue_date=datetime(2019, 3, 1),
+            outstanding=Summons.to_cents('115.00'),
+            precinct=1,
+            summons_number='1234567890',
+            violation='Fire Hydrant')
+
+        fiscal_year_summons = Summons.create(
+            issue_date=datetime(2019, 3, 1, 10, 30),
+            summons_number='1234567890')
+
+        other_summons = Summons.create(
+            borough='BRONX',
+            summons_number='9876543210',
+            violation='Double Parking')
+
+        merged = self.open_data_service._merge_violations(
+            {'1234567890': opacv_summons},
+            {'1234567890': fiscal_year_summons, '9876543210': other_summons})
+
+        self.assertEqual(merged['9876543210'], other_summons)
+        self.assertEqual(
+            merged['1234567890'],
+            Summons.create(
+                borough='No Borough Available',
+                fined=11500,
+                issue_date=datetime(2019, 3, 1, 10, 30),
+                outstanding=11500,
+                summons_number='1234567890',
+                violation='No Violation Description Available'))
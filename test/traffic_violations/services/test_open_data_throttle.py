@@ -0,0 +1,181 @@
+import ddt
+import threading
+import unittest
+
+from traffic_violations.services.constants.exceptions import \
+    APIFailureException
+from traffic_violations.services.open_data_throttle import \
+    AdaptiveConcurrencyLimiter, CircuitBreaker, OpenDataThrottle, TokenBucket
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@ddt.ddt
+class TestOpenDataThrottle(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_token_bucket_allows_bursts_then_paces_requests(self):
+        token_bucket = TokenBucket(
+            rate=10, capacity=3, clock=self.clock, sleep=self.clock.sleep)
+
+        for _ in range(3):
+            token_bucket.acquire()
+
+        self.assertEqual(self.clock.sleeps, [])
+
+        token_bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [0.1])
+
+        # Tokens build back up while idle, but only to capacity.
+        self.clock.now += 60
+        for _ in range(3):
+            token_bucket.acquire()
+
+        self.assertEqual(len(self.clock.sleeps), 1)
+
+    def test_adaptive_concurrency_limiter_adapts_to_overloading(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            min_limit=1, max_limit=8, decrease_interval_seconds=1, clock=self.clock)
+
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+
+        # Requests that were already in flight don't halve it again.
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        self.assertEqual(limiter.limit, 4)
+
+        self.clock.now += 1
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(overloaded=True)
+            self.clock.now += 1
+
+        self.assertEqual(limiter.limit, 1)
+
+        # About one more for each limit's worth of successes.
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(overloaded=False)
+
+        self.assertEqual(limiter.limit, 2)
+
+        # Requests that were never sent say nothing about the server.
+        limiter.acquire()
+        limiter.release(overloaded=None)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_adaptive_concurrency_limiter_waits_for_a_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(min_limit=1, max_limit=1, clock=self.clock)
+        limiter.acquire()
+
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+
+        self.assertFalse(acquired.wait(timeout=0.05))
+
+        limiter.release(overloaded=False)
+
+        self.assertTrue(acquired.wait(timeout=5))
+        thread.join(timeout=5)
+
+    def test_adaptive_concurrency_limiter_gives_up_waiting_for_a_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            min_limit=1, max_limit=1, acquire_timeout_seconds=0.05, clock=self.clock)
+        limiter.acquire()
+
+        with self.assertRaisesRegex(APIFailureException, 'no request slot free'):
+            limiter.acquire()
+
+        limiter.release(overloaded=None)
+        limiter.acquire()
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        circuit_breaker = CircuitBreaker(
+            failure_threshold=3, reset_seconds=30, clock=self.clock)
+
+        for _ in range(2):
+            circuit_breaker.record_failure()
+
+        circuit_breaker.record_success()
+
+        for _ in range(3):
+            self.assertTrue(circuit_breaker.allow_request())
+            circuit_breaker.record_failure()
+
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(circuit_breaker.allow_request())
+
+        # Once it has been open a while, one trial request is let through.
+        self.clock.now += 30
+        self.assertTrue(circuit_breaker.allow_request())
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(circuit_breaker.allow_request())
+
+        circuit_breaker.record_failure()
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.OPEN)
+
+        self.clock.now += 30
+        self.assertTrue(circuit_breaker.allow_request())
+
+        circuit_breaker.record_success()
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(circuit_breaker.allow_request())
+
+    @ddt.data(
+        {'status_code': 200, 'opens': False},
+        {'status_code': 400, 'opens': False},
+        {'status_code': 403, 'opens': True},
+        {'status_code': 429, 'opens': True},
+        {'status_code': 503, 'opens': True},
+        {'status_code': None, 'opens': True},
+    )
+    @ddt.unpack
+    def test_open_data_throttle_fails_fast_for_failing_endpoints(self,
+                                                                 opens,
+                                                                 status_code):
+        throttle = OpenDataThrottle(
+            requests_per_second=100,
+            burst=100,
+            max_concurrent_requests=10,
+            failure_threshold=2,
+            reset_seconds=30,
+            clock=self.clock,
+            sleep=self.clock.sleep)
+
+        for _ in range(2):
+            throttle.before_request(endpoint='https://data.cityofnewyork.us/resource/a.json')
+            throttle.after_response(
+                endpoint='https://data.cityofnewyork.us/resource/a.json',
+                status_code=status_code)
+
+        if opens:
+            with self.assertRaisesRegex(APIFailureException, 'circuit breaker open'):
+                throttle.before_request(
+                    endpoint='https://data.cityofnewyork.us/resource/a.json')
+        else:
+            throttle.before_request(endpoint='https://data.cityofnewyork.us/resource/a.json')
+
+        # Other endpoints are unaffected.
+        throttle.before_request(endpoint='https://data.cityofnewyork.us/resource/b.json')
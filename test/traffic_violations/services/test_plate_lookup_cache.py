@@ -0,0 +1,172 @@
+import mock
+import threading
+import time
+import unittest
+
+from traffic_violations.models.response.open_data_service_response import \
+    OpenDataServiceResponse
+
+from traffic_violations.services.plate_lookup_cache import PlateLookupCache
+
+
+class TestPlateLookupCache(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+
+        self.cache = PlateLookupCache(
+            max_size=2,
+            ttl_seconds=60,
+            max_stale_seconds=600,
+            clock=lambda: self.now)
+
+        self.loads = []
+
+    def _load(self, message='fresh', success=True):
+        def load():
+            response = OpenDataServiceResponse(
+                message=f'{message}-{len(self.loads)}', success=success)
+            self.loads.append(response)
+            return response
+
+        return load
+
+    def test_get_serves_cached_responses_within_ttl(self):
+        first_response = self.cache.get(key='NY:ABC1234', load=self._load())
+
+        self.now = 59
+        self.assertIs(self.cache.get(key='NY:ABC1234', load=self._load()), first_response)
+
+        self.assertEqual(len(self.loads), 1)
+        self.assertEqual(
+            self.cache.stats(),
+            {'evictions': 0, 'hits': 1, 'misses': 1, 'refreshes': 0,
+             'size': 1, 'stale_hits': 0})
+
+    def test_get_serves_stale_responses_while_refreshing(self):
+        stale_response = self.cache.get(key='NY:ABC1234', load=self._load())
+
+        refreshed = threading.Event()
+        release = threading.Event()
+
+        def refresh():
+            release.wait(timeout=5)
+            response = self._load(message='refreshed')()
+            refreshed.set()
+            return response
+
+        self.now = 61
+        self.assertIs(self.cache.get(key='NY:ABC1234', load=refresh), stale_response)
+
+        # A refresh is already under way, so another isn't started.
+        self.assertIs(self.cache.get(key='NY:ABC1234', load=refresh), stale_response)
+
+        release.set()
+        self.assertTrue(refreshed.wait(timeout=5))
+
+        # The refresh is stored just after it loads, so wait for it to land.
+        for _ in range(500):
+            if self.cache.stats()['refreshes']:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(self.cache.get(key='NY:ABC1234', load=self._load()).message,
+                         'refreshed-1')
+        self.assertEqual(len(self.loads), 2)
+        self.assertEqual(self.cache.stats()['stale_hits'], 2)
+        self.assertEqual(self.cache.stats()['refreshes'], 1)
+
+    @mock.patch('traffic_violations.services.plate_lookup_cache.db.init_database')
+    def test_get_runs_refreshes_on_bounded_workers(self, mocked_init_database):
+        cache = PlateLookupCache(
+            max_size=2,
+            ttl_seconds=60,
+            max_stale_seconds=600,
+            max_refresh_workers=1,
+            clock=lambda: self.now)
+
+        for key in ['NY:ABC1234', 'NJ:XYZ9876']:
+            cache.get(key=key, load=self._load())
+
+        release = threading.Event()
+        started = []
+
+        def refresh(key):
+            def load():
+                started.append(key)
+                release.wait(timeout=5)
+                return self._load(message='refreshed')()
+
+            return load
+
+        self.now = 61
+        for key in ['NY:ABC1234', 'NJ:XYZ9876']:
+            cache.get(key=key, load=refresh(key))
+
+        # The second refresh waits for the only worker.
+        time.sleep(0.05)
+        self.assertEqual(started, ['NY:ABC1234'])
+
+        release.set()
+        cache._refresh_executor.shutdown(wait=True)
+
+        self.assertEqual(started, ['NY:ABC1234', 'NJ:XYZ9876'])
+        self.assertEqual(cache.stats()['refreshes'], 2)
+
+        # Each refresh closes its worker's scoped session.
+        self.assertEqual(mocked_init_database.return_value.session.remove.call_count, 2)
+
+    def test_get_reloads_responses_too_stale_to_serve(self):
+        self.cache.get(key='NY:ABC1234', load=self._load())
+
+        self.now = 661
+        self.assertEqual(self.cache.get(key='NY:ABC1234', load=self._load()).message,
+                         'fresh-1')
+        self.assertEqual(self.cache.stats()['misses'], 2)
+
+    def test_get_evicts_least_recently_used_responses(self):
+        for key in ['NY:ABC1234', 'NJ:XYZ9876']:
+            self.cache.get(key=key, load=self._load())
+
+        # Using the first keeps it around when a third is added.
+        self.cache.get(key='NY:ABC1234', load=self._load())
+        self.cache.get(key='NY:DEF5555', load=self._load())
+
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+        self.cache.get(key='NY:ABC1234', load=self._load())
+        self.assertEqual(len(self.loads), 3)
+
+        self.cache.get(key='NJ:XYZ9876', load=self._load())
+        self.assertEqual(len(self.loads), 4)
+
+    def test_invalidate_drops_matching_responses(self):
+        for key in ['NY:ABC1234', 'NJ:XYZ9876']:
+            self.cache.get(key=key, load=self._load())
+
+        self.assertEqual(self.cache.invalidate(lambda key: key.startswith('NY:')), 1)
+
+        self.cache.get(key='NJ:XYZ9876', load=self._load())
+        self.assertEqual(len(self.loads), 2)
+
+        self.assertEqual(self.cache.get(key='NY:ABC1234', load=self._load()).message,
+                         'fresh-2')
+
+    def test_invalidate_drops_responses_loading_meanwhile(self):
+        def load():
+            # The vehicle changes while its lookup is under way.
+            response = self._load()()
+            self.cache.invalidate(lambda key: key == 'NY:ABC1234')
+            return response
+
+        self.cache.get(key='NY:ABC1234', load=load)
+
+        self.assertEqual(self.cache.stats()['size'], 0)
+
+    def test_get_does_not_cache_failures(self):
+        for _ in range(2):
+            response = self.cache.get(key='NY:ABC1234', load=self._load(success=False))
+            self.assertFalse(response.success)
+
+        self.assertEqual(len(self.loads), 2)
+        self.assertEqual(self.cache.stats()['size'], 0)
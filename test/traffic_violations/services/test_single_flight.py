@@ -0,0 +1,102 @@
+import mock
+import threading
+import unittest
+
+from traffic_violations.services.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+
+        # Callers log once they are waiting on an in-flight call, which
+        # lets the tests hold that call open until every caller has joined.
+        self.waiting_callers = threading.Semaphore(0)
+
+        log_patcher = mock.patch('traffic_violations.services.single_flight.LOG')
+        mocked_log = log_patcher.start()
+        mocked_log.debug.side_effect = lambda message: self.waiting_callers.release()
+        self.addCleanup(log_patcher.stop)
+
+    def _wait_for_waiting_callers(self, num_callers):
+        for _ in range(num_callers):
+            self.assertTrue(self.waiting_callers.acquire(timeout=5))
+
+    def _start_callers(self, key, function, num_callers):
+        results = []
+        errors = []
+
+        def call():
+            try:
+                results.append(self.single_flight.do(key=key, function=function))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(num_callers)]
+        for thread in threads:
+            thread.start()
+
+        return threads, results, errors
+
+    def test_do_coalesces_concurrent_calls(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return 'result'
+
+        leader, results, _ = self._start_callers(
+            key='NY:ABC1234', function=function, num_callers=1)
+        started.wait(timeout=5)
+
+        followers, follower_results, _ = self._start_callers(
+            key='NY:ABC1234', function=function, num_callers=5)
+        self._wait_for_waiting_callers(num_callers=5)
+
+        release.set()
+        for thread in leader + followers:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results + follower_results, ['result'] * 6)
+
+    def test_do_shares_exceptions_with_waiting_callers(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def function():
+            started.set()
+            release.wait(timeout=5)
+            raise ValueError('lookup failed')
+
+        leader, _, leader_errors = self._start_callers(
+            key='NY:ABC1234', function=function, num_callers=1)
+        started.wait(timeout=5)
+
+        followers, _, follower_errors = self._start_callers(
+            key='NY:ABC1234', function=function, num_callers=3)
+        self._wait_for_waiting_callers(num_callers=3)
+
+        release.set()
+        for thread in leader + followers:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(leader_errors + follower_errors), 4)
+        for error in leader_errors + follower_errors:
+            self.assertIsInstance(error, ValueError)
+
+    def test_do_calls_again_once_finished(self):
+        calls = []
+
+        def function():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(self.single_flight.do(key='NY:ABC1234', function=function), 1)
+        self.assertEqual(self.single_flight.do(key='NY:ABC1234', function=function), 2)
+        self.assertEqual(self.single_flight.do(key='NJ:ABC1234', function=function), 3)
@@ -0,0 +1,115 @@
+import ddt
+import os
+import tempfile
+import unittest
+
+from traffic_violations.services.street_gazetteer import StreetGazetteer
+
+
+@ddt.ddt
+class TestStreetGazetteer(unittest.TestCase):
+
+    def setUp(self):
+        self.gazetteer = StreetGazetteer()
+
+        for street, borough in [('BROADWAY', 'Manhattan'),
+                                ('BROADWAY', 'Brooklyn'),
+                                ('BROADWAY', 'Queens'),
+                                ('W 4TH ST', 'Manhattan'),
+                                ('GRAND CONCOURSE', 'Bronx'),
+                                ('ST MARKS PL', 'Manhattan'),
+                                ('ST MARKS PL', 'Staten Island'),
+                                ('ST MARKS AVE', 'Brooklyn'),
+                                ('FLATBUSH AVE', 'Brooklyn')]:
+            self.gazetteer.add(
+                street=street, borough=borough, count=StreetGazetteer.MIN_SIGHTINGS)
+
+    @ddt.data(
+        ('W 4th St.', 'WEST 4 STREET'),
+        ('WEST 4 STREET', 'WEST 4 STREET'),
+        ('e 161st st', 'EAST 161 STREET'),
+        ('St Marks Pl', 'SAINT MARKS PLACE'),
+        ('AVE J', 'AVENUE J'),
+        ('FLATBUSH AVE EB', 'FLATBUSH AVENUE'),
+        ('20ft N/of W 4 St', 'WEST 4 STREET'),
+        ('BQE (WB)', 'BQE'),
+        ('', ''),
+    )
+    @ddt.unpack
+    def test_canonicalize(self, street, canonical_street):
+        self.assertEqual(StreetGazetteer.canonicalize(street), canonical_street)
+
+    @ddt.data(
+        # streets in one borough give it away, whatever they cross.
+        (['GRAND CONCOURSE', 'E 161 ST'], 'Bronx'),
+        (['Grand Concourse', ''], 'Bronx'),
+        (['FLATBUSH AVENUE'], 'Brooklyn'),
+        # streets in several need a street that narrows them down.
+        (['BROADWAY', 'W 4 ST'], 'Manhattan'),
+        (['BROADWAY', 'FLATBUSH AVE'], 'Brooklyn'),
+        (['BROADWAY', ''], None),
+        (['ST MARKS PL', 'BROADWAY'], 'Manhattan'),
+        # streets that don't meet are left to the geocoder.
+        (['GRAND CONCOURSE', 'FLATBUSH AVE'], None),
+        (['NOWHERE', 'ELSEWHERE'], None),
+    )
+    @ddt.unpack
+    def test_find_borough(self, location_parts, borough):
+        self.assertEqual(self.gazetteer.find_borough(location_parts=location_parts), borough)
+
+    def test_find_borough_ignores_rarely_seen_streets(self):
+        self.gazetteer.add(
+            street='ATLANTIC AVE', borough='Brooklyn', count=StreetGazetteer.MIN_SIGHTINGS - 1)
+
+        # too few sightings to answer, or to narrow down another street.
+        self.assertIsNone(self.gazetteer.find_borough(location_parts=['ATLANTIC AVE']))
+        self.assertIsNone(
+            self.gazetteer.find_borough(location_parts=['BROADWAY', 'ATLANTIC AVE']))
+
+        self.gazetteer.add(street='ATLANTIC AVE', borough='Brooklyn')
+
+        self.assertEqual(
+            self.gazetteer.find_borough(location_parts=['ATLANTIC AVE']), 'Brooklyn')
+
+    def test_find_borough_ignores_rare_boroughs(self):
+        self.gazetteer.add(street='GRAND CONCOURSE', borough='Bronx', count=99)
+        self.gazetteer.add(street='GRAND CONCOURSE', borough='Manhattan')
+
+        self.assertEqual(
+            self.gazetteer.find_borough(location_parts=['GRAND CONCOURSE']), 'Bronx')
+
+    @ddt.data(
+        ('BROADWAY W 4 ST New York NY', ('BROADWAY', 'WEST 4 STREET')),
+        ('W 4 ST BROADWAY New York NY', ('WEST 4 STREET', 'BROADWAY')),
+        ('ST MARKS AVE FLATBUSH AVE New York NY', ('SAINT MARKS AVENUE', 'FLATBUSH AVENUE')),
+        ('ATLANTIC AVE  New York NY', ('ATLANTIC AVENUE', '')),
+        ('ATLANTIC AVE FLATBUSH AVE New York NY', None),
+    )
+    @ddt.unpack
+    def test_split_lookup_string(self, lookup_string, streets):
+        self.assertEqual(
+            self.gazetteer.split_lookup_string(lookup_string=lookup_string), streets)
+
+    def test_add_lookup_string(self):
+        self.assertTrue(self.gazetteer.add_lookup_string(
+            lookup_string='ATLANTIC AVE  New York NY', borough='Brooklyn'))
+        for _ in range(StreetGazetteer.MIN_SIGHTINGS):
+            self.assertTrue(self.gazetteer.add_lookup_string(
+                lookup_string='ATLANTIC AVE 4TH AVE New York NY', borough='Brooklyn'))
+        self.assertFalse(self.gazetteer.add_lookup_string(
+            lookup_string='QUEENS BLVD 46 ST New York NY', borough='Queens'))
+
+        # the intersecting street is learned along with the street.
+        self.assertEqual(
+            self.gazetteer.find_borough(location_parts=['4 AVENUE', '']), 'Brooklyn')
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'gazetteer.json')
+
+            self.gazetteer.save(path=path)
+            loaded_gazetteer = StreetGazetteer.load(path=path)
+
+        self.assertEqual(loaded_gazetteer.num_streets, self.gazetteer.num_streets)
+        self.assertCountEqual(
+            loaded_gazetteer.iter_streets(), self.gazetteer.iter_streets())
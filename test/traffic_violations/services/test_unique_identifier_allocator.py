@@ -0,0 +1,112 @@
+import ddt
+import threading
+import unittest
+
+from traffic_violations.services.unique_identifier_allocator import \
+    UniqueIdentifierAllocator
+
+
+class FakeSequence:
+
+    def __init__(self):
+        self.next_value = 0
+        self.reserved_sizes = []
+        self._lock = threading.Lock()
+
+    def reserve_block(self, size):
+        with self._lock:
+            self.reserved_sizes.append(size)
+            first_value = self.next_value
+            self.next_value += size
+            return first_value
+
+
+@ddt.ddt
+class TestUniqueIdentifierAllocator(unittest.TestCase):
+
+    def setUp(self):
+        self.sequence = FakeSequence()
+        self.allocator = UniqueIdentifierAllocator(
+            key=b'secret',
+            reserve_block=self.sequence.reserve_block,
+            find_existing_identifiers=lambda identifiers: [],
+            block_size=10)
+
+    def test_encode_gives_distinct_identifiers(self):
+        identifiers = [self.allocator.encode(number) for number in range(20_000)]
+
+        self.assertEqual(len(set(identifiers)), len(identifiers))
+
+        for identifier in identifiers:
+            self.assertEqual(len(identifier), UniqueIdentifierAllocator.IDENTIFIER_LENGTH)
+            self.assertTrue(set(identifier) <= set(UniqueIdentifierAllocator.ALPHABET))
+
+        # Consecutive numbers don't give similar identifiers, and another
+        # key gives other identifiers.
+        self.assertNotEqual(identifiers[0][:4], identifiers[1][:4])
+
+        other_allocator = UniqueIdentifierAllocator(
+            key=b'other secret',
+            reserve_block=self.sequence.reserve_block,
+            find_existing_identifiers=lambda identifiers: [])
+
+        self.assertNotEqual(other_allocator.encode(0), identifiers[0])
+
+    @ddt.data(-1, UniqueIdentifierAllocator.DOMAIN_SIZE)
+    def test_encode_outside_the_sequence(self, number):
+        with self.assertRaises(ValueError):
+            self.allocator.encode(number)
+
+    def test_encode_at_the_end_of_the_sequence(self):
+        self.assertEqual(
+            len(self.allocator.encode(UniqueIdentifierAllocator.DOMAIN_SIZE - 1)),
+            UniqueIdentifierAllocator.IDENTIFIER_LENGTH)
+
+    def test_allocate_reserves_a_block_at_a_time(self):
+        identifiers = [self.allocator.allocate() for _ in range(25)]
+
+        self.assertEqual(identifiers, [self.allocator.encode(number) for number in range(25)])
+        self.assertEqual(self.sequence.reserved_sizes, [10, 10, 10])
+
+        # Allocating many at once reserves them all together.
+        self.assertEqual(len(self.allocator.allocate_many(count=40)), 40)
+        self.assertEqual(self.sequence.reserved_sizes, [10, 10, 10, 35])
+
+    def test_allocate_skips_identifiers_already_in_use(self):
+        existing_identifiers = {self.allocator.encode(1), self.allocator.encode(3)}
+
+        allocator = UniqueIdentifierAllocator(
+            key=b'secret',
+            reserve_block=self.sequence.reserve_block,
+            find_existing_identifiers=lambda identifiers: [
+                identifier for identifier in identifiers
+                if identifier in existing_identifiers],
+            block_size=10)
+
+        identifiers = allocator.allocate_many(count=10)
+
+        self.assertEqual(
+            identifiers,
+            [allocator.encode(number) for number in [0, 2] + list(range(4, 12))])
+        self.assertEqual(self.sequence.reserved_sizes, [10, 10])
+
+    def test_allocate_from_many_threads(self):
+        identifiers = []
+        identifiers_lock = threading.Lock()
+
+        def allocate():
+            allocated = [self.allocator.allocate() for _ in range(100)]
+
+            with identifiers_lock:
+                identifiers.extend(allocated)
+
+        threads = [threading.Thread(target=allocate) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(identifiers)), 800)
+        self.assertEqual(self.sequence.next_value, 800)
@@ -3,29 +3,38 @@ import logging
 import mock
 import pytz
 import random
+import re
 import requests
-import requests_futures.sessions
+import threading
 import unittest
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from freezegun import freeze_time
 
 from unittest.mock import MagicMock
 
+import traffic_violations.db.database as db
+
+from traffic_violations.constants import regexps as regexp_constants
 from traffic_violations.models.camera_streak_data import CameraStreakData
 from traffic_violations.models.campaign import Campaign
+from traffic_violations.models.campaign_vehicle_lookup import CampaignVehicleLookup
 from traffic_violations.models.fine_data import FineData
 from traffic_violations.models.lookup_requests import \
     AccountActivityAPIDirectMessage
 from traffic_violations.models.plate_lookup import PlateLookup
 from traffic_violations.models.plate_query import PlateQuery
 from traffic_violations.models.vehicle import Vehicle
+from traffic_violations.models.vehicle_lookup_stats import VehicleLookupStats
 from traffic_violations.models.response.open_data_service_plate_lookup \
     import OpenDataServicePlateLookup
 from traffic_violations.models.response.open_data_service_response \
     import OpenDataServiceResponse
 from traffic_violations.models.response.traffic_violations_aggregator_response \
     import TrafficViolationsAggregatorResponse
+from traffic_violations.models.response.valid_vehicle_response \
+    import ValidVehicleResponse
 from traffic_violations.models.twitter_event import TwitterEvent
 
 from traffic_violations.reply_argument_builder import \
@@ -34,6 +43,11 @@ from traffic_violations.reply_argument_builder import \
 from traffic_violations.traffic_violations_aggregator \
     import TrafficViolationsAggregator
 
+from test.traffic_violations.services.test_open_data_service import \
+    _build_response_body
+from test.traffic_violations.utils.test_plate_tokenizer import \
+    PLATE_STRING_CORPUS
+
 
 @ddt.ddt
 class TestTrafficViolationsAggregator(unittest.TestCase):
@@ -252,6 +266,40 @@ class TestTrafficViolationsAggregator(unittest.TestCase):
         self.assertEqual(self.aggregator._find_potential_vehicles_using_combined_fields(
             string_parts), potential_vehicles)
 
+    @ddt.data(*PLATE_STRING_CORPUS)
+    def test_find_potential_vehicles_using_combined_fields_matches_regexps(self, text):
+        """ Test that vehicles are found as they were with PLATE_FORMAT_REGEX
+        and the state and plate types patterns
+        """
+
+        def find_plate_strings_with_regexp(text):
+            return re.findall(regexp_constants.PLATE_FORMAT_REGEX, text)
+
+        def detect_plate_types_with_pattern(plate_types_input):
+            return any(regexp_constants.PLATE_TYPES_PATTERN.search(part) is not None
+                       for part in plate_types_input.upper().split(','))
+
+        def detect_state_with_pattern(state_input):
+            return regexp_constants.STATE_ABBREVIATIONS_PATTERN.search(
+                state_input.upper()) is not None
+
+        string_parts = text.split(' ')
+
+        potential_vehicles = self.aggregator._find_potential_vehicles_using_combined_fields(
+            string_parts)
+
+        with mock.patch(
+                'traffic_violations.traffic_violations_aggregator.plate_tokenizer.find_plate_strings',
+                side_effect=find_plate_strings_with_regexp), \
+            mock.patch.object(self.aggregator, '_detect_plate_types',
+                              side_effect=detect_plate_types_with_pattern), \
+            mock.patch.object(self.aggregator, '_detect_state',
+                              side_effect=detect_state_with_pattern):
+
+            self.assertEqual(
+                self.aggregator._find_potential_vehicles_using_combined_fields(string_parts),
+                potential_vehicles)
+
     @ddt.data(
         {
             'potential_vehicles': [
@@ -753,35 +801,150 @@ class TestTrafficViolationsAggregator(unittest.TestCase):
         self.assertEqual(self.aggregator.lookup_has_valid_plates(
             lookup_request=request_object), expected_result)
 
-    @mock.patch('traffic_violations.traffic_violations_aggregator.Campaign')
-    @mock.patch('traffic_violations.traffic_violations_aggregator.PlateLookup')
+    @mock.patch(
+        'traffic_violations.traffic_violations_aggregator.CampaignVehicleLookup.get_totals_for_campaign')
     def test_perform_campaign_lookup(self,
-                                     mocked_plate_lookup_class,
-                                     mocked_campaign_class):
+                                     mocked_get_totals_for_campaign):
 
         campaign = MagicMock(name='campaign')
         campaign_hashtag = '#SaferSkillman'
         campaign.hashtag = campaign_hashtag
+        campaign.id = 1
+
+        untagged_campaign = MagicMock(name='untagged_campaign')
+        untagged_campaign.hashtag = '#BetterPresident'
+        untagged_campaign.id = 2
 
-        included_campaigns = [campaign]
+        included_campaigns = [campaign, untagged_campaign]
 
-        plate_lookups = []
-        for _ in range(random.randint(5, 20)):
-            lookup = MagicMock()
-            lookup.num_tickets = random.randint(1, 200)
-            plate_lookups.append(lookup)
+        campaign_vehicles = random.randint(5, 20)
+        campaign_tickets = random.randint(1000, 2000)
 
-        mocked_plate_lookup_class.campaigns.any.return_value = True
-        mocked_plate_lookup_class.query.join().order_by().all.return_value = plate_lookups
+        mocked_get_totals_for_campaign.side_effect = lambda campaign_id: (
+            (campaign_vehicles, campaign_tickets) if campaign_id == campaign.id else (0, 0))
 
         result = [
-            (campaign_hashtag,
-             len(plate_lookups),
-             sum(plate_lookup.num_tickets for plate_lookup in plate_lookups))]
+            (campaign_hashtag, campaign_vehicles, campaign_tickets),
+            ('#BetterPresident', 0, 0)]
 
         self.assertEqual(self.aggregator._perform_campaign_lookup(
             included_campaigns), result)
 
+    @mock.patch(
+        'traffic_violations.traffic_violations_aggregator.create_open_data_service')
+    def test_perform_plate_lookup_counts_campaign_vehicle_once(self,
+                                                               mocked_create_open_data_service):
+        """ Test that two lookups of one vehicle in a request, made at once,
+        count it once towards their campaign
+        """
+
+        campaign = Campaign.get_all_in(hashtag=('#SaferSkillman',))[0]
+
+        plate = f'TEST{random.randint(100, 999)}'
+        num_tickets = random.randint(1, 200)
+
+        open_data_response = OpenDataServiceResponse(
+            data=OpenDataServicePlateLookup(
+                boroughs=[],
+                camera_streak_data={
+                    'Failure to Stop at Red Light': None,
+                    'Mixed': None,
+                    'School Zone Speed Camera Violation': None},
+                fines=FineData(),
+                num_violations=num_tickets,
+                plate=plate,
+                plate_types=None,
+                state='NY',
+                violations=[],
+                years=[]),
+            success=True)
+
+        mocked_create_open_data_service.return_value.look_up_vehicle.return_value = \
+            open_data_response
+
+        previous_vehicles, previous_tickets = CampaignVehicleLookup.get_totals_for_campaign(
+            campaign_id=campaign.id)
+
+        barrier = threading.Barrier(2)
+
+        def perform_plate_lookup(plate_types):
+            session = db.init_database().session
+
+            try:
+                barrier.wait(timeout=5)
+
+                self.aggregator._perform_plate_lookup(
+                    campaigns=[session.merge(campaign, load=False)],
+                    plate_query=PlateQuery(
+                        created_at=datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
+                        message_id=random.randint(1000000000000000000, 2000000000000000000),
+                        message_source='status',
+                        plate=plate,
+                        plate_types=plate_types,
+                        state='NY',
+                        username='@bdhowald'),
+                    unique_identifier=self.aggregator._get_unique_identifier())
+
+            finally:
+                session.remove()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(perform_plate_lookup, [None, 'PAS']))
+
+        self.assertEqual(
+            CampaignVehicleLookup.get_totals_for_campaign(campaign_id=campaign.id),
+            (previous_vehicles + 1, previous_tickets + num_tickets))
+
+    @mock.patch(
+        'traffic_violations.traffic_violations_aggregator.create_open_data_service')
+    def test_perform_plate_lookup_keeps_newest_lookup_as_latest(self,
+                                                                mocked_create_open_data_service):
+        """ Test that a lookup saved after a newer one of the same vehicle
+        doesn't become its latest
+        """
+
+        plate = f'TEST{random.randint(100, 999)}'
+
+        mocked_create_open_data_service.return_value.look_up_vehicle.return_value = \
+            OpenDataServiceResponse(
+                data=OpenDataServicePlateLookup(
+                    boroughs=[],
+                    camera_streak_data={
+                        'Failure to Stop at Red Light': None,
+                        'Mixed': None,
+                        'School Zone Speed Camera Violation': None},
+                    fines=FineData(),
+                    num_violations=0,
+                    plate=plate,
+                    plate_types=None,
+                    state='NY',
+                    violations=[],
+                    years=[]),
+                success=True)
+
+        now = datetime.utcnow()
+
+        plate_queries = [
+            PlateQuery(created_at=created_at.strftime('%Y-%m-%d %H:%M:%S'),
+                       message_id=random.randint(1000000000000000000, 2000000000000000000),
+                       message_source='status',
+                       plate=plate,
+                       plate_types=None,
+                       state='NY',
+                       username='@bdhowald')
+            for created_at in [now, now - timedelta(minutes=1)]]
+
+        for plate_query in plate_queries:
+            self.aggregator._perform_plate_lookup(
+                campaigns=[],
+                plate_query=plate_query,
+                unique_identifier=self.aggregator._get_unique_identifier())
+
+        previous_lookup = self.aggregator._query_for_previous_lookup(plate_queries[0])
+
+        self.assertEqual(previous_lookup.message_id, plate_queries[0].message_id)
+        self.assertEqual(self.aggregator._query_for_lookup_frequency(plate_queries[0]), 2)
+
     @mock.patch('traffic_violations.traffic_violations_aggregator.PlateLookup.get_by')
     def test_perform_plate_lookup(self, mocked_plate_lookup_get_by):
 
@@ -983,35 +1146,36 @@ class TestTrafficViolationsAggregator(unittest.TestCase):
             success=True)
 
         violations_mock = MagicMock(name='violations')
-        violations_mock.json.return_value = violations
+        violations_mock.iter_content.side_effect = _build_response_body(violations)
         violations_mock.status_code = 200
 
-        result_mock = MagicMock(name='result')
-        result_mock.result.return_value = violations_mock
+        def build_result_future(*args, **kwargs):
+            result_future = Future()
+            result_future.set_result(violations_mock)
+            return result_future
 
         get_mock = MagicMock(name='get')
-        get_mock.return_value = result_mock
+        get_mock.side_effect = build_result_future
 
         session_mock = MagicMock(name='session_object')
         session_mock.get = get_mock
 
-        session_object_mock = MagicMock(name='session_object')
-        session_object_mock.return_value = session_mock
+        # Every OpenDataService shares the process-wide session.
+        with mock.patch(
+                'traffic_violations.services.apis.open_data_service._OPEN_DATA_SESSION',
+                session_mock):
+            self.assertEqual(self.aggregator._perform_plate_lookup(
+                campaigns=campaigns,
+                plate_query=plate_query,
+                unique_identifier=unique_identifier), result)
 
-        requests_futures.sessions.FuturesSession = session_object_mock
+            # Try again with a forced error.
+            violations_mock.status_code = 503
 
-        self.assertEqual(self.aggregator._perform_plate_lookup(
-            campaigns=campaigns,
-            plate_query=plate_query,
-            unique_identifier=unique_identifier), result)
-
-        # Try again with a forced error.
-        violations_mock.status_code = 503
-
-        result = self.aggregator._perform_plate_lookup(
-            campaigns=[],
-            plate_query=plate_query,
-            unique_identifier=unique_identifier)
+            result = self.aggregator._perform_plate_lookup(
+                campaigns=[],
+                plate_query=plate_query,
+                unique_identifier=unique_identifier)
 
         self.assertIsInstance(result, OpenDataServiceResponse)
         self.assertRegex(str(result.message), 'server error when accessing')
@@ -1466,6 +1630,88 @@ class TestTrafficViolationsAggregator(unittest.TestCase):
         self.assertEqual(self.aggregator._create_response(
             request_object), response)
 
+    @mock.patch(
+        'traffic_violations.traffic_violations_aggregator.VehicleLookupStats.get_for_vehicle')
+    def test_query_for_lookup_frequency_and_previous_lookup(self,
+                                                            mocked_get_for_vehicle):
+        plate_query = PlateQuery(
+            created_at='2020-01-01 00:00:00',
+            message_id=1,
+            message_source='status',
+            plate='ABC1234',
+            plate_types=None,
+            state='NY',
+            username='@bdhowald')
+
+        previous_lookup = PlateLookup(plate='ABC1234', state='NY')
+
+        mocked_get_for_vehicle.return_value = VehicleLookupStats(
+            latest_plate_lookup=previous_lookup,
+            num_lookups=3,
+            plate='ABC1234',
+            plate_types='',
+            state='NY')
+
+        self.assertEqual(self.aggregator._query_for_lookup_frequency(plate_query), 3)
+        self.assertIs(
+            self.aggregator._query_for_previous_lookup(plate_query), previous_lookup)
+
+        mocked_get_for_vehicle.assert_called_with(
+            plate='ABC1234', state='NY', plate_types=None)
+
+        # Vehicles that haven't been looked up have no stats.
+        mocked_get_for_vehicle.return_value = None
+
+        self.assertEqual(self.aggregator._query_for_lookup_frequency(plate_query), 0)
+        self.assertIsNone(self.aggregator._query_for_previous_lookup(plate_query))
+
+    @mock.patch(
+        'traffic_violations.traffic_violations_aggregator.TrafficViolationsAggregator._process_valid_vehicle')
+    @mock.patch(
+        'traffic_violations.traffic_violations_aggregator.TrafficViolationsAggregator._detect_campaigns')
+    def test_create_response_looks_up_vehicles_concurrently(self,
+                                                            mocked_detect_campaigns,
+                                                            mocked_process_valid_vehicle):
+        """ Test that the vehicles in a request are looked up at once """
+
+        request_object = AccountActivityAPIStatus(
+            message=TwitterEvent(
+                id=1,
+                created_at=random.randint(1500000000000, 1600000000000),
+                event_id=random.randint(1000000000000000000, 2000000000000000000),
+                event_text='@howsmydrivingny NY:ABC1234 NJ:DEF5678 PA:GHI9012',
+                event_type='status',
+                user_handle='BarackObama',
+                user_id=random.randint(100000000, 1000000000)
+            ),
+            message_source='status'
+        )
+
+        # Each lookup waits for the others to start, so they can only
+        # finish if they run at the same time.
+        all_lookups_started = threading.Barrier(3, timeout=5)
+
+        def process_valid_vehicle(campaigns, request_object, vehicle):
+            all_lookups_started.wait()
+
+            return ValidVehicleResponse(
+                error_on_lookup=False,
+                plate_lookup=None,
+                response_parts=[f'{vehicle.state}:{vehicle.plate}'],
+                success_on_lookup=True)
+
+        mocked_detect_campaigns.return_value = []
+        mocked_process_valid_vehicle.side_effect = process_valid_vehicle
+
+        response = self.aggregator._create_response(request_object)
+
+        self.assertEqual(mocked_process_valid_vehicle.call_count, 3)
+
+        self.assertFalse(response['error_on_lookup'])
+        self.assertEqual(
+            response['response_parts'],
+            [['ny:abc1234'], ['nj:def5678'], ['pa:ghi9012']])
+
     @mock.patch(
         'traffic_violations.traffic_violations_aggregator.TrafficViolationsAggregator._perform_plate_lookup')
     def test_create_response_with_error(self,
@@ -0,0 +1,49 @@
+import ddt
+import json
+import unittest
+
+from traffic_violations.utils.json_utils import iter_json_array
+
+
+def _chunk(body, chunk_size):
+    return [body[start:start + chunk_size] for start in range(0, len(body), chunk_size)]
+
+
+@ddt.ddt
+class TestJsonUtils(unittest.TestCase):
+
+    RECORDS = [
+        {'plate': 'ABC1234', 'state': 'NY', 'summons_number': '1234567890',
+         'violation': 'PHTO SCHOOL ZN SPEED VIOLATION'},
+        {'plate': 'ABC1234', 'precinct': 13, 'street_name': 'Café [Row], "East"'},
+        {'fine_amount': 115.5, 'nested': {'list': [1, 2, {'a': None}]}},
+        12345,
+        'NY',
+        None,
+    ]
+
+    @ddt.data(1, 2, 7, 64, 1 << 16)
+    def test_iter_json_array_across_chunk_boundaries(self, chunk_size):
+        body = json.dumps(self.RECORDS, ensure_ascii=False, indent=1).encode('utf-8')
+
+        self.assertEqual(
+            list(iter_json_array(_chunk(body, chunk_size))), self.RECORDS)
+
+    @ddt.data(b'[]', b'  [ ]  ', b'[\n]')
+    def test_iter_json_array_with_empty_array(self, body):
+        self.assertEqual(list(iter_json_array(_chunk(body, 1))), [])
+
+    def test_iter_json_array_yields_elements_as_they_arrive(self):
+        def chunks():
+            yield b'[{"summons_number": "1"},'
+            yield b' {"summons_number": "2"}'
+            raise AssertionError('read past the element that was asked for')
+
+        records = iter_json_array(chunks())
+
+        self.assertEqual(next(records), {'summons_number': '1'})
+
+    @ddt.data(b'', b'{"plate": "ABC1234"}', b'[1,]', b'[1 2]', b'[{"plate": "ABC1234"}')
+    def test_iter_json_array_with_invalid_json(self, body):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(_chunk(body, 3)))
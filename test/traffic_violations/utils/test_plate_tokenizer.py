@@ -0,0 +1,54 @@
+import ddt
+import random
+import re
+import unittest
+
+from traffic_violations.constants import regexps as regexp_constants
+from traffic_violations.utils.plate_tokenizer import find_plate_strings
+
+# Texts that the tokenizer has to read exactly as PLATE_FORMAT_REGEX does.
+PLATE_STRING_CORPUS = [
+    '',
+    '@HowsMyDrivingNY I love you very much!',
+    '@HowsMyDrivingNY ny:123abcd',
+    '@HowsMyDrivingNY ny:123abcd ca:6vmd948 xx:7kvj935 state:fl plate:d4kdm4',
+    '@HowsMyDrivingNY check: ny: 123abcd',
+    'Good morning: check NY:HJY3401 @HowsMyDrivingNY',
+    '@HowsMyDrivingNY NY:ABC1234:PAS',
+    '@HowsMyDrivingNY ABC1234:NY:PAS,COM',
+    '@HowsMyDrivingNY PAS:NY:ABC1234 COM,PAS:ABC1234:NJ',
+    '@HowsMyDrivingNY ABC1234:PAS:NY PAS,COM,OMT:ny:abc1234',
+    '@HowsMyDrivingNY 99:ABC1234 ABC1234:99 9A:ABC1234',
+    '@HowsMyDrivingNY NY : ABC1234 : PAS and  NJ\t:\tXYZ9876',
+    '@HowsMyDrivingNY NY:ABC:PAS:NJ:XYZ:COM',
+    '@HowsMyDrivingNY XXX,ABC:NY:plate ABCD,EFG:NY:plate ABC,DEFG:NY',
+    '@HowsMyDrivingNY NY:ABC1234:PAS,COMX NY:ABC1234:PAS,CO NY:ABC1234:PAS,',
+    '@HowsMyDrivingNY NY:ABC1234_ _NY:ABC1234 NY:ABC1234é éNY:ABC1234',
+    '@HowsMyDrivingNY NY:ABC1234-PAS NY:ABC1234.',
+    '@HowsMyDrivingNY https://t.co/abc123 http:NY',
+    '@HowsMyDrivingNY NYC:ABC1234 N:ABC1234 NY::ABC1234 :NY: ABC1234:',
+    '@HowsMyDrivingNY ny:٣٣٣ ny:abc²',
+]
+
+
+@ddt.ddt
+class TestPlateTokenizer(unittest.TestCase):
+
+    @ddt.data(*PLATE_STRING_CORPUS)
+    def test_find_plate_strings(self, text):
+        self.assertEqual(
+            find_plate_strings(text),
+            re.findall(regexp_constants.PLATE_FORMAT_REGEX, text))
+
+    def test_find_plate_strings_in_random_text(self):
+        random_generator = random.Random(0)
+        characters = 'aN9Y1,,,:::    _é٣²-/'
+
+        for _ in range(20_000):
+            text = ''.join(random_generator.choice(characters)
+                           for _ in range(random_generator.randint(0, 30)))
+
+            self.assertEqual(
+                find_plate_strings(text),
+                re.findall(regexp_constants.PLATE_FORMAT_REGEX, text),
+                msg=repr(text))
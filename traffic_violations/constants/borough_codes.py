@@ -1,7 +1,14 @@
+from types import MappingProxyType
+
 BOROUGH_CODES = {
     'bronx': ['BRONX', 'BX', 'PBX'],
     'brooklyn': ['BK', 'BROOK', 'K', 'KINGS', 'PK'],
     'manhattan': ['MAH', 'MANHA', 'MN', 'NEUY', 'NY', 'PNY'],
     'queens': ['Q', 'QN', 'QNS', 'QUEEN'],
     'staten island': ['R', 'RICH', 'ST'],
-}
\ No newline at end of file
+}
+
+# reverse index of the above, keeping the first borough listing a code
+BOROUGHS_BY_COUNTY_CODE = MappingProxyType({
+    code: borough for borough, codes in reversed(BOROUGH_CODES.items())
+    for code in codes})
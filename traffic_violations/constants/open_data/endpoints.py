@@ -10,6 +10,9 @@ FISCAL_YEAR_DATABASE_ENDPOINTS = {
   2022: 'https://data.cityofnewyork.us/resource/pvqr-7yc4.json',
 }
 
+# fiscal year datasets that are no longer updated
+CLOSED_FISCAL_YEARS = [2014, 2015, 2016, 2017, 2018, 2019, 2020, 2021]
+
 MEDALLION_ENDPOINT = 'https://data.cityofnewyork.us/resource/rhe8-mgbb.json'
 
 OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT = 'https://data.cityofnewyork.us/resource/uvbq-3m68.json'
\ No newline at end of file
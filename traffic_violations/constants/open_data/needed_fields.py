@@ -1,12 +1,24 @@
-FISCAL_YEAR_DATABASE_NEEDED_FIELDS = ['borough', 'has_date', 'issue_date',
-                                      'summons_number', 'violation',
-                                      'violation_precinct', 'violation_county']
-
-OPEN_PARKING_AND_CAMERA_VIOLATIONS_NEEDED_FIELDS = ['borough', 'county', 'fined',
-                                                    'has_date', 'issue_date', 'paid',
-                                                    'precinct', 'outstanding', 'reduced',
-                                                    'summons_number', 'violation']
-
 OPEN_PARKING_AND_CAMERA_VIOLATIONS_FINE_KEYS = ['amount_due', 'fine_amount',
                                                 'interest_amount', 'payment_amount',
                                                 'penalty_amount', 'reduction_amount']
+
+# raw dataset columns requested via $select: everything the normalizers
+# read when building a Summons
+FISCAL_YEAR_DATABASE_SELECTED_FIELDS = ['intersecting_street', 'issue_date',
+                                        'street_name', 'summons_number',
+                                        'violation_code', 'violation_county',
+                                        'violation_description',
+                                        'violation_precinct']
+
+OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS = ['county', 'issue_date',
+                                                      'precinct', 'summons_number',
+                                                      'violation'] + \
+                                                     OPEN_PARKING_AND_CAMERA_VIOLATIONS_FINE_KEYS
+
+# raw dataset columns identifying a row's vehicle as (plate, state, plate
+# type), requested when several plates are looked up in one query
+FISCAL_YEAR_DATABASE_VEHICLE_FIELDS = ['plate_id', 'registration_state',
+                                       'plate_type']
+
+OPEN_PARKING_AND_CAMERA_VIOLATIONS_VEHICLE_FIELDS = ['plate', 'state',
+                                                     'license_type']
@@ -1,4 +1,5 @@
 from enum import Enum
+from types import MappingProxyType
 
 
 class NYPDBoroughBureau(Enum):
@@ -33,4 +34,9 @@ class NYPDBorough(Enum):
     }
 
 PRECINCTS_BY_BOROUGH = {borough.name.replace('_', ' '): [precinct for grouping in [precinct_list for bureau, precinct_list in borough.value.items(
-    )] for precinct in grouping] for borough in NYPDBorough}
\ No newline at end of file
+    )] for precinct in grouping] for borough in NYPDBorough}
+
+# reverse index of the above, keeping the first borough listing a precinct
+BOROUGHS_BY_PRECINCT = MappingProxyType({
+    precinct: borough for borough, precincts in reversed(PRECINCTS_BY_BOROUGH.items())
+    for precinct in precincts})
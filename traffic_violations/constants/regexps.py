@@ -33,6 +33,7 @@ PLATE_TYPES = ['AGC', 'AGR', 'AMB', 'APP', 'ARG',
                'TRC', 'TRL', 'USC', 'USS', 'VAS',
                'VPL', 'WUG']
 PLATE_TYPES_PATTERN = re.compile(f"^({'|'.join(PLATE_TYPES)})$")
+PLATE_TYPES_SET = frozenset(PLATE_TYPES)
 
 STATE_ABBREVIATIONS = ['99', 'AB', 'AK', 'AL', 'AR',
                        'AZ', 'BC', 'CA', 'CO', 'CT',
@@ -50,6 +51,7 @@ STATE_ABBREVIATIONS = ['99', 'AB', 'AK', 'AL', 'AR',
                        'TX', 'UT', 'VA', 'VI', 'VT',
                        'WA', 'WI', 'WV', 'WY', 'YT']
 STATE_ABBREVIATIONS_PATTERN = re.compile(f"^({'|'.join(STATE_ABBREVIATIONS)})$")
+STATE_ABBREVIATIONS_SET = frozenset(STATE_ABBREVIATIONS)
 
 state_minus_words_regex = r'^(99|AB|AK|AL|AR|AZ|BC|CA|CO|CT|DC|DE|DP|FL|FM|FO|GA|GU|GV|IA|ID|IL|KS|KY|LA|MA|MB|MD|MH|MI|MN|MO|MP|MS|MT|MX|NB|NC|ND|NE|NF|NH|NJ|NM|NS|NT|NU|NV|NY|PA|PE|PR|PW|QC|RI|SC|SD|SK|STATE|TN|TX|UT|VA|VI|VT|WA|WI|WV|WY|YT)$'
 STATE_MINUS_WORDS_PATTERN = re.compile(state_minus_words_regex)
@@ -20,7 +20,8 @@ from traffic_violations.models.response.open_data_service_plate_lookup \
 from traffic_violations.models.response.open_data_service_response \
     import OpenDataServiceResponse
 
-from traffic_violations.services.apis.open_data_service import OpenDataService
+from traffic_violations.services.apis.open_data_service import \
+    OpenDataService, create_open_data_service
 from traffic_violations.services.apis.tweet_detection_service import \
     TweetDetectionService
 from traffic_violations.services.twitter_service import \
@@ -116,31 +117,37 @@ class RecklessDriverRetrospectiveJob(BaseJob):
                       f'between {top_of_the_hour_last_year} and '
                       f'and {top_of_the_next_hour_last_year}.')
 
-        for previous_lookup in lookups_to_update:
+        plate_queries: list[PlateQuery] = [
+            PlateQuery(created_at=now,
+                       message_source=previous_lookup.message_source,
+                       plate=previous_lookup.plate,
+                       plate_types=previous_lookup.plate_types,
+                       state=previous_lookup.state)
+            for previous_lookup in lookups_to_update]
+
+        # Look up the vehicles together, once for the violations before
+        # each previous lookup and once for those in the year after it.
+        nyc_open_data_service: OpenDataService = create_open_data_service()
+        responses_before_query: list[OpenDataServiceResponse] = nyc_open_data_service.look_up_vehicles(
+            plate_queries=plate_queries,
+            time_ranges=[(None, previous_lookup.created_at)
+                         for previous_lookup in lookups_to_update])
+
+        responses_after_query: list[OpenDataServiceResponse] = nyc_open_data_service.look_up_vehicles(
+            plate_queries=plate_queries,
+            time_ranges=[(previous_lookup.created_at,
+                          previous_lookup.created_at + relativedelta(years=1))
+                         for previous_lookup in lookups_to_update])
+
+        for previous_lookup, data_before_query, data_after_query in zip(
+                lookups_to_update, responses_before_query, responses_after_query):
 
             LOG.debug(f'Performing retrospective job for '
                       f'{L10N.VEHICLE_HASHTAG.format(previous_lookup.state, previous_lookup.plate)} ')
 
-            plate_query: PlateQuery = PlateQuery(created_at=now,
-                                                 message_source=previous_lookup.message_source,
-                                                 plate=previous_lookup.plate,
-                                                 plate_types=previous_lookup.plate_types,
-                                                 state=previous_lookup.state)
-
-            nyc_open_data_service: OpenDataService = OpenDataService()
-            data_before_query: OpenDataServiceResponse = nyc_open_data_service.look_up_vehicle(
-                plate_query=plate_query,
-                until=previous_lookup.created_at)
-
             lookup_before_query: OpenDataServicePlateLookup = data_before_query.data
             camera_streak_data_before_query: CameraStreakData = lookup_before_query.camera_streak_data['Mixed']
 
-            data_after_query: OpenDataServiceResponse = nyc_open_data_service.look_up_vehicle(
-                plate_query=plate_query,
-                since=previous_lookup.created_at,
-                until=previous_lookup.created_at + relativedelta(years=1))
-
-
             lookup_after_query: OpenDataServicePlateLookup = data_after_query.data
 
             new_bus_lane_camera_violations: Optional[int] = None
@@ -0,0 +1,46 @@
+import argparse
+import logging
+
+from typing import Optional
+
+from traffic_violations.jobs.base_job import BaseJob
+
+from traffic_violations.services.apis.local_open_data_service import \
+    LocalOpenDataService
+
+LOG = logging.getLogger(__name__)
+
+
+class SyncOpenParkingAndCameraViolationsJob(BaseJob):
+    """ Bring the local copy of Open Parking and Camera Violations up to
+    date with the rows changed since the last sync. """
+
+    def perform(self, *args, **kwargs):
+        since: Optional[str] = kwargs.get('since')
+
+        local_open_data_service = LocalOpenDataService()
+
+        num_synced, num_vehicles = \
+            local_open_data_service.sync_open_parking_and_camera_violations(
+                since=since)
+
+        LOG.info(f'Synced {num_synced} Open Parking and Camera Violations '
+                 f'records for {num_vehicles} vehicles.')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Sync Open Parking and Camera Violations into the local store.')
+
+    parser.add_argument(
+        '--since',
+        help="The ':updated_at' timestamp to start from if the store has never been synced.")
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+
+    job = SyncOpenParkingAndCameraViolationsJob()
+    job.run(since=arguments.since)
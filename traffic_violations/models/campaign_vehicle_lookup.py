@@ -0,0 +1,65 @@
+from typing import Tuple
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, func
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import relationship
+
+from traffic_violations.models.base import Base
+from traffic_violations.models.plate_lookup import PlateLookup
+
+
+class CampaignVehicleLookup(Base):
+    """ Represents the latest lookup of a vehicle tagged with a campaign,
+    counting the lookups that count towards frequency
+    """
+
+    __tablename__ = 'campaign_vehicle_lookups'
+
+    # columns
+    id = Column(Integer, primary_key=True)
+    campaign_id = Column(Integer, ForeignKey('campaigns.id'), nullable=False)
+    latest_plate_lookup_id = Column(Integer, ForeignKey('plate_lookups.id'), nullable=False)
+    num_tickets = Column(Integer, default=0, nullable=False)
+    plate = Column(String(16), nullable=False)
+    state = Column(String(8), nullable=False)
+
+    # associations
+    campaign = relationship('Campaign')
+    latest_plate_lookup = relationship('PlateLookup')
+
+    # indices
+    __table_args__ = (
+        Index('index_campaign_id_plate_state', 'campaign_id', 'plate', 'state', unique=True),
+    )
+
+    @classmethod
+    def get_totals_for_campaign(cls, campaign_id: int) -> Tuple[int, int]:
+        """Return how many vehicles have been tagged with a campaign, and
+        their tickets as of each one's latest lookup with it.
+        """
+        num_vehicles, num_tickets = cls.query.with_entities(
+            func.count(cls.id),
+            func.coalesce(func.sum(cls.num_tickets), 0)).filter(
+                cls.campaign_id == campaign_id).one()
+
+        return int(num_vehicles), int(num_tickets)
+
+    @classmethod
+    def record_lookup(cls, campaign_id: int, plate_lookup: PlateLookup) -> None:
+        """Make a new lookup tied to a campaign its vehicle's latest with the
+        campaign, in the session's current transaction.
+
+        The row is written in a single upsert rather than from what was
+        read before, so that lookups of the same vehicle in other threads
+        or processes can't count it twice.
+        """
+        statement = insert(cls.__table__).values(
+            campaign_id=campaign_id,
+            latest_plate_lookup_id=plate_lookup.id,
+            num_tickets=plate_lookup.num_tickets,
+            plate=plate_lookup.plate,
+            state=plate_lookup.state)
+
+        cls.query.session.execute(statement.on_duplicate_key_update(
+            latest_plate_lookup_id=statement.inserted.latest_plate_lookup_id,
+            num_tickets=statement.inserted.num_tickets))
@@ -0,0 +1,102 @@
+import sys
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class Summons:
+    """ A single normalized parking or camera violation.
+
+    Fine amounts are held in integer cents so that totals over many tickets
+    are exact.
+    """
+
+    __slots__ = ('borough', 'county', 'fined', 'issue_date', 'outstanding',
+                 'paid', 'precinct', 'reduced', 'summons_number', 'violation')
+
+    borough: Optional[str]
+    county: Optional[str]
+    fined: int
+    issue_date: Optional[datetime]
+    outstanding: int
+    paid: int
+    precinct: Optional[int]
+    reduced: int
+    summons_number: Any
+    violation: Optional[str]
+
+    @classmethod
+    def create(cls,
+               summons_number: Any,
+               borough: Optional[str] = None,
+               county: Optional[str] = None,
+               fined: int = 0,
+               issue_date: Optional[datetime] = None,
+               outstanding: int = 0,
+               paid: int = 0,
+               precinct: Optional[int] = None,
+               reduced: int = 0,
+               violation: Optional[str] = None) -> 'Summons':
+        # Boroughs and violation descriptions repeat across most tickets,
+        # so share a single copy of each string.
+        return cls(
+            borough=sys.intern(borough) if borough is not None else None,
+            county=county,
+            fined=fined,
+            issue_date=issue_date,
+            outstanding=outstanding,
+            paid=paid,
+            precinct=precinct,
+            reduced=reduced,
+            summons_number=summons_number,
+            violation=sys.intern(violation) if violation is not None else None)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'Summons':
+        return cls.create(
+            **{**data,
+               'issue_date': (datetime.fromisoformat(data['issue_date'])
+                              if data.get('issue_date') else None)})
+
+    @staticmethod
+    def to_cents(amount: Any) -> int:
+        """Convert a dollar amount from the open data portal to cents."""
+        try:
+            return int(round(Decimal(str(amount)) * 100))
+        except InvalidOperation as exc:
+            raise ValueError(f'invalid dollar amount: {amount}') from exc
+
+    @property
+    def has_date(self) -> bool:
+        return self.issue_date is not None
+
+    def merge(self, other: 'Summons') -> 'Summons':
+        """Combine two records of the same summons, preferring the other
+        record's location, date and description, while keeping this
+        record's fines.
+        """
+        return replace(
+            self,
+            borough=(other.borough if other.borough is not None
+                     else 'No Borough Available'),
+            county=other.county,
+            issue_date=other.issue_date,
+            precinct=other.precinct,
+            violation=(other.violation if other.violation is not None
+                       else 'No Violation Description Available'))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'borough': self.borough,
+            'county': self.county,
+            'fined': self.fined,
+            'issue_date': self.issue_date.isoformat() if self.issue_date else None,
+            'outstanding': self.outstanding,
+            'paid': self.paid,
+            'precinct': self.precinct,
+            'reduced': self.reduced,
+            'summons_number': self.summons_number,
+            'violation': self.violation}
@@ -0,0 +1,38 @@
+from sqlalchemy import BigInteger, Column, Integer, func, select
+
+import traffic_violations.db.database as db
+
+from traffic_violations.models.base import Base
+
+
+class UniqueIdentifierSequence(Base):
+    """ Represents the sequence that the unique identifiers of plate lookups
+    are encoded from
+    """
+
+    __tablename__ = 'unique_identifier_sequence'
+
+    # The sequence's single row.
+    SEQUENCE_ID = 1
+
+    # columns
+    id = Column(Integer, primary_key=True)
+    next_value = Column(BigInteger, default=0, nullable=False)
+
+    @classmethod
+    def reserve_block(cls, size: int) -> int:
+        """Reserve the next size values of the sequence, returning the first.
+
+        The row is updated in a transaction of its own, so that it isn't
+        locked for the rest of the caller's.
+        """
+        table = cls.__table__
+
+        with db.init_database().engine.begin() as connection:
+            connection.execute(
+                table.update().where(table.c.id == cls.SEQUENCE_ID).values(
+                    next_value=func.last_insert_id(table.c.next_value + size)))
+
+            next_value: int = connection.execute(select(func.last_insert_id())).scalar()
+
+        return next_value - size
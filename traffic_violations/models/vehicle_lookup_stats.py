@@ -0,0 +1,75 @@
+from typing import Optional
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, case, func
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import relationship
+
+from traffic_violations.models.base import Base
+from traffic_violations.models.plate_lookup import PlateLookup
+
+
+class VehicleLookupStats(Base):
+    """ Represents how often a vehicle has been looked up, and its latest
+    lookup, counting the lookups that count towards frequency
+    """
+
+    __tablename__ = 'vehicle_lookup_stats'
+
+    # columns
+    id = Column(Integer, primary_key=True)
+    # The created_at of the latest lookup, to tell whether a new lookup is
+    # later than it.
+    latest_created_at = Column(DateTime, nullable=False)
+    latest_plate_lookup_id = Column(Integer, ForeignKey('plate_lookups.id'), nullable=False)
+    num_lookups = Column(Integer, default=0, nullable=False)
+    plate = Column(String(16), nullable=False)
+    # '' rather than NULL for lookups without plate types, so that each
+    # vehicle has a single row under the unique index.
+    plate_types = Column(String(255), default='', nullable=False)
+    state = Column(String(8), nullable=False)
+
+    # associations
+    latest_plate_lookup = relationship('PlateLookup')
+
+    # indices
+    __table_args__ = (
+        Index('index_plate_state_plate_types', 'plate', 'state', 'plate_types', unique=True),
+    )
+
+    @classmethod
+    def get_for_vehicle(cls,
+                        plate: str,
+                        state: str,
+                        plate_types: Optional[str]) -> Optional['VehicleLookupStats']:
+        return cls.get_by(plate=plate, state=state, plate_types=plate_types or '')
+
+    @classmethod
+    def record_lookup(cls, plate_lookup: PlateLookup) -> None:
+        """Count a new lookup in its vehicle's stats, in the session's
+        current transaction, creating them for a vehicle's first lookup.
+
+        The new lookup only becomes the latest if it was created no earlier
+        than the current latest, since lookups made at the same time may
+        be saved in either order.
+        """
+        table = cls.__table__
+
+        statement = insert(table).values(
+            latest_created_at=plate_lookup.created_at,
+            latest_plate_lookup_id=plate_lookup.id,
+            num_lookups=1,
+            plate=plate_lookup.plate,
+            plate_types=plate_lookup.plate_types or '',
+            state=plate_lookup.state)
+
+        is_latest = statement.inserted.latest_created_at >= table.c.latest_created_at
+
+        # MySQL applies these in order, so the latest lookup is chosen
+        # before its created_at is moved on.
+        cls.query.session.execute(statement.on_duplicate_key_update([
+            ('latest_plate_lookup_id',
+             case((is_latest, statement.inserted.latest_plate_lookup_id),
+                  else_=table.c.latest_plate_lookup_id)),
+            ('latest_created_at',
+             func.greatest(table.c.latest_created_at, statement.inserted.latest_created_at)),
+            ('num_lookups', table.c.num_lookups + 1)]))
@@ -15,7 +15,8 @@ from traffic_violations.models.plate_query import PlateQuery
 from traffic_violations.models.response.open_data_service_response \
     import OpenDataServiceResponse
 
-from traffic_violations.services.apis.open_data_service import OpenDataService
+from traffic_violations.services.apis.open_data_service import \
+    OpenDataService, create_open_data_service
 
 LOG = logging.getLogger(__name__)
 
@@ -61,18 +62,21 @@ class BackfillCameraViolationsJob(BaseJob):
 
     def update_lookups(self, lookups: list[PlateLookup]):
 
-        for previous_lookup in lookups:
-            plate_query: PlateQuery = PlateQuery(created_at=previous_lookup.created_at,
-                                                 message_source=previous_lookup.message_source,
-                                                 plate=previous_lookup.plate,
-                                                 plate_types=previous_lookup.plate_types,
-                                                 state=previous_lookup.state)
-
-            nyc_open_data_service: OpenDataService = OpenDataService()
-            open_data_response: OpenDataServiceResponse = nyc_open_data_service.look_up_vehicle(
-                plate_query=plate_query,
-                until=previous_lookup.created_at)
-
+        plate_queries: list[PlateQuery] = [
+            PlateQuery(created_at=previous_lookup.created_at,
+                       message_source=previous_lookup.message_source,
+                       plate=previous_lookup.plate,
+                       plate_types=previous_lookup.plate_types,
+                       state=previous_lookup.state)
+            for previous_lookup in lookups]
+
+        nyc_open_data_service: OpenDataService = create_open_data_service()
+        open_data_responses: list[OpenDataServiceResponse] = nyc_open_data_service.look_up_vehicles(
+            plate_queries=plate_queries,
+            time_ranges=[(None, previous_lookup.created_at)
+                         for previous_lookup in lookups])
+
+        for previous_lookup, open_data_response in zip(lookups, open_data_responses):
             open_data_plate_lookup: OpenDataServicePlateLookup = open_data_response.data
 
             for violation_type_summary in open_data_plate_lookup.violations:
@@ -0,0 +1,90 @@
+import argparse
+import logging
+
+from sqlalchemy.dialects.mysql import insert
+
+from traffic_violations.jobs.base_job import BaseJob
+
+# Campaign is needed to map PlateLookup's relationships.
+from traffic_violations.models.campaign import Campaign  # pylint: disable=unused-import
+from traffic_violations.models.campaign_plate_lookup import CampaignPlateLookup
+from traffic_violations.models.campaign_vehicle_lookup import CampaignVehicleLookup
+from traffic_violations.models.plate_lookup import PlateLookup
+
+LOG = logging.getLogger(__name__)
+
+
+class BackfillCampaignVehicleLookupsJob(BaseJob):
+    """ Recompute the latest lookup of every vehicle tagged with each
+    campaign from the campaign's plate lookups.
+
+    Lookups made once this is deployed are recorded as they are saved, so
+    run it after deploying; it is safe to run again to correct them.
+    """
+
+    ROWS_PER_FETCH = 10_000
+    ROWS_PER_INSERT = 1_000
+
+    def perform(self, *args, **kwargs):
+        is_dry_run: bool = kwargs.get('is_dry_run') or False
+
+        session = PlateLookup.query.session
+
+        # Walk each campaign's lookups in the order they were made, so that
+        # the last seen for a vehicle is its latest.
+        campaign_lookups = session.query(
+            CampaignPlateLookup.c.campaign_id,
+            PlateLookup.id,
+            PlateLookup.num_tickets,
+            PlateLookup.plate,
+            PlateLookup.state).join(
+                PlateLookup, PlateLookup.id == CampaignPlateLookup.c.plate_lookup_id).filter(
+                    PlateLookup.count_towards_frequency == True).order_by(
+                        PlateLookup.created_at, PlateLookup.id).yield_per(self.ROWS_PER_FETCH)
+
+        latest_lookups: dict[tuple[int, str, str], dict] = {}
+
+        for campaign_id, plate_lookup_id, num_tickets, plate, state in campaign_lookups:
+            latest_lookups[(campaign_id, plate, state)] = {
+                'campaign_id': campaign_id,
+                'latest_plate_lookup_id': plate_lookup_id,
+                'num_tickets': num_tickets,
+                'plate': plate,
+                'state': state}
+
+        rows: list[dict] = list(latest_lookups.values())
+
+        LOG.info(f'Found {len(rows)} vehicles tagged with campaigns')
+        print(f'Found {len(rows)} vehicles tagged with campaigns')
+
+        if is_dry_run:
+            return
+
+        for chunk_start in range(0, len(rows), self.ROWS_PER_INSERT):
+            statement = insert(CampaignVehicleLookup.__table__).values(
+                rows[chunk_start:chunk_start + self.ROWS_PER_INSERT])
+
+            session.execute(statement.on_duplicate_key_update(
+                latest_plate_lookup_id=statement.inserted.latest_plate_lookup_id,
+                num_tickets=statement.inserted.num_tickets))
+
+        session.commit()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Job that backfills the latest lookup of every vehicle tagged with a campaign')
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help="Don't save results")
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+
+    job = BackfillCampaignVehicleLookupsJob()
+    job.run(is_dry_run=arguments.dry_run)
@@ -3,8 +3,6 @@ import math
 
 import os
 import logging
-import random
-import string
 import threading
 
 from sqlalchemy import and_
@@ -19,6 +17,8 @@ from traffic_violations.models.plate_lookup import PlateLookup
 #     import OpenDataServiceResponse
 
 # from traffic_violations.services.apis.open_data_service import OpenDataService
+from traffic_violations.services.unique_identifier_allocator import \
+    get_unique_identifier_allocator
 
 LOG = logging.getLogger(__name__)
 
@@ -30,8 +30,6 @@ class BackfillUniqueIdentifiersJob(BaseJob):
                          'Failure To Stop At Red Light',
                          'School Zone Speed Camera Violation']
 
-    UNIQUE_IDENTIFIER_STRING_LENGTH = 8
-
     def perform(self, *args, **kwargs):
         is_dry_run: bool = kwargs.get('is_dry_run') or False
 
@@ -42,15 +40,9 @@ class BackfillUniqueIdentifiersJob(BaseJob):
         chunk_length = math.ceil(num_records/num_threads)
 
         plate_lookups = PlateLookup.query.filter(PlateLookup.unique_identifier == None).all()
-        unique_identifiers = {}
-
-        for i in range(0, len(plate_lookups)):
-            random_string = self._generate_unique_identifier()
-            while unique_identifiers.get(random_string):
-                random_string = self._generate_unique_identifier()
-            unique_identifiers[random_string] = random_string
 
-        unique_identifiers_list = [key for key in unique_identifiers.keys()]
+        unique_identifiers_list = get_unique_identifier_allocator().allocate_many(
+            count=len(plate_lookups))
 
         for n in range(0, num_threads):
             chunk_begin = n * chunk_length
@@ -69,11 +61,6 @@ class BackfillUniqueIdentifiersJob(BaseJob):
         if not is_dry_run:
             PlateLookup.query.session.commit()
 
-    def _generate_unique_identifier(self):
-        return ''.join(
-            random.SystemRandom().choice(
-              string.ascii_lowercase + string.digits) for _ in range(self.UNIQUE_IDENTIFIER_STRING_LENGTH))
-
     def _update_lookups(self, identifiers: list[str], lookups: list[PlateLookup], is_dry_run: bool):
         for i in range(0, len(lookups)):
             lookups[i].unique_identifier = identifiers[i]
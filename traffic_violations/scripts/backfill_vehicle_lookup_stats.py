@@ -0,0 +1,104 @@
+import argparse
+import logging
+
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.mysql import insert
+
+from traffic_violations.jobs.base_job import BaseJob
+
+# Campaign is needed to map PlateLookup's relationships.
+from traffic_violations.models.campaign import Campaign  # pylint: disable=unused-import
+from traffic_violations.models.plate_lookup import PlateLookup
+from traffic_violations.models.vehicle_lookup_stats import VehicleLookupStats
+
+LOG = logging.getLogger(__name__)
+
+
+class BackfillVehicleLookupStatsJob(BaseJob):
+    """ Recompute the lookup stats of every vehicle from its plate lookups.
+
+    Lookups made once this is deployed are counted as they are saved, so
+    run it after deploying; it is safe to run again to correct the stats.
+    """
+
+    ROWS_PER_INSERT = 1_000
+
+    def perform(self, *args, **kwargs):
+        is_dry_run: bool = kwargs.get('is_dry_run') or False
+
+        session = PlateLookup.query.session
+
+        plate_types = func.coalesce(PlateLookup.plate_types, '')
+        counts_towards_frequency = PlateLookup.count_towards_frequency == True
+
+        vehicles = session.query(
+            PlateLookup.plate,
+            PlateLookup.state,
+            plate_types.label('plate_types'),
+            func.count(PlateLookup.id).label('num_lookups'),
+            func.max(PlateLookup.created_at).label('latest_created_at')).filter(
+                counts_towards_frequency).group_by(
+                    PlateLookup.plate, PlateLookup.state, plate_types).subquery('vehicles')
+
+        # The latest lookup is the most recently created, and of those
+        # created at the same time, the last saved.
+        rows = session.query(
+            vehicles.c.plate,
+            vehicles.c.state,
+            vehicles.c.plate_types,
+            vehicles.c.num_lookups,
+            vehicles.c.latest_created_at,
+            func.max(PlateLookup.id).label('latest_plate_lookup_id')).join(
+                PlateLookup,
+                and_(PlateLookup.plate == vehicles.c.plate,
+                     PlateLookup.state == vehicles.c.state,
+                     plate_types == vehicles.c.plate_types,
+                     PlateLookup.created_at == vehicles.c.latest_created_at,
+                     counts_towards_frequency)).group_by(
+                         vehicles.c.plate,
+                         vehicles.c.state,
+                         vehicles.c.plate_types,
+                         vehicles.c.num_lookups,
+                         vehicles.c.latest_created_at).all()
+
+        LOG.info(f'Found {len(rows)} vehicles with lookups')
+        print(f'Found {len(rows)} vehicles with lookups')
+
+        if is_dry_run:
+            return
+
+        for chunk_start in range(0, len(rows), self.ROWS_PER_INSERT):
+            statement = insert(VehicleLookupStats.__table__).values([
+                {'latest_created_at': row.latest_created_at,
+                 'latest_plate_lookup_id': row.latest_plate_lookup_id,
+                 'num_lookups': row.num_lookups,
+                 'plate': row.plate,
+                 'plate_types': row.plate_types,
+                 'state': row.state}
+                for row in rows[chunk_start:chunk_start + self.ROWS_PER_INSERT]])
+
+            session.execute(statement.on_duplicate_key_update(
+                latest_created_at=statement.inserted.latest_created_at,
+                latest_plate_lookup_id=statement.inserted.latest_plate_lookup_id,
+                num_lookups=statement.inserted.num_lookups))
+
+        session.commit()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Job that backfills the lookup stats of every vehicle')
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help="Don't save results")
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+
+    job = BackfillVehicleLookupStatsJob()
+    job.run(is_dry_run=arguments.dry_run)
@@ -0,0 +1,174 @@
+import argparse
+import csv
+import logging
+
+from typing import Iterator, Optional, Tuple
+
+from traffic_violations.jobs.base_job import BaseJob
+
+from traffic_violations.models.geocode import Geocode
+
+from traffic_violations.services.street_gazetteer import StreetGazetteer
+
+LOG = logging.getLogger(__name__)
+
+
+class BuildStreetGazetteerJob(BaseJob):
+    """ Rebuild the street gazetteer from the geocodes table and street name
+    lists, and report how many geocodes it can answer.
+    """
+
+    # Borough codes used by city street name lists, named as the geocoder
+    # names them.
+    BOROUGH_NAMES = {
+        '1': 'Manhattan', 'MN': 'Manhattan',
+        '2': 'Bronx', 'BX': 'Bronx',
+        '3': 'Brooklyn', 'BK': 'Brooklyn',
+        '4': 'Queens', 'QN': 'Queens',
+        '5': 'Staten Island', 'SI': 'Staten Island'}
+
+    def perform(self, *args, **kwargs):
+        holdout_every: int = kwargs.get('holdout_every') or 0
+        output_path: str = kwargs['output_path']
+        street_list_paths: list[str] = kwargs.get('street_list_paths') or []
+
+        gazetteer = StreetGazetteer()
+
+        for path in street_list_paths:
+            num_streets: int = 0
+            for street, borough in self._read_street_list(path=path):
+                # A street name list is authoritative, so its streets are
+                # trusted as if seen often enough in their boroughs.
+                gazetteer.add(street=street, borough=borough,
+                              count=StreetGazetteer.MIN_SIGHTINGS)
+                num_streets += 1
+
+            LOG.info(f'Loaded {num_streets} streets from {path}')
+
+        geocodes: list[Tuple[int, str, str]] = [
+            (geocode.id, geocode.lookup_string, geocode.borough)
+            for geocode in Geocode.iter_all()]
+
+        # Geocodes held out of the build measure how well it answers
+        # locations it hasn't seen, and are added afterwards.
+        held_out: list[Tuple[int, str, str]] = [
+            geocode for geocode in geocodes
+            if holdout_every and geocode[0] % holdout_every == 0]
+
+        num_unsplit: int = self._add_geocodes(
+            gazetteer=gazetteer,
+            geocodes=[geocode for geocode in geocodes
+                      if not holdout_every or geocode[0] % holdout_every != 0])
+
+        if held_out:
+            self._report_coverage(gazetteer=gazetteer, geocodes=held_out)
+
+        num_unsplit += self._add_geocodes(gazetteer=gazetteer, geocodes=held_out)
+
+        gazetteer.save(path=output_path)
+
+        print(f'Saved {gazetteer.num_streets} streets to {output_path}')
+        print(f'{num_unsplit} of {len(geocodes)} geocodes did not start '
+              f'with a known street and were left out')
+
+    def _add_geocodes(self,
+                      gazetteer: StreetGazetteer,
+                      geocodes: list[Tuple[int, str, str]]) -> int:
+        """Add geocodes to the gazetteer, returning how many of them couldn't
+        be split into streets.
+        """
+        # Geocodes of a lone street come first, so that the streets are
+        # known when splitting those of intersections, and intersections
+        # are tried again while their streets are learned from others.
+        unsplit: list[Tuple[int, str, str]] = sorted(
+            geocodes, key=lambda geocode: not geocode[1].endswith(
+                f' {StreetGazetteer.LOOKUP_STRING_SUFFIX}'))
+
+        num_unsplit: Optional[int] = None
+        while num_unsplit != len(unsplit):
+            num_unsplit = len(unsplit)
+            unsplit = [geocode for geocode in unsplit
+                       if not gazetteer.add_lookup_string(
+                           lookup_string=geocode[1], borough=geocode[2])]
+
+        return len(unsplit)
+
+    def _read_street_list(self, path: str) -> Iterator[Tuple[str, str]]:
+        """Read (street, borough) pairs from a CSV file with street_name and
+        borough columns, where borough is a name or a city borough code.
+        """
+        with open(path, newline='') as csv_file:
+            for row in csv.DictReader(csv_file):
+                borough: str = row['borough'].strip()
+
+                yield row['street_name'], self.BOROUGH_NAMES.get(borough.upper(), borough)
+
+    def _report_coverage(self,
+                         gazetteer: StreetGazetteer,
+                         geocodes: list[Tuple[int, str, str]]) -> None:
+        num_correct: int = 0
+        num_incorrect: int = 0
+
+        for _, lookup_string, borough in geocodes:
+            streets: Optional[Tuple[str, str]] = gazetteer.split_lookup_string(
+                lookup_string=lookup_string)
+
+            found_borough: Optional[str] = (
+                gazetteer.find_borough(location_parts=streets) if streets else None)
+
+            if found_borough is None:
+                continue
+
+            if found_borough.lower() == borough.lower():
+                num_correct += 1
+            else:
+                num_incorrect += 1
+
+        num_answered: int = num_correct + num_incorrect
+        num_unanswered: int = len(geocodes) - num_answered
+
+        for description, count in [('answered correctly', num_correct),
+                                   ('answered incorrectly', num_incorrect),
+                                   ('left to the geocoder', num_unanswered)]:
+            print(f'{description}: {count} of {len(geocodes)} held out geocodes '
+                  f'({count / len(geocodes):.1%})')
+
+        if num_answered:
+            print(f'incorrect rate at {StreetGazetteer.MIN_SIGHTINGS} minimum sightings: '
+                  f'{num_incorrect} of {num_answered} answers '
+                  f'({num_incorrect / num_answered:.1%})')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Job that rebuilds the street gazetteer and reports its coverage.')
+
+    parser.add_argument(
+        '--holdout-every',
+        default=10,
+        type=int,
+        help="Measure coverage on every nth geocode, left out of the build "
+             "until then (0 to skip).")
+
+    parser.add_argument(
+        '--output-path',
+        required=True,
+        help="Where to write the gazetteer, to be set as STREET_GAZETTEER_PATH.")
+
+    parser.add_argument(
+        '--street-list',
+        action='append',
+        dest='street_list_paths',
+        help="A CSV file of street_name and borough columns (may be repeated).")
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+
+    job = BuildStreetGazetteerJob()
+    job.run(
+        holdout_every=arguments.holdout_every,
+        output_path=arguments.output_path,
+        street_list_paths=arguments.street_list_paths)
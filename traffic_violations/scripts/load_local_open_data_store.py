@@ -0,0 +1,100 @@
+import argparse
+import csv
+import logging
+
+from typing import Any, Iterator
+
+from traffic_violations.constants.open_data.endpoints import \
+    FISCAL_YEAR_DATABASE_ENDPOINTS, MEDALLION_ENDPOINT, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT
+
+from traffic_violations.jobs.base_job import BaseJob
+
+from traffic_violations.services.apis.local_open_data_service import \
+    LocalOpenDataService
+from traffic_violations.services.local_open_data_store import \
+    LocalOpenDataStore
+
+from traffic_violations.utils.json_utils import iter_json_array
+
+LOG = logging.getLogger(__name__)
+
+DATASET_ENDPOINTS: dict[str, str] = {
+    'medallion': MEDALLION_ENDPOINT,
+    'opacv': OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT,
+    **{str(year): endpoint for year, endpoint in FISCAL_YEAR_DATABASE_ENDPOINTS.items()},
+}
+
+
+class LoadLocalOpenDataStoreJob(BaseJob):
+    """ Load exported open data dataset files into the local store """
+
+    JSON_CHUNK_SIZE = 1 << 16
+
+    def perform(self, *args, **kwargs):
+        dataset: str = kwargs['dataset']
+        paths: list[str] = kwargs['paths']
+        store_path: str = kwargs['store_path']
+
+        endpoint: str = DATASET_ENDPOINTS[dataset]
+
+        local_open_data_service = LocalOpenDataService(
+            local_open_data_store=LocalOpenDataStore(path=store_path))
+
+        for path in paths:
+            num_written: int = local_open_data_service.load_records(
+                endpoint=endpoint, records=self._read_records(path=path))
+
+            LOG.info(f'Loaded {num_written} {dataset} records from {path}')
+            print(f'Loaded {num_written} {dataset} records from {path}')
+
+        local_open_data_service.local_open_data_store.close()
+
+    def _read_records(self, path: str) -> Iterator[dict[str, Any]]:
+        """Read the records of an export from the dataset's API endpoint,
+        either as CSV (with field names as headers) or as a JSON array.
+        """
+        if path.endswith('.json'):
+            with open(path, 'rb') as json_file:
+                yield from iter_json_array(
+                    iter(lambda: json_file.read(self.JSON_CHUNK_SIZE), b''))
+        else:
+            with open(path, newline='') as csv_file:
+                # CSV can't tell null cells from empty ones, so read them
+                # as null, which the portal leaves out of its responses.
+                for record in csv.DictReader(csv_file):
+                    yield {field: value if value != '' else None
+                           for field, value in record.items()}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Job that loads exported open data files into the local store.')
+
+    parser.add_argument(
+        '--dataset',
+        choices=list(DATASET_ENDPOINTS),
+        required=True,
+        help="The dataset the files were exported from.")
+
+    parser.add_argument(
+        '--store-path',
+        required=True,
+        help="The path of the local store's SQLite file.")
+
+    parser.add_argument(
+        'paths',
+        nargs='+',
+        help="CSV or JSON files exported from the dataset's API endpoint.")
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+
+    job = LoadLocalOpenDataStoreJob()
+    job.run(
+        dataset=arguments.dataset,
+        paths=arguments.paths,
+        store_path=arguments.store_path)
@@ -0,0 +1,292 @@
+import logging
+import os
+
+from datetime import datetime
+from typing import Any, Hashable, Iterable, Iterator, Optional, Tuple
+
+from traffic_violations.constants.open_data.endpoints import \
+    FISCAL_YEAR_DATABASE_ENDPOINTS, MEDALLION_ENDPOINT, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT
+from traffic_violations.constants.open_data.needed_fields import \
+    FISCAL_YEAR_DATABASE_SELECTED_FIELDS, \
+    FISCAL_YEAR_DATABASE_VEHICLE_FIELDS, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_VEHICLE_FIELDS
+
+from traffic_violations.models.plate_query import PlateQuery
+from traffic_violations.models.response.open_data_service_response import \
+    OpenDataServiceResponse
+from traffic_violations.models.summons import Summons
+
+from traffic_violations.services.apis.open_data_service import \
+    OpenDataService, get_plate_lookup_cache
+from traffic_violations.services.local_open_data_store import \
+    LocalOpenDataStore
+from traffic_violations.services.plate_lookup_cache import PlateLookupCache
+
+LOG = logging.getLogger(__name__)
+
+_LOCAL_OPEN_DATA_STORE = None
+
+
+def get_local_open_data_store() -> Optional[LocalOpenDataStore]:
+    """Return the process-wide local open data store, if one has been
+    configured with LOCAL_OPEN_DATA_STORE_PATH.
+    """
+    global _LOCAL_OPEN_DATA_STORE  # pylint: disable=global-statement
+    if not _LOCAL_OPEN_DATA_STORE:
+        store_path: Optional[str] = os.getenv('LOCAL_OPEN_DATA_STORE_PATH')
+        if store_path:
+            _LOCAL_OPEN_DATA_STORE = LocalOpenDataStore(path=store_path)
+
+    return _LOCAL_OPEN_DATA_STORE
+
+
+class LocalOpenDataService(OpenDataService):
+    """ Answer vehicle lookups from a local mirror of the open data
+    datasets rather than from the live portal.
+
+    The raw records are read from a LocalOpenDataStore and then go through
+    the same normalization as the portal's responses, so lookups return the
+    same results. The store may be loaded or synced by another process, so
+    before each lookup, the cached lookups of the vehicles it has changed
+    since are dropped.
+    """
+
+    # For each mirrored dataset: the fields that together identify a
+    # record, its plate and state fields, and the fields worth keeping
+    # (None to keep all of them).
+    DATASET_FIELDS: dict[str, Tuple[list[str], str, Optional[str], Optional[list[str]]]] = {
+        MEDALLION_ENDPOINT: (
+            ['license_number', OpenDataService.MEDALLION_PLATE_KEY],
+            'license_number',
+            None,
+            None),
+        OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT: (
+            ['summons_number'],
+            OPEN_PARKING_AND_CAMERA_VIOLATIONS_VEHICLE_FIELDS[0],
+            OPEN_PARKING_AND_CAMERA_VIOLATIONS_VEHICLE_FIELDS[1],
+            (OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS +
+             OPEN_PARKING_AND_CAMERA_VIOLATIONS_VEHICLE_FIELDS)),
+        **{endpoint: (
+            ['summons_number'],
+            FISCAL_YEAR_DATABASE_VEHICLE_FIELDS[0],
+            FISCAL_YEAR_DATABASE_VEHICLE_FIELDS[1],
+            FISCAL_YEAR_DATABASE_SELECTED_FIELDS + FISCAL_YEAR_DATABASE_VEHICLE_FIELDS)
+           for endpoint in FISCAL_YEAR_DATABASE_ENDPOINTS.values()},
+    }
+
+    # Socrata's system field holding when a row last changed.
+    UPDATED_AT_FIELD = ':updated_at'
+
+    def __init__(self,
+                 local_open_data_store: Optional[LocalOpenDataStore] = None):
+        super().__init__()
+
+        # Every dataset is already local, so there is nothing to cache.
+        self.fiscal_year_database_cache = None
+
+        self.local_open_data_store: Optional[LocalOpenDataStore] = (
+            local_open_data_store or get_local_open_data_store())
+
+        if self.local_open_data_store is None:
+            raise ValueError(
+                'LOCAL_OPEN_DATA_STORE_PATH must be set to use the local open data service')
+
+    def load_records(self,
+                     endpoint: str,
+                     records: Iterable[dict[str, Any]]) -> int:
+        """Add raw records from one of the datasets to the local store,
+        returning the number written.
+        """
+        key_fields, plate_field, state_field, kept_fields = self.DATASET_FIELDS[endpoint]
+
+        # Drop null values, as the portal leaves them out of its responses,
+        # along with any fields the lookups don't use. Empty strings are
+        # kept, since some of them (an empty violation, say) mean something.
+        trimmed_records: Iterator[dict[str, Any]] = (
+            {field: value for field, value in record.items()
+             if value is not None and
+                (kept_fields is None or field in kept_fields)}
+            for record in records)
+
+        def update_vehicle_totals(vehicles: set[Tuple[str, str]]) -> None:
+            self.local_open_data_store.set_vehicle_totals(
+                dataset=endpoint,
+                totals_by_vehicle={
+                    (plate, state): self._calculate_vehicle_totals(
+                        endpoint=endpoint, plate=plate, state=state)
+                    for plate, state in vehicles})
+
+        # Open Parking and Camera Violations totals are kept current with
+        # each batch written.
+        return self.local_open_data_store.load_records(
+            dataset=endpoint,
+            records=trimmed_records,
+            key_fields=key_fields,
+            plate_field=plate_field,
+            state_field=state_field,
+            on_batch_written=(update_vehicle_totals
+                              if endpoint == OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT
+                              else None))
+
+    def get_vehicle_totals(self, plate: str, state: str) -> Optional[dict[str, int]]:
+        """Return a vehicle's number of Open Parking and Camera Violations
+        and its fines in cents, as of the latest load or sync, or None if it
+        has none.
+        """
+        return self.local_open_data_store.get_vehicle_totals(
+            dataset=OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT, plate=plate, state=state)
+
+    def look_up_vehicle(self,
+                        plate_query: PlateQuery,
+                        since: datetime = None,
+                        until: datetime = None,
+                        use_cache: bool = True) -> OpenDataServiceResponse:
+        self._invalidate_changed_lookups()
+
+        return super().look_up_vehicle(
+            plate_query=plate_query, since=since, until=until, use_cache=use_cache)
+
+    def sync_open_parking_and_camera_violations(self,
+                                                since: Optional[str] = None) -> Tuple[int, int]:
+        """Pull the Open Parking and Camera Violations rows that have changed
+        since the stored watermark into the local store, updating the totals
+        of each vehicle they belong to.
+
+        since, an ':updated_at' timestamp, is where a store's first sync
+        starts. Returns (records synced, vehicles changed).
+        """
+        endpoint: str = OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT
+
+        watermark: Optional[str] = self.local_open_data_store.get_watermark(
+            dataset=endpoint) or since
+
+        if watermark is None:
+            raise ValueError(
+                f'No watermark for {endpoint}, so a starting point is needed')
+
+        plate_field, state_field, _ = self._get_vehicle_fields(endpoint=endpoint)
+
+        # Rows changed at exactly the watermark may not all have been seen,
+        # so fetch them again. Upserting them twice is harmless.
+        query_string: str = (
+            f'{endpoint}?'
+            f"$select={','.join([self.UPDATED_AT_FIELD] + self.DATASET_FIELDS[endpoint][3])}&"
+            f'$where={self.UPDATED_AT_FIELD}%20>=%20%27{watermark}%27')
+
+        LOG.debug(f'Syncing {endpoint} from {watermark}')
+
+        num_synced: int = 0
+        new_watermark: str = watermark
+        changed_vehicles: set[Tuple[str, str]] = set()
+
+        def track_changes(records: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+            nonlocal new_watermark
+
+            for record in records:
+                updated_at: Optional[str] = record.get(self.UPDATED_AT_FIELD)
+                if updated_at is not None and updated_at > new_watermark:
+                    new_watermark = updated_at
+
+                if record.get(plate_field) and record.get(state_field):
+                    changed_vehicles.add((record[plate_field], record[state_field]))
+
+                yield record
+
+        # Records are stored as they are decoded, noting the latest change
+        # and the vehicles changed along the way.
+        for _, records in self._perform_paged_queries(query_strings=[query_string]):
+            num_synced += self.load_records(
+                endpoint=endpoint, records=track_changes(records))
+
+        # Only advance once every changed row is stored, so that an
+        # interrupted sync starts over from the same point.
+        self.local_open_data_store.set_watermark(
+            dataset=endpoint, updated_at=new_watermark)
+
+        LOG.debug(
+            f'Synced {num_synced} records for {len(changed_vehicles)} vehicles '
+            f'from {endpoint} up to {new_watermark}')
+
+        return num_synced, len(changed_vehicles)
+
+    def _calculate_vehicle_totals(self,
+                                  endpoint: str,
+                                  plate: str,
+                                  state: str) -> dict[str, int]:
+        """Total a vehicle's Open Parking and Camera Violations records into
+        its number of violations and its fines in cents.
+        """
+        summonses: list[Summons] = [
+            self._normalize_open_parking_and_camera_violations_summons(summons=record)
+            for record in self.local_open_data_store.get_records(
+                dataset=endpoint, plate=plate, state=state)]
+
+        return {
+            'num_violations': len(summonses),
+            **{fine_key: sum(getattr(summons, fine_key) for summons in summonses)
+               for fine_key in self.OUTPUT_FINE_KEYS}}
+
+    def _fetch_dataset_records(self,
+                               dataset_queries: list[Tuple[str, list[PlateQuery], Optional[datetime], Optional[datetime]]]
+                               ) -> Iterator[Tuple[int, list[dict[str, Any]]]]:
+        # The time range is applied once the records are normalized, just
+        # as it is for ranges the portal can't filter on.
+        for position, (endpoint, plate_queries, _, _) in enumerate(dataset_queries):
+            records: list[dict[str, Any]] = []
+
+            for plate, state in dict.fromkeys(
+                    (plate_query.plate, plate_query.state) for plate_query in plate_queries):
+                records.extend(self.local_open_data_store.get_records(
+                    dataset=endpoint, plate=plate, state=state))
+
+            # Records for a single plate query aren't demultiplexed, so
+            # filter its plate types here as the portal would.
+            if len(plate_queries) == 1 and plate_queries[0].plate_types is not None:
+                _, _, plate_type_field = self._get_vehicle_fields(endpoint=endpoint)
+                plate_types: list[str] = plate_queries[0].plate_types.split(',')
+
+                records = [record for record in records
+                           if record.get(plate_type_field) in plate_types]
+
+            yield position, records
+
+    def _fetch_medallion_records(self, plate_query: PlateQuery) -> list[dict[str, Any]]:
+        return self.local_open_data_store.get_records(
+            dataset=MEDALLION_ENDPOINT, plate=plate_query.plate, state='')
+
+    def _invalidate_changed_lookups(self) -> None:
+        """Drop the cached local lookups of the vehicles whose records have
+        been written to the store since it was last checked, or all of them
+        if it can't tell which.
+        """
+        plate_lookup_cache: Optional[PlateLookupCache] = get_plate_lookup_cache()
+        if plate_lookup_cache is None:
+            return
+
+        changes: Optional[set[Tuple[str, str, str]]] = \
+            self.local_open_data_store.get_new_vehicle_changes()
+
+        if changes == set():
+            return
+
+        # Medallion records have no state, so they change every state's
+        # lookups of their plate.
+        changed_vehicles: set[Tuple[str, str]] = {
+            (plate, state) for _, plate, state in changes or () if state}
+        changed_plates: set[str] = {
+            plate for _, plate, state in changes or () if not state}
+
+        def is_changed(lookup_key: Hashable) -> bool:
+            # Lookups are cached by (service, plate, state, ...).
+            if not issubclass(lookup_key[0], LocalOpenDataService):
+                return False
+
+            return (changes is None or
+                    (lookup_key[1], lookup_key[2]) in changed_vehicles or
+                    lookup_key[1] in changed_plates)
+
+        num_invalidated: int = plate_lookup_cache.invalidate(is_changed)
+
+        LOG.debug(f'Dropped {num_invalidated} cached lookups of changed vehicles')
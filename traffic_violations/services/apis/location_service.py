@@ -1,10 +1,79 @@
+import atexit
+import logging
 import os
 import requests
+import threading
 
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Iterable, Optional, Sequence, Tuple
 
 from traffic_violations import settings
 from traffic_violations.models.geocode import Geocode
+from traffic_violations.services.street_gazetteer import StreetGazetteer
+
+LOG = logging.getLogger(__name__)
+
+# Boroughs already found for locations, shared by every instance and least
+# recently used first.
+_BOROUGHS_BY_LOCATION: OrderedDict[Tuple[str, ...], str] = OrderedDict()
+_BOROUGHS_BY_LOCATION_LOCK = threading.Lock()
+
+_GEOCODING_SESSION = None
+_GEOCODING_SESSION_LOCK = threading.Lock()
+
+_STREET_GAZETTEER = None
+
+
+def get_geocoding_session() -> requests.Session:
+    """Return the process-wide session used to make geocoding requests,
+    creating it on first use.
+
+    Sharing one session lets every geocoding request reuse its pool of
+    keep-alive connections, sized for as many requests as a batch of
+    locations makes at once.
+    """
+    global _GEOCODING_SESSION  # pylint: disable=global-statement
+    with _GEOCODING_SESSION_LOCK:
+        if not _GEOCODING_SESSION:
+            session = requests.Session()
+
+            session.mount('https://', HTTPAdapter(
+                pool_maxsize=LocationService.MAX_CONCURRENT_GEOCODING_REQUESTS))
+
+            _GEOCODING_SESSION = session
+
+        return _GEOCODING_SESSION
+
+
+def close_geocoding_session() -> None:
+    """Close the process-wide geocoding session, if open. A later request
+    opens a new one.
+    """
+    global _GEOCODING_SESSION  # pylint: disable=global-statement
+    with _GEOCODING_SESSION_LOCK:
+        if _GEOCODING_SESSION:
+            _GEOCODING_SESSION.close()
+            _GEOCODING_SESSION = None
+
+
+# Don't leave idle connections behind if the process exits without closing
+# the session itself.
+atexit.register(close_geocoding_session)
+
+
+def get_street_gazetteer() -> Optional[StreetGazetteer]:
+    """Return the process-wide street gazetteer, if one has been
+    configured with STREET_GAZETTEER_PATH.
+    """
+    global _STREET_GAZETTEER  # pylint: disable=global-statement
+    if not _STREET_GAZETTEER:
+        gazetteer_path: Optional[str] = os.getenv('STREET_GAZETTEER_PATH')
+        if gazetteer_path:
+            _STREET_GAZETTEER = StreetGazetteer.load(path=gazetteer_path)
+
+    return _STREET_GAZETTEER
 
 
 class LocationService:
@@ -16,63 +85,142 @@ class LocationService:
     RESULTS_KEY = 'results'
     RESULTS_COMPONENTS_KEY = 'address_components'
 
+    MAX_CACHED_LOCATIONS = 10_000
+    MAX_CONCURRENT_GEOCODING_REQUESTS = 8
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session: requests.Session = session or get_geocoding_session()
 
 
     def get_borough_from_location_strings(self, location_parts: list[str]) -> Optional[str]:
-        return self._detect_borough(location_parts=location_parts)
+        return self.get_boroughs_from_location_strings(
+            locations=[location_parts]).get(tuple(location_parts))
+
+
+    def get_boroughs_from_location_strings(self,
+                                           locations: Iterable[Sequence[str]]
+                                           ) -> dict[Tuple[str, ...], Optional[str]]:
+        """Find the borough of each location, given as the parts of its
+        address, keyed by those parts as a tuple.
+
+        Locations not already found in this process are looked up in the
+        geocodes table all at once, then in the street gazetteer, and any
+        still missing are geocoded concurrently.
+        """
+        boroughs: dict[Tuple[str, ...], Optional[str]] = {}
+        misses: list[Tuple[str, ...]] = []
+
+        with _BOROUGHS_BY_LOCATION_LOCK:
+            for location in dict.fromkeys(tuple(location_parts) for location_parts in locations):
+                if location in _BOROUGHS_BY_LOCATION:
+                    _BOROUGHS_BY_LOCATION.move_to_end(location)
+                    boroughs[location] = _BOROUGHS_BY_LOCATION[location]
+                else:
+                    misses.append(location)
+
+        if misses:
+            detected_boroughs: dict[Tuple[str, ...], Optional[str]] = self._detect_boroughs(
+                locations=misses)
+
+            # Only boroughs that were found are remembered, so that a
+            # failed geocoding request is tried again next time.
+            with _BOROUGHS_BY_LOCATION_LOCK:
+                for location, borough in detected_boroughs.items():
+                    if borough:
+                        _BOROUGHS_BY_LOCATION[location] = borough
+                        _BOROUGHS_BY_LOCATION.move_to_end(location)
+
+                while len(_BOROUGHS_BY_LOCATION) > self.MAX_CACHED_LOCATIONS:
+                    _BOROUGHS_BY_LOCATION.popitem(last=False)
+
+            boroughs.update(detected_boroughs)
+
+        return boroughs
+
+
+    def _detect_boroughs(self,
+                         locations: list[Tuple[str, ...]]) -> dict[Tuple[str, ...], Optional[str]]:
+
+        lookup_strings_by_location: dict[Tuple[str, ...], list[str]] = {
+            location: list(dict.fromkeys(self._normalize_address(location_parts=location)))
+            for location in locations}
+
+        # try to find them in the geocodes table first.
+        existing_geocodes: dict[str, str] = self._get_existing_geocodes(
+            query_strings=list({lookup_string
+                                for lookup_strings in lookup_strings_by_location.values()
+                                for lookup_string in lookup_strings}))
+
+        street_gazetteer: Optional[StreetGazetteer] = get_street_gazetteer()
+
+        boroughs: dict[Tuple[str, ...], Optional[str]] = {}
+        locations_to_geocode: list[Tuple[str, ...]] = []
+
+        for location, lookup_strings in lookup_strings_by_location.items():
+            boroughs[location] = next(
+                (existing_geocodes[lookup_string] for lookup_string in lookup_strings
+                 if lookup_string in existing_geocodes), None)
 
+            # then in the gazetteer, which knows streets if not intersections.
+            if boroughs[location] is None and street_gazetteer:
+                boroughs[location] = street_gazetteer.find_borough(location_parts=location)
 
-    def _detect_borough(self, location_parts) -> Optional[str]:
+            if boroughs[location] is None:
+                locations_to_geocode.append(location)
 
-        # sanitized_parts = [re.sub('\(?[ENSW]/?B\)? *', '', part)
-        #                    for part in location_parts]
-        location_strs: list[str] = self._normalize_address(
-            location_parts=location_parts)
+        if locations_to_geocode:
+            LOG.debug(f'Geocoding {len(locations_to_geocode)} locations')
 
-        # location_str = re.sub('[ENSW]B *', '', location_str)
-        # lookup_string = ' '.join([location_str, 'New York NY'])
+            with ThreadPoolExecutor(
+                    max_workers=min(self.MAX_CONCURRENT_GEOCODING_REQUESTS,
+                                    len(locations_to_geocode))) as executor:
+                geocoded: list[Tuple[Optional[str], Optional[str]]] = list(executor.map(
+                    lambda location: self._geocode(
+                        lookup_strings=lookup_strings_by_location[location]),
+                    locations_to_geocode))
 
-        for geo_string in location_strs:
+            new_geocodes: dict[str, str] = {}
 
-            # try to find it in the geocodes table first.
+            for location, (borough, lookup_string) in zip(locations_to_geocode, geocoded):
+                boroughs[location] = borough
 
-            boro_from_geocode: Optional[str] = self._get_existing_geocode(
-                query_string=geo_string)
+                if borough:
+                    new_geocodes[lookup_string] = borough
 
-            if boro_from_geocode:
-                return boro_from_geocode
+            if new_geocodes:
+                self._save_new_geocodes(boroughs_by_query_string=new_geocodes)
 
-            else:
-                params: dict[str, str] = {
-                    'address': geo_string,
-                    'key': self.GEOCODING_SERVICE_API_KEY}
-                results: Optional[dict[str, str]] = self._make_geocoding_request(
-                    params=params)
+        return boroughs
 
-                if results:
-                    boro: str = self._parse_geocoding_response_for_borough(
-                        response=results[0])
 
-                    if boro:
-                        # insert geocode
-                        self._save_new_geocode(
-                            borough=boro, query_string=geo_string)
+    def _geocode(self, lookup_strings: list[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Geocode the first of the lookup strings that can be, returning
+        (borough, lookup string), or (None, None) if none can.
+        """
+        for geo_string in lookup_strings:
+            params: dict[str, str] = {
+                'address': geo_string,
+                'key': self.GEOCODING_SERVICE_API_KEY}
+            results: Optional[dict[str, str]] = self._make_geocoding_request(
+                params=params)
 
-                        # return the boro
-                        return boro
+            if results:
+                boro: Optional[str] = self._parse_geocoding_response_for_borough(
+                    response=results[0])
 
-        return None
+                if boro:
+                    return boro, geo_string
 
+        return None, None
 
-    def _get_existing_geocode(self, query_string) -> Optional[str]:
-        geocode: Optional[Geocode] = Geocode.get_by(lookup_string=query_string)
 
-        if geocode:
-            return geocode.borough
+    def _get_existing_geocodes(self, query_strings: list[str]) -> dict[str, str]:
+        return {geocode.lookup_string: geocode.borough
+                for geocode in Geocode.get_all_in(lookup_string=query_strings)}
 
 
     def _make_geocoding_request(self, params) -> Optional[dict[str, str]]:
-        req = requests.get(self.GEOCODING_SERVICE_ENDPOINT, params=params)
+        req = self.session.get(self.GEOCODING_SERVICE_ENDPOINT, params=params)
 
         if req.json().get(self.RESULTS_KEY):
             return req.json()[self.RESULTS_KEY]
@@ -94,12 +242,12 @@ class LocationService:
                 return boros[0]
 
 
-    def _save_new_geocode(self, borough, query_string) -> None:
-        new_geocode = Geocode(
-            borough=borough,
-            geocoding_service=self.GEOCODING_SERVICE_NAME,
-            lookup_string=query_string)
+    def _save_new_geocodes(self, boroughs_by_query_string: dict[str, str]) -> None:
+        Geocode.query.session.add_all([
+            Geocode(borough=borough,
+                    geocoding_service=self.GEOCODING_SERVICE_NAME,
+                    lookup_string=query_string)
+            for query_string, borough in boroughs_by_query_string.items()])
 
-        Geocode.query.session.add(new_geocode)
         Geocode.query.session.commit()
 
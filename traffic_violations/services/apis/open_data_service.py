@@ -1,29 +1,37 @@
+import atexit
 import logging
 import os
 import re
 import requests
 import requests_futures.sessions
+import threading
 
+from bisect import bisect_left
+from functools import lru_cache
 from collections import Counter
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import replace
+from datetime import date, datetime, timedelta
 from requests.packages.urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from typing import Any, Optional, Tuple
+from typing import Any, Iterable, Iterator, Optional, Tuple
 
 from traffic_violations import settings
-from traffic_violations.constants.borough_codes import BOROUGH_CODES
+from traffic_violations.constants.borough_codes import BOROUGHS_BY_COUNTY_CODE
 from traffic_violations.constants.open_data.endpoints import \
-    FISCAL_YEAR_DATABASE_ENDPOINTS, MEDALLION_ENDPOINT, \
+    CLOSED_FISCAL_YEARS, FISCAL_YEAR_DATABASE_ENDPOINTS, MEDALLION_ENDPOINT, \
     OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT
 from traffic_violations.constants.open_data.needed_fields import \
-    FISCAL_YEAR_DATABASE_NEEDED_FIELDS, \
-    OPEN_PARKING_AND_CAMERA_VIOLATIONS_NEEDED_FIELDS, \
-    OPEN_PARKING_AND_CAMERA_VIOLATIONS_FINE_KEYS
+    FISCAL_YEAR_DATABASE_SELECTED_FIELDS, \
+    FISCAL_YEAR_DATABASE_VEHICLE_FIELDS, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_FINE_KEYS, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS, \
+    OPEN_PARKING_AND_CAMERA_VIOLATIONS_VEHICLE_FIELDS
 from traffic_violations.constants.open_data.violations import \
     CAMERA_VIOLATIONS, CAMERA_STREAK_DATA_TYPES, \
     HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS, \
     HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS
-from traffic_violations.constants.precincts import PRECINCTS_BY_BOROUGH
+from traffic_violations.constants.precincts import BOROUGHS_BY_PRECINCT
 
 from traffic_violations.models.camera_streak_data import CameraStreakData
 from traffic_violations.models.fine_data import FineData
@@ -34,18 +42,243 @@ from traffic_violations.models.response.open_data_service_response import (
     OpenDataServiceResponse)
 from traffic_violations.models.special_purpose.covid_19_camera_offender import (
     Covid19CameraOffender)
+from traffic_violations.models.summons import Summons
 
 from traffic_violations.services.constants.exceptions import \
     APIFailureException
 from traffic_violations.services.apis.location_service import LocationService
+from traffic_violations.services.fiscal_year_database_cache import \
+    FiscalYearDatabaseCache
+from traffic_violations.services.open_data_throttle import OpenDataThrottle
+from traffic_violations.services.plate_lookup_cache import PlateLookupCache
+from traffic_violations.services.single_flight import SingleFlight
+from traffic_violations.utils.json_utils import iter_json_array
 
 LOG = logging.getLogger(__name__)
 
+_FISCAL_YEAR_DATABASE_CACHE = None
+
+_PLATE_LOOKUP_CACHE = None
+
+_OPEN_DATA_SESSION = None
+_OPEN_DATA_SESSION_LOCK = threading.Lock()
+
+_OPEN_DATA_THROTTLE = None
+_OPEN_DATA_THROTTLE_LOCK = threading.Lock()
+
+# Shared by every instance, so that concurrent lookups of the same vehicle
+# anywhere in the process make one set of queries between them.
+_VEHICLE_LOOKUP_SINGLE_FLIGHT = SingleFlight()
+
+_VIOLATION_DESCRIPTION_CODE_PATTERN = re.compile('[0-9]*-')
+
+
+def _compile_violations_by_start_date(
+        humanized_names: dict[str, Any]) -> dict[str, Tuple[list[date], list[str]]]:
+    """For each violation code that has applied to multiple violations,
+    return the dates from which they applied, in order, and the violations.
+    """
+    violations_by_start_date: dict[str, Tuple[list[date], list[str]]] = {}
+
+    for violation_code, definition in humanized_names.items():
+        if isinstance(definition, list):
+            definitions: list[dict[str, str]] = sorted(
+                definition, key=lambda possible_description: possible_description['start_date'])
+
+            violations_by_start_date[violation_code] = (
+                [datetime.strptime(possible_description['start_date'], '%Y-%m-%d').date()
+                 for possible_description in definitions],
+                [possible_description['description']
+                 for possible_description in definitions])
+
+    return violations_by_start_date
+
+
+_FISCAL_YEAR_DATABASE_VIOLATIONS_BY_START_DATE: dict[str, Tuple[list[date], list[str]]] = \
+    _compile_violations_by_start_date(HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS)
+
+
+@lru_cache(maxsize=4096)
+def _humanize_fiscal_year_database_violation_description(violation_description: str) -> str:
+    """Return the human readable name of a violation description, which
+    repeat across summonses, dropping its code if it has none.
+    """
+    return (HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.get(violation_description) or
+            _VIOLATION_DESCRIPTION_CODE_PATTERN.sub('', violation_description))
+
+
+def get_fiscal_year_database_cache() -> Optional[FiscalYearDatabaseCache]:
+    """Return the process-wide fiscal year database cache, if one has been
+    configured with FISCAL_YEAR_DATABASE_CACHE_PATH.
+    """
+    global _FISCAL_YEAR_DATABASE_CACHE  # pylint: disable=global-statement
+    if not _FISCAL_YEAR_DATABASE_CACHE:
+        cache_path: Optional[str] = os.getenv('FISCAL_YEAR_DATABASE_CACHE_PATH')
+        if cache_path:
+            _FISCAL_YEAR_DATABASE_CACHE = FiscalYearDatabaseCache(path=cache_path)
+
+    return _FISCAL_YEAR_DATABASE_CACHE
+
+
+def get_plate_lookup_cache() -> Optional[PlateLookupCache]:
+    """Return the process-wide cache of recent vehicle lookups, if one has
+    been configured with PLATE_LOOKUP_CACHE_TTL_SECONDS.
+
+    PLATE_LOOKUP_CACHE_MAX_SIZE (default 10,000) bounds the number of
+    lookups kept, PLATE_LOOKUP_CACHE_MAX_STALE_SECONDS (default an hour)
+    how long past the TTL a lookup is served while it is refreshed, and
+    PLATE_LOOKUP_CACHE_REFRESH_WORKERS (default 2) how many refreshes run
+    at once.
+    """
+    global _PLATE_LOOKUP_CACHE  # pylint: disable=global-statement
+    if not _PLATE_LOOKUP_CACHE:
+        ttl_seconds: Optional[str] = os.getenv('PLATE_LOOKUP_CACHE_TTL_SECONDS')
+        if ttl_seconds:
+            _PLATE_LOOKUP_CACHE = PlateLookupCache(
+                max_size=int(os.getenv('PLATE_LOOKUP_CACHE_MAX_SIZE', '10000')),
+                ttl_seconds=float(ttl_seconds),
+                max_stale_seconds=float(
+                    os.getenv('PLATE_LOOKUP_CACHE_MAX_STALE_SECONDS', '3600')),
+                max_refresh_workers=int(
+                    os.getenv('PLATE_LOOKUP_CACHE_REFRESH_WORKERS', '2')))
+
+    return _PLATE_LOOKUP_CACHE
+
+
+def get_open_data_session() -> requests_futures.sessions.FuturesSession:
+    """Return the process-wide session used to query the open data portal,
+    creating it on first use.
+
+    Sharing one session lets every lookup reuse its pool of keep-alive
+    connections instead of paying for new TLS handshakes. Its thread pool
+    and connection pool are sized for OPEN_DATA_MAX_CONCURRENT_LOOKUPS
+    (default 4) lookups each querying every dataset at once.
+    """
+    global _OPEN_DATA_SESSION  # pylint: disable=global-statement
+    with _OPEN_DATA_SESSION_LOCK:
+        if not _OPEN_DATA_SESSION:
+            # One worker and one pooled connection per in-flight query.
+            pool_size: int = _get_max_concurrent_queries()
+
+            session = requests_futures.sessions.FuturesSession(
+                max_workers=pool_size)
+
+            # Throttling responses aren't retried here, but slow down every
+            # query in the process through the open data throttle instead.
+            retries = Retry(total=5,
+                            status=2,
+                            backoff_factor=0.5,
+                            status_forcelist=[500, 502, 503, 504],
+                            raise_on_status=False)
+
+            session.mount('https://', HTTPAdapter(max_retries=retries,
+                                                  pool_maxsize=pool_size))
+
+            _OPEN_DATA_SESSION = session
+
+        return _OPEN_DATA_SESSION
+
+
+def get_open_data_throttle() -> OpenDataThrottle:
+    """Return the process-wide throttle on queries to the open data portal,
+    creating it on first use.
+
+    Queries are limited to OPEN_DATA_REQUESTS_PER_SECOND (default 20), in
+    bursts of up to OPEN_DATA_REQUEST_BURST (default the session's pool
+    size), and to as many at once as the portal keeps up with. An endpoint
+    failing OPEN_DATA_CIRCUIT_FAILURE_THRESHOLD (default 5) queries in a
+    row is left alone for OPEN_DATA_CIRCUIT_RESET_SECONDS (default 30). A
+    query waiting more than OPEN_DATA_QUERY_SLOT_TIMEOUT_SECONDS (default
+    60) to be sent fails.
+    """
+    global _OPEN_DATA_THROTTLE  # pylint: disable=global-statement
+    with _OPEN_DATA_THROTTLE_LOCK:
+        if not _OPEN_DATA_THROTTLE:
+            max_concurrent_queries: int = _get_max_concurrent_queries()
+
+            _OPEN_DATA_THROTTLE = OpenDataThrottle(
+                requests_per_second=float(
+                    os.getenv('OPEN_DATA_REQUESTS_PER_SECOND', '20')),
+                burst=int(os.getenv(
+                    'OPEN_DATA_REQUEST_BURST', str(max_concurrent_queries))),
+                max_concurrent_requests=max_concurrent_queries,
+                failure_threshold=int(
+                    os.getenv('OPEN_DATA_CIRCUIT_FAILURE_THRESHOLD', '5')),
+                reset_seconds=float(
+                    os.getenv('OPEN_DATA_CIRCUIT_RESET_SECONDS', '30')),
+                acquire_timeout_seconds=float(
+                    os.getenv('OPEN_DATA_QUERY_SLOT_TIMEOUT_SECONDS', '60')))
+
+        return _OPEN_DATA_THROTTLE
+
+
+def get_max_concurrent_lookups() -> int:
+    """The most vehicle lookups the process is sized to run at once,
+    OPEN_DATA_MAX_CONCURRENT_LOOKUPS (default 4).
+    """
+    return int(os.getenv('OPEN_DATA_MAX_CONCURRENT_LOOKUPS', '4'))
+
+
+def _get_max_concurrent_queries() -> int:
+    """The most queries the process has in flight: every dataset at once
+    for each of the most lookups run at once.
+    """
+    return OpenDataService.MAX_CONCURRENT_QUERIES * get_max_concurrent_lookups()
+
+
+def close_open_data_session() -> None:
+    """Close the process-wide open data session, if open, waiting for its
+    in-flight requests. A later lookup opens a new one.
+    """
+    global _OPEN_DATA_SESSION  # pylint: disable=global-statement
+    with _OPEN_DATA_SESSION_LOCK:
+        if _OPEN_DATA_SESSION:
+            _OPEN_DATA_SESSION.close()
+            _OPEN_DATA_SESSION = None
+
+
+# Don't leave idle connections or worker threads behind if the process exits
+# without closing the session itself.
+atexit.register(close_open_data_session)
+
+
+def create_open_data_service() -> 'OpenDataService':
+    """Create the open data service selected by OPEN_DATA_SERVICE_BACKEND:
+    'api' (the default) to query the live portal, or 'local' to read from
+    the local mirror at LOCAL_OPEN_DATA_STORE_PATH.
+    """
+    backend: str = os.getenv('OPEN_DATA_SERVICE_BACKEND', 'api')
+
+    if backend == 'local':
+        # The local service builds on this module, so import it lazily.
+        from traffic_violations.services.apis.local_open_data_service import \
+            LocalOpenDataService
+
+        return LocalOpenDataService()
+
+    if backend != 'api':
+        raise ValueError(f'unknown open data service backend: {backend}')
+
+    return OpenDataService()
+
 
 class OpenDataService:
 
+    # One worker per dataset so that a lookup's queries all run at once.
+    MAX_CONCURRENT_QUERIES = len(FISCAL_YEAR_DATABASE_ENDPOINTS) + 1
+
+    # Plates per batched query, which keeps the query string a safe length.
+    MAX_PLATES_PER_QUERY = 50
+
     MAX_RESULTS = 10_000
 
+    # Bytes of a response to read at a time while decoding its records.
+    RESPONSE_CHUNK_SIZE = 1 << 16
+
+    # Seconds to wait to connect to the portal, and then for each read of
+    # a response, so that a stuck query gives back its request slot.
+    QUERY_TIMEOUT_SECONDS = (10, 60)
+
     MEDALLION_PATTERN = re.compile(r'^[0-9][A-Z][0-9]{2}$')
     MEDALLION_PLATE_KEY = 'dmv_license_plate_number'
 
@@ -53,23 +286,24 @@ class OpenDataService:
 
     OUTPUT_FINE_KEYS = ['fined', 'paid', 'reduced', 'outstanding']
 
-    TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
-
-    def __init__(self):
-        # Set up retry ability
-        s_req = requests_futures.sessions.FuturesSession(max_workers=9)
+    SOQL_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
 
-        retries = Retry(total=5,
-                        backoff_factor=0.1,
-                        status_forcelist=[403, 500, 502, 503, 504],
-                        raise_on_status=False)
+    TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
 
-        s_req.mount('https://', HTTPAdapter(max_retries=retries))
+    def __init__(self,
+                 fiscal_year_database_cache: Optional[FiscalYearDatabaseCache] = None,
+                 session: Optional[requests_futures.sessions.FuturesSession] = None,
+                 throttle: Optional[OpenDataThrottle] = None):
+        self.api: requests_futures.sessions.FuturesSession = (
+            session or get_open_data_session())
 
-        self.api = s_req
+        self.throttle: OpenDataThrottle = throttle or get_open_data_throttle()
 
         self.location_service = LocationService()
 
+        self.fiscal_year_database_cache: Optional[FiscalYearDatabaseCache] = (
+            fiscal_year_database_cache or get_fiscal_year_database_cache())
+
     def lookup_covid_19_camera_violations(self) -> list[dict[str, str]]:
         """Search for all camera violations for all vehicles between two
         timestamps.
@@ -126,88 +360,296 @@ class OpenDataService:
     def look_up_vehicle(self,
                        plate_query: PlateQuery,
                        since: datetime = None,
-                       until: datetime = None) -> OpenDataServiceResponse:
-        try:
-            lookup_result: OpenDataServicePlateLookup = self._perform_all_queries(
-                plate_query=plate_query,
-                since=since,
-                until=until)
+                       until: datetime = None,
+                       use_cache: bool = True) -> OpenDataServiceResponse:
+        """Look up a vehicle's violations.
+
+        Concurrent lookups of the same vehicle over the same time range
+        share a single set of queries and its response. If a plate lookup
+        cache is configured, recent responses are served from it unless
+        use_cache is False, for callers that need fresh data.
+        """
+        plate_types: Any = plate_query.plate_types
+        if isinstance(plate_types, list):
+            plate_types = tuple(plate_types)
 
-            return OpenDataServiceResponse(
-                data=lookup_result,
-                success=True)
+        lookup_key: Tuple[Any, ...] = (
+            type(self), plate_query.plate, plate_query.state, plate_types, since, until)
 
-        except APIFailureException as exc:
-            LOG.error(str(exc))
+        def look_up() -> OpenDataServiceResponse:
+            return _VEHICLE_LOOKUP_SINGLE_FLIGHT.do(
+                key=lookup_key,
+                function=lambda: self.look_up_vehicles(plate_queries=[plate_query],
+                                                       time_ranges=[(since, until)])[0])
 
-            return OpenDataServiceResponse(
-                message=str(exc),
-                success=False)
+        plate_lookup_cache: Optional[PlateLookupCache] = get_plate_lookup_cache()
 
-    def _add_fine_data_for_open_parking_and_camera_violations_summons(self, summons) -> dict[str, Any]:
-        for output_key in self.OUTPUT_FINE_KEYS:
-            summons[output_key] = 0
+        if not use_cache or plate_lookup_cache is None:
+            return look_up()
 
-        for fine_key in OPEN_PARKING_AND_CAMERA_VIOLATIONS_FINE_KEYS:
-            if fine_key in summons:
-                try:
-                    amount = float(summons[fine_key])
+        return plate_lookup_cache.get(key=lookup_key, load=look_up)
 
-                    if fine_key in ['fine_amount', 'interest_amount', 'penalty_amount']:
-                        summons['fined'] += amount
+    def look_up_vehicles(self,
+                         plate_queries: list[PlateQuery],
+                         time_ranges: Optional[list[Tuple[Optional[datetime], Optional[datetime]]]] = None
+                         ) -> list[OpenDataServiceResponse]:
+        """Look up many vehicles at once, returning one response per plate
+        query, in order.
 
-                    elif fine_key == 'reduction_amount':
-                        summons['reduced'] += amount
+        Rather than querying every dataset for each plate, up to
+        MAX_PLATES_PER_QUERY plates share each query, and the rows are
+        then sorted back out by plate, state and plate type. time_ranges,
+        if given, holds a (since, until) pair for each plate query.
+        """
 
-                    elif fine_key == 'amount_due':
-                        summons['outstanding'] += amount
+        if time_ranges is None:
+            time_ranges = [(None, None)] * len(plate_queries)
 
-                    elif fine_key == 'payment_amount':
-                        summons['paid'] += amount
+        responses: list[OpenDataServiceResponse] = []
+
+        for chunk_start in range(0, len(plate_queries), self.MAX_PLATES_PER_QUERY):
+            chunk_end: int = chunk_start + self.MAX_PLATES_PER_QUERY
+
+            try:
+                lookup_results: list[OpenDataServicePlateLookup] = self._perform_all_queries(
+                    plate_queries=plate_queries[chunk_start:chunk_end],
+                    time_ranges=time_ranges[chunk_start:chunk_end])
 
-                except ValueError as ve:
+                responses.extend(
+                    OpenDataServiceResponse(data=lookup_result, success=True)
+                    for lookup_result in lookup_results)
 
-                    LOG.error('Error parsing value into float')
-                    LOG.error(e)
-                    LOG.error(str(e))
-                    LOG.error(e.args)
-                    logging.exception("stack trace")
+            except APIFailureException as exc:
+                LOG.error(str(exc))
 
-                    pass
+                responses.extend(
+                    OpenDataServiceResponse(message=str(exc), success=False)
+                    for _ in plate_queries[chunk_start:chunk_end])
 
-        return summons
+        return responses
+
+    def _add_query_page(self, query_string: str, offset: int) -> str:
+        return f'{query_string}&$order=:id&$offset={offset}'
 
     def _add_query_limit_and_token(self, url: str) -> str:
         return f'{url}&$limit={self.MAX_RESULTS}&$$app_token={self.OPEN_DATA_TOKEN}'
 
-    def _calculate_aggregate_data(self, plate_query: PlateQuery, violations) -> OpenDataServicePlateLookup:
-        # Marshal all ticket data into form.
-        fines: FineData = FineData(
-            fined=round(sum(v['fined']
-                      for v in violations.values() if v.get('fined')), 2),
-            reduced=round(sum(v['reduced']
-                        for v in violations.values() if v.get('reduced')), 2),
-            paid=round(sum(v['paid'] for v in violations.values() if v.get('paid')), 2),
-            outstanding=round(sum(v['outstanding']
-                            for v in violations.values() if v.get('outstanding')), 2)
-        )
+    def _add_violation_if_within_time_range(self,
+                                            summons: Summons,
+                                            since: Optional[datetime],
+                                            until: Optional[datetime],
+                                            violations: dict[str, Summons]) -> None:
+        if summons.has_date:
+            if ((since is None or summons.issue_date >= since) and
+                    (until is None or summons.issue_date <= until)):
+                violations[summons.summons_number] = summons
 
-        tickets: list[Tuple[str, int]] = Counter([v['violation'].title() for v in violations.values(
-        ) if v.get('violation') is not None]).most_common()
+            else:
+                LOG.debug(
+                    f"record {summons.summons_number} ({summons.issue_date}) "
+                    f"is not within time range "
+                    f"({since.strftime(self.TIME_FORMAT) if since else 'any'}<->"
+                    f"{until.strftime(self.TIME_FORMAT) if until else 'any'}")
+
+            return
+
+        violations[summons.summons_number] = summons
+
+    def _build_fiscal_year_database_batch_query_string(self,
+                                                       endpoint: str,
+                                                       plate_queries: list[PlateQuery],
+                                                       since: Optional[datetime] = None,
+                                                       until: Optional[datetime] = None) -> str:
+        if len(plate_queries) == 1:
+            return self._build_fiscal_year_database_query_string(
+                endpoint=endpoint,
+                plate_query=plate_queries[0],
+                since=since,
+                until=until)
 
-        years: list[Tuple[str, int]] = Counter([datetime.strptime(v['issue_date'], self.TIME_FORMAT).strftime('%Y') if v.get(
-            'has_date') else 'No Year Available' for v in violations.values()]).most_common()
+        predicates: list[str] = [
+            self._build_plates_predicate(plate_field='plate_id',
+                                         state_field='registration_state',
+                                         plate_queries=plate_queries)]
+
+        predicates.extend(self._build_fiscal_year_database_time_range_predicates(
+            since=since, until=until))
+
+        return (
+            f"{endpoint}?"
+            f"$select={','.join(FISCAL_YEAR_DATABASE_SELECTED_FIELDS + FISCAL_YEAR_DATABASE_VEHICLE_FIELDS)}"
+            f"{self._build_where_clause(predicates)}")
+
+    def _build_fiscal_year_database_query_string(self,
+                                                 endpoint: str,
+                                                 plate_query: PlateQuery,
+                                                 since: Optional[datetime] = None,
+                                                 until: Optional[datetime] = None) -> str:
+        predicates: list[str] = []
+
+        if plate_query.plate_types is not None:
+            predicates.append(
+                self._build_in_predicate(field='plate_type',
+                                         values=plate_query.plate_types.split(',')))
+
+        predicates.extend(self._build_fiscal_year_database_time_range_predicates(
+            since=since, until=until))
+
+        return (
+            f"{endpoint}?"
+            f"$select={','.join(FISCAL_YEAR_DATABASE_SELECTED_FIELDS)}&"
+            f"plate_id={plate_query.plate}&"
+            f"registration_state={plate_query.state}"
+            f"{self._build_where_clause(predicates)}")
+
+    def _build_fiscal_year_database_time_range_predicates(self,
+                                                          since: Optional[datetime],
+                                                          until: Optional[datetime]) -> list[str]:
+        # The fiscal year datasets have a typed 'issue_date', so the time
+        # range can be compared directly.
+        predicates: list[str] = []
+
+        if since is not None:
+            predicates.append(
+                f"issue_date%20>=%20%27{since.strftime(self.SOQL_TIME_FORMAT)}%27")
+
+        if until is not None:
+            predicates.append(
+                f"issue_date%20<=%20%27{until.strftime(self.SOQL_TIME_FORMAT)}%27")
+
+        return predicates
+
+    def _build_in_predicate(self, field: str, values: list[str]) -> str:
+        return f"{field}%20in({','.join(['%27' + value + '%27' for value in values])})"
+
+    def _build_open_parking_and_camera_violations_batch_query_string(self,
+                                                                     plate_queries: list[PlateQuery],
+                                                                     since: Optional[datetime] = None,
+                                                                     until: Optional[datetime] = None) -> str:
+        if len(plate_queries) == 1:
+            return self._build_open_parking_and_camera_violations_query_string(
+                plate_query=plate_queries[0],
+                since=since,
+                until=until)
+
+        predicates: list[str] = [
+            self._build_plates_predicate(plate_field='plate',
+                                         state_field='state',
+                                         plate_queries=plate_queries)]
 
-        boroughs: list[Tuple[str, int]] = Counter([v['borough'].title() for v in violations.values(
-        ) if v.get('borough')]).most_common()
+        predicates.extend(self._build_open_parking_and_camera_violations_time_range_predicates(
+            since=since, until=until))
+
+        return (
+            f'{OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT}?'
+            f"$select={','.join(OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS + OPEN_PARKING_AND_CAMERA_VIOLATIONS_VEHICLE_FIELDS)}"
+            f"{self._build_where_clause(predicates)}")
 
-        camera_violations_by_type: dict[str, CameraStreakData] = { violation_type: self._find_max_camera_violations_streak(
-            sorted([datetime.strptime(v['issue_date'], self.TIME_FORMAT) for v in violations.values(
-            ) if v.get('violation') == violation_type])) for violation_type in CAMERA_VIOLATIONS }
+    def _build_open_parking_and_camera_violations_query_string(self,
+                                                               plate_query: PlateQuery,
+                                                               since: Optional[datetime] = None,
+                                                               until: Optional[datetime] = None) -> str:
+        predicates: list[str] = []
 
-        camera_violations_by_type['Mixed'] = self._find_max_camera_violations_streak(
-            sorted([datetime.strptime(v['issue_date'], self.TIME_FORMAT) for v in violations.values(
-            ) if v.get('violation') and v['violation'] in CAMERA_VIOLATIONS]))
+        if plate_query.plate_types is not None:
+            predicates.append(
+                self._build_in_predicate(field='license_type',
+                                         values=plate_query.plate_types.split(',')))
+
+        predicates.extend(self._build_open_parking_and_camera_violations_time_range_predicates(
+            since=since, until=until))
+
+        return (
+            f'{OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT}?'
+            f"$select={','.join(OPEN_PARKING_AND_CAMERA_VIOLATIONS_SELECTED_FIELDS)}&"
+            f'plate={plate_query.plate}&'
+            f'state={plate_query.state}'
+            f"{self._build_where_clause(predicates)}")
+
+    def _build_open_parking_and_camera_violations_time_range_predicates(self,
+                                                                        since: Optional[datetime],
+                                                                        until: Optional[datetime]) -> list[str]:
+        # Open Parking and Camera Violations has a string 'issue_date'
+        # (MM/DD/YYYY) that can't be compared as a date, so narrow the
+        # results to the years the range touches. The exact bounds are
+        # still checked once the records are normalized.
+        if since is not None and until is not None and since <= until:
+            return [
+                '(' + '%20or%20'.join(
+                    [f'issue_date%20LIKE%20%27__/__/{year}%27'
+                     for year in range(since.year, until.year + 1)]) + ')']
+
+        return []
+
+    def _build_plates_predicate(self,
+                                plate_field: str,
+                                state_field: str,
+                                plate_queries: list[PlateQuery]) -> str:
+        plates_by_state: dict[str, list[str]] = {}
+        for plate_query in plate_queries:
+            plates: list[str] = plates_by_state.setdefault(plate_query.state, [])
+            if plate_query.plate not in plates:
+                plates.append(plate_query.plate)
+
+        return '(' + '%20or%20'.join(
+            [f'({state_field}=%27{state}%27%20and%20'
+             f'{self._build_in_predicate(field=plate_field, values=plates)})'
+             for state, plates in plates_by_state.items()]) + ')'
+
+    def _build_where_clause(self, predicates: list[str]) -> str:
+        return f"&$where={'%20and%20'.join(predicates)}" if predicates else ''
+
+    def _calculate_aggregate_data(self,
+                                  plate_query: PlateQuery,
+                                  violations: dict[str, Summons]) -> OpenDataServicePlateLookup:
+        # Marshal all ticket data into form, accumulating every aggregate in
+        # a single pass over the violations.
+        fine_totals: dict[str, int] = {
+            output_key: 0 for output_key in self.OUTPUT_FINE_KEYS}
+
+        ticket_counts: Counter = Counter()
+        year_counts: Counter = Counter()
+        borough_counts: Counter = Counter()
+
+        camera_violation_times: dict[str, list[datetime]] = {
+            violation_type: [] for violation_type in CAMERA_STREAK_DATA_TYPES}
+
+        for summons in violations.values():
+            fine_totals['fined'] += summons.fined
+            fine_totals['outstanding'] += summons.outstanding
+            fine_totals['paid'] += summons.paid
+            fine_totals['reduced'] += summons.reduced
+
+            if summons.violation is not None:
+                ticket_counts[summons.violation.title()] += 1
+
+            if summons.has_date:
+                year_counts[str(summons.issue_date.year)] += 1
+            else:
+                year_counts['No Year Available'] += 1
+
+            if summons.borough:
+                borough_counts[summons.borough.title()] += 1
+
+            if summons.has_date and summons.violation in CAMERA_VIOLATIONS:
+                camera_violation_times[summons.violation].append(summons.issue_date)
+                camera_violation_times['Mixed'].append(summons.issue_date)
+
+        # Totals are kept in cents, so converting to dollars is exact.
+        fines: FineData = FineData(
+            fined=fine_totals['fined'] / 100,
+            reduced=fine_totals['reduced'] / 100,
+            paid=fine_totals['paid'] / 100,
+            outstanding=fine_totals['outstanding'] / 100
+        )
+
+        tickets: list[Tuple[str, int]] = ticket_counts.most_common()
+        years: list[Tuple[str, int]] = year_counts.most_common()
+        boroughs: list[Tuple[str, int]] = borough_counts.most_common()
+
+        camera_violations_by_type: dict[str, CameraStreakData] = {
+            violation_type: self._find_max_camera_violations_streak(sorted(violation_times))
+            for violation_type, violation_times in camera_violation_times.items()}
 
         return OpenDataServicePlateLookup(
             boroughs=[{'count': v, 'title': k.title()} for k, v in boroughs],
@@ -222,8 +664,157 @@ class OpenDataService:
                           for k, v in years], key=lambda k: k['title'])
         )
 
+    def _calculate_fines_for_open_parking_and_camera_violations_summons(
+            self, summons: dict[str, Any]) -> dict[str, int]:
+        """Total a summons' fine amounts into cents fined, paid, reduced and
+        outstanding.
+        """
+        fines: dict[str, int] = {
+            output_key: 0 for output_key in self.OUTPUT_FINE_KEYS}
+
+        for fine_key in OPEN_PARKING_AND_CAMERA_VIOLATIONS_FINE_KEYS:
+            if fine_key in summons:
+                try:
+                    amount: int = Summons.to_cents(summons[fine_key])
+
+                    if fine_key in ['fine_amount', 'interest_amount', 'penalty_amount']:
+                        fines['fined'] += amount
+
+                    elif fine_key == 'reduction_amount':
+                        fines['reduced'] += amount
+
+                    elif fine_key == 'amount_due':
+                        fines['outstanding'] += amount
+
+                    elif fine_key == 'payment_amount':
+                        fines['paid'] += amount
+
+                except ValueError:
+                    LOG.exception(
+                        f"Error parsing {fine_key} '{summons[fine_key]}' for "
+                        f"{summons.get('summons_number')}")
+
+        return fines
+
+    def _close_query_response(self, future: Future) -> None:
+        if future.exception() is None:
+            future.result().close()
+
+    def _demultiplex_records(self,
+                             endpoint: str,
+                             plate_queries: list[PlateQuery],
+                             records: Iterable[dict[str, Any]]) -> list[Iterable[dict[str, Any]]]:
+        """Split the records from a batched query into those belonging to
+        each of its plate queries, in order.
+
+        The records of a query for a single plate are passed through as
+        they are, so they can still be read one at a time.
+        """
+
+        if len(plate_queries) == 1:
+            return [records]
+
+        plate_field, state_field, plate_type_field = self._get_vehicle_fields(
+            endpoint=endpoint)
+
+        positions_by_vehicle: dict[Tuple[str, str], list[int]] = {}
+        for position, plate_query in enumerate(plate_queries):
+            positions_by_vehicle.setdefault(
+                (plate_query.plate, plate_query.state), []).append(position)
+
+        plate_types: list[Optional[list[str]]] = [
+            plate_query.plate_types.split(',')
+            if plate_query.plate_types is not None else None
+            for plate_query in plate_queries]
+
+        records_by_plate_query: list[Iterable[dict[str, Any]]] = [
+            [] for _ in plate_queries]
+
+        for record in records:
+            for position in positions_by_vehicle.get(
+                    (record.get(plate_field), record.get(state_field)), []):
+                if (plate_types[position] is None or
+                        record.get(plate_type_field) in plate_types[position]):
+                    records_by_plate_query[position].append(record)
+
+        return records_by_plate_query
+
+    def _fetch_dataset_records(self,
+                               dataset_queries: list[Tuple[str, list[PlateQuery], Optional[datetime], Optional[datetime]]]
+                               ) -> Iterator[Tuple[int, Iterable[dict[str, Any]]]]:
+        """Yield (position in dataset_queries, page of records) as soon as
+        each page arrives, for each (endpoint, plate queries, since, until)
+        to be queried.
+
+        Records from a query for several plates still need to be
+        demultiplexed.
+        """
+
+        positions_by_query_string: dict[str, int] = {}
+
+        for position, (endpoint, plate_queries, since, until) in enumerate(dataset_queries):
+            if endpoint == OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT:
+                query_string: str = self._build_open_parking_and_camera_violations_batch_query_string(
+                    plate_queries=plate_queries, since=since, until=until)
+            else:
+                query_string: str = self._build_fiscal_year_database_batch_query_string(
+                    endpoint=endpoint,
+                    plate_queries=plate_queries,
+                    since=since,
+                    until=until)
+
+            positions_by_query_string[query_string] = position
+
+        for query_string, records in self._perform_paged_queries(
+                query_strings=list(positions_by_query_string)):
+            yield positions_by_query_string[query_string], records
+
+    def _fetch_medallion_records(self, plate_query: PlateQuery) -> list[dict[str, Any]]:
+        medallion_query_string: str = (
+            f'{MEDALLION_ENDPOINT}?'
+            f'license_number={plate_query.plate}')
+
+        LOG.debug(
+            f'Querying medallion data from {medallion_query_string}')
+
+        medallion_response: dict[str, Any] = self._perform_query(
+            query_string=medallion_query_string)
+
+        return medallion_response['data']
+
+    def _find_borough(self, county: Optional[str], precinct: Any) -> Optional[str]:
+        """Resolve the borough of a summons from its precinct, falling back to
+        its county code.
+        """
+        borough: Optional[str] = BOROUGHS_BY_PRECINCT.get(self._parse_precinct(precinct))
+
+        if borough is None and county is not None:
+            borough = BOROUGHS_BY_COUNTY_CODE.get(county)
+
+        return borough
+
+    def _find_covering_time_range(self,
+                                  time_ranges: list[Tuple[Optional[datetime], Optional[datetime]]]
+                                  ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Find the smallest (since, until) range containing all of the given
+        ones, where None means unbounded.
+        """
+        sinces: list[Optional[datetime]] = [since for since, _ in time_ranges]
+        untils: list[Optional[datetime]] = [until for _, until in time_ranges]
+
+        return (None if None in sinces else min(sinces),
+                None if None in untils else max(untils))
+
     def _find_max_camera_violations_streak(self,
-                                           list_of_violation_times: list[datetime]) -> Optional[CameraStreakData]:
+                                           list_of_violation_times: list[datetime],
+                                           window: Optional[timedelta] = None) -> Optional[CameraStreakData]:
+        """Find the most violations within any window of time starting at a
+        violation, given the violation times in ascending order.
+
+        By default, the window is the length of the calendar year in which it
+        starts (365 or 366 days), matching the 12-month rolling periods used
+        by the camera violation laws.
+        """
 
         if list_of_violation_times:
             max_streak = 0
@@ -232,21 +823,25 @@ class OpenDataService:
 
             for date in list_of_violation_times:
 
-                LOG.debug(f'date: {date}')
+                if window is None:
+                    window_end = date + \
+                        (datetime(date.year + 1, 1, 1) - datetime(date.year, 1, 1))
+                else:
+                    window_end = date + window
 
-                year_later = date + \
-                    (datetime(date.year + 1, 1, 1) - datetime(date.year, 1, 1))
-                LOG.debug(f'year_later: {year_later}')
+                # The list is sorted, so the violations within the window
+                # are a contiguous slice whose bounds can be bisected.
+                window_start_index = bisect_left(list_of_violation_times, date)
+                window_end_index = bisect_left(
+                    list_of_violation_times, window_end, lo=window_start_index)
 
-                year_long_tickets = [
-                    comp_date for comp_date in list_of_violation_times if date <= comp_date < year_later]
-                this_streak = len(year_long_tickets)
+                this_streak = window_end_index - window_start_index
 
                 if this_streak > max_streak:
 
                     max_streak = this_streak
-                    min_streak_date = year_long_tickets[0]
-                    max_streak_date = year_long_tickets[-1]
+                    min_streak_date = list_of_violation_times[window_start_index]
+                    max_streak_date = list_of_violation_times[window_end_index - 1]
 
             return CameraStreakData(
                 min_streak_date=min_streak_date.strftime('%B %-d, %Y'),
@@ -255,211 +850,337 @@ class OpenDataService:
 
         return None
 
+    def _fiscal_year_overlaps_time_range(self,
+                                         year: int,
+                                         since: Optional[datetime],
+                                         until: Optional[datetime]) -> bool:
+        """Whether any of fiscal year 'year', which runs from July 1 of the
+        previous year through June 30, falls between since and until.
+        """
+        if since is not None and since >= datetime(year, 7, 1):
+            return False
+
+        if until is not None and until < datetime(year - 1, 7, 1):
+            return False
+
+        return True
+
+    def _get_location_to_geocode(self, summons: dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Return the (street, intersecting street) to geocode to find the
+        borough of a fiscal year database summons whose precinct doesn't
+        give it away, or None if there's nothing to go on.
+        """
+        if (summons.get('violation_precinct') is None or
+                summons.get('violation_county') is not None or
+                summons.get('street_name') is None):
+            return None
+
+        return summons['street_name'], summons.get('intersecting_street') or ''
+
+    def _get_vehicle_fields(self, endpoint: str) -> list[str]:
+        """Return the plate, state and plate type fields of a dataset."""
+        if endpoint == OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT:
+            return OPEN_PARKING_AND_CAMERA_VIOLATIONS_VEHICLE_FIELDS
+
+        return FISCAL_YEAR_DATABASE_VEHICLE_FIELDS
+
     def _merge_violations(self,
-                          original_dict: dict[str, Any],
-                          overwrite_dict: dict[str, Any]) -> dict[str, Any]:
+                          original_dict: dict[str, Summons],
+                          overwrite_dict: dict[str, Summons]) -> dict[str, Summons]:
 
-        merged_dict: dict[str, Any] = {**original_dict, **overwrite_dict}
+        merged_dict: dict[str, Summons] = {**original_dict, **overwrite_dict}
 
-        for key, value in merged_dict.items():
+        for key in merged_dict:
             if key in original_dict and key in overwrite_dict:
-                merged_dict[key] = {**original_dict[key], **overwrite_dict[key]}
+                merged_dict[key] = original_dict[key].merge(overwrite_dict[key])
 
-                if merged_dict[key].get('violation') is None:
-                    merged_dict[key]['violation'] = "No Violation Description Available"
+        return merged_dict
 
-                if merged_dict[key].get('borough') is None:
-                    merged_dict[key]['borough'] = 'No Borough Available'
+    def _normalize_fiscal_year_database_records(self,
+                                                endpoint: str,
+                                                plate_query: PlateQuery,
+                                                records: Iterable[dict[str, Any]]) -> Tuple[list[Summons], int]:
+        """Normalize the records from one of the fiscal year violation
+        datasets, returning them with the number whose borough geocoding
+        failed to find.
+        """
 
-        return merged_dict
+        LOG.debug(
+            f'Normalizing fiscal year data for {plate_query.state}:{plate_query.plate}'
+            f'{":" + plate_query.plate_types if plate_query.plate_types else ""} from {endpoint}')
 
-    def _normalize_fiscal_year_database_summons(self, summons) -> dict[str, Any]:
-        if summons.get('issue_date') is None:
-            summons['has_date'] = False
-        else:
+        summonses: list[Summons] = []
+
+        # Summonses whose borough can only be found by geocoding their
+        # streets, by position, are all geocoded together at the end.
+        locations_to_geocode: dict[int, Tuple[str, str]] = {}
+
+        for record in records:
+            summons: Summons = self._normalize_fiscal_year_database_summons(summons=record)
+
+            if summons.borough is None:
+                location: Optional[Tuple[str, str]] = self._get_location_to_geocode(
+                    summons=record)
+
+                if location is not None:
+                    locations_to_geocode[len(summonses)] = location
+
+            summonses.append(summons)
+
+        num_unresolved: int = 0
+
+        if locations_to_geocode:
+            geocoded_boroughs: dict[Tuple[str, ...], Optional[str]] = \
+                self.location_service.get_boroughs_from_location_strings(
+                    locations=locations_to_geocode.values())
+
+            for position, location in locations_to_geocode.items():
+                geocoded_borough: Optional[str] = geocoded_boroughs.get(location)
+
+                if geocoded_borough:
+                    summonses[position] = replace(
+                        summonses[position], borough=geocoded_borough.lower())
+                else:
+                    num_unresolved += 1
+
+        return summonses, num_unresolved
+
+    def _normalize_fiscal_year_database_summons(self, summons: dict[str, Any]) -> Summons:
+        issue_date: Optional[datetime] = None
+        if summons.get('issue_date') is not None:
             try:
-                summons['issue_date'] = datetime.strptime(
-                    summons['issue_date'], self.TIME_FORMAT).strftime(self.TIME_FORMAT)
-                summons['has_date'] = True
+                issue_date = datetime.strptime(
+                    summons['issue_date'], self.TIME_FORMAT)
             except ValueError as ve:
-                summons['has_date'] = False
+                pass
 
+        # Boroughs that can only be found by geocoding are filled in later.
+        borough: Optional[str] = None
         if summons.get('violation_precinct') is not None:
-            boros = [boro for boro, precincts in PRECINCTS_BY_BOROUGH.items() if int(
-                summons['violation_precinct']) in precincts]
-            if boros:
-                summons['borough'] = boros[0]
-            else:
-                if summons.get('violation_county') is not None:
-                    boros = [name for name, codes in BOROUGH_CODES.items(
-                    ) if summons.get('violation_county') in codes]
-                    if boros:
-                        summons['borough'] = boros[0]
-                else:
-                    if summons.get('street_name') is not None:
-                        street_name = summons.get('street_name')
-                        intersecting_street = summons.get(
-                            'intersecting_street') or ''
-
-                        geocoded_borough = self.location_service.get_borough_from_location_strings(
-                            [street_name, intersecting_street])
-                        if geocoded_borough:
-                            summons['borough'] = geocoded_borough.lower()
+            borough = self._find_borough(
+                county=summons.get('violation_county'),
+                precinct=summons['violation_precinct'])
 
         # get human readable ticket type name
+        violation: Optional[str] = None
         if summons.get('violation_description') is None:
             if summons.get('violation_code'):
-                violation_code_definition = HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.get(summons['violation_code'])
-                humanized_description = None
-
-                if violation_code_definition:
-                    if isinstance(violation_code_definition, list) and summons['issue_date']:
-                        # Some violation codes have applied to multiple violations.
-                        for possible_description in violation_code_definition:
-                            if (datetime.strptime(possible_description['start_date'], '%Y-%m-%d').date() <
-                                datetime.strptime(summons['issue_date'], self.TIME_FORMAT).date()):
-
-                                humanized_description = possible_description['description']
-                    else:
-                        humanized_description = violation_code_definition
-
-                summons['violation'] = humanized_description
+                violation_code: str = summons['violation_code']
+
+                if violation_code in _FISCAL_YEAR_DATABASE_VIOLATIONS_BY_START_DATE:
+                    # Some violation codes have applied to multiple violations.
+                    if issue_date:
+                        start_dates, descriptions = \
+                            _FISCAL_YEAR_DATABASE_VIOLATIONS_BY_START_DATE[violation_code]
+
+                        # the last violation to apply before the issue date.
+                        position: int = bisect_left(start_dates, issue_date.date())
+                        if position:
+                            violation = descriptions[position - 1]
+                else:
+                    violation = HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.get(
+                        violation_code) or None
         else:
-            if HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.get(summons['violation_description']):
-                summons['violation'] = HUMANIZED_NAMES_FOR_FISCAL_YEAR_DATABASE_VIOLATIONS.get(
-                    summons['violation_description'])
-            else:
-                summons['violation'] = re.sub(
-                    '[0-9]*-', '', summons['violation_description'])
-
-        return summons
-
-    def _normalize_open_parking_and_camera_violations_summons(self, summons) -> dict[str, Any]:
+            violation = _humanize_fiscal_year_database_violation_description(
+                summons['violation_description'])
+
+        return Summons.create(
+            borough=borough,
+            county=summons.get('violation_county'),
+            issue_date=issue_date,
+            precinct=self._parse_precinct(summons.get('violation_precinct')),
+            summons_number=summons.get('summons_number'),
+            violation=violation)
+
+    def _normalize_open_parking_and_camera_violations_summons(self, summons: dict[str, Any]) -> Summons:
         # get human readable ticket type name
+        violation: Optional[str] = None
         if summons.get('violation') is not None:
-            summons['violation'] = HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS[
+            violation = HUMANIZED_NAMES_FOR_OPEN_PARKING_AND_CAMERA_VIOLATIONS[
                 summons['violation']]
 
         # normalize the date
-        if summons.get('issue_date') is None:
-            summons['has_date'] = False
-
-        else:
+        issue_date: Optional[datetime] = None
+        if summons.get('issue_date') is not None:
             try:
-                summons['issue_date'] = datetime.strptime(
-                    summons['issue_date'], '%m/%d/%Y').strftime(self.TIME_FORMAT)
-                summons['has_date'] = True
+                issue_date = datetime.strptime(
+                    summons['issue_date'], '%m/%d/%Y')
             except ValueError as ve:
-                summons['has_date'] = False
+                pass
 
+        borough: Optional[str] = None
         if summons.get('precinct') is not None:
-            boros = [boro for boro, precincts in PRECINCTS_BY_BOROUGH.items() if int(
-                summons['precinct']) in precincts]
-            if boros:
-                summons['borough'] = boros[0]
-            else:
-                if summons.get('county') is not None:
-                    boros = [name for name, codes in BOROUGH_CODES.items(
-                    ) if summons.get('county') in codes]
-                    if boros:
-                        summons['borough'] = boros[0]
+            borough = self._find_borough(
+                county=summons.get('county'),
+                precinct=summons['precinct'])
 
-        summons = self._add_fine_data_for_open_parking_and_camera_violations_summons(
+        fines: dict[str, int] = self._calculate_fines_for_open_parking_and_camera_violations_summons(
             summons=summons)
 
-        return summons
+        return Summons.create(
+            borough=borough,
+            county=summons.get('county'),
+            issue_date=issue_date,
+            precinct=self._parse_precinct(summons.get('precinct')),
+            summons_number=summons.get('summons_number'),
+            violation=violation,
+            **fines)
 
-    def _perform_all_queries(self,
-                             plate_query: PlateQuery,
-                             since: datetime,
-                             until: datetime) -> OpenDataServicePlateLookup:
-
-        if self.MEDALLION_PATTERN.search(plate_query.plate) is not None:
-            plate_query = self._perform_medallion_query(
-                plate_query=plate_query)
+    def _parse_precinct(self, precinct: Any) -> Optional[int]:
+        try:
+            return int(precinct)
+        except (TypeError, ValueError):
+            return None
 
-        opacv_result: dict[str, Any] = self._perform_open_parking_and_camera_violations_query(
-            plate_query=plate_query, since=since, until=until)
-        fiscal_year_result: dict[str, Any] = self._perform_fiscal_year_database_queries(
-            plate_query=plate_query, since=since, until=until)
+    def _perform_all_queries(self,
+                             plate_queries: list[PlateQuery],
+                             time_ranges: list[Tuple[Optional[datetime], Optional[datetime]]]
+                             ) -> list[OpenDataServicePlateLookup]:
+
+        plate_queries = [
+            self._perform_medallion_query(plate_query=plate_query)
+            if self.MEDALLION_PATTERN.search(plate_query.plate) is not None
+            else plate_query for plate_query in plate_queries]
+
+        violations_by_endpoint: list[dict[str, dict[str, Summons]]] = [
+            {OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT: {},
+             **{endpoint: {} for endpoint in FISCAL_YEAR_DATABASE_ENDPOINTS.values()}}
+            for _ in plate_queries]
+
+        # Every dataset is queried independently, so submit all of the
+        # requests up front and normalize each response as it arrives.
+        # Each dataset is paired with the positions of the plate queries
+        # that it is queried for.
+        datasets: list[Tuple[str, list[int]]] = [
+            (OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT, list(range(len(plate_queries))))]
+
+        # Closed fiscal years never change, so their normalized records are
+        # kept for good once fetched.
+        records_to_cache: dict[Tuple[str, int], list[Summons]] = {}
 
-        violations: dict[str, Any] = self._merge_violations(opacv_result, fiscal_year_result)
+        for year, endpoint in FISCAL_YEAR_DATABASE_ENDPOINTS.items():
+            positions: list[int] = []
 
-        return self._calculate_aggregate_data(plate_query=plate_query,
-                                              violations=violations)
+            for position, plate_query in enumerate(plate_queries):
+                since, until = time_ranges[position]
 
+                if not self._fiscal_year_overlaps_time_range(
+                        year=year, since=since, until=until):
+                    continue
 
-    def _perform_fiscal_year_database_queries(self,
-                                              plate_query: PlateQuery,
-                                              since: datetime,
-                                              until: datetime) -> dict[str, Any]:
-        """Grab data from each of the fiscal year violation datasets"""
+                if year in CLOSED_FISCAL_YEARS and self.fiscal_year_database_cache:
+                    cached_records: Optional[list[dict[str, Any]]] = \
+                        self.fiscal_year_database_cache.get(
+                            endpoint=endpoint, plate_query=plate_query)
+
+                    if cached_records is not None:
+                        for cached_record in cached_records:
+                            self._add_violation_if_within_time_range(
+                                summons=Summons.from_dict(cached_record),
+                                since=since,
+                                until=until,
+                                violations=violations_by_endpoint[position][endpoint])
+                        continue
 
-        violations: dict[str, Any] = {}
+                    # Results narrowed to a time range are not the full set
+                    # of records for the plate, so they can't be cached.
+                    if since is None and until is None:
+                        records_to_cache[(endpoint, position)] = []
 
-        # iterate through the endpoints
-        for year, endpoint in FISCAL_YEAR_DATABASE_ENDPOINTS.items():
+                positions.append(position)
 
-            fiscal_year_database_query_string: str = (
-                f"{endpoint}?"
-                f"plate_id={plate_query.plate}&"
-                f"registration_state={plate_query.state}"
-                f"{'&$where=plate_type%20in(' + ','.join(['%27' + type + '%27' for type in plate_query.plate_types.split(',')]) + ')' if plate_query.plate_types is not None else ''}")
+            if positions:
+                datasets.append((endpoint, positions))
 
-            fiscal_year_database_response: dict[str, Any] = self._perform_query(
-                query_string=fiscal_year_database_query_string)
+        # Each dataset is queried over the range covering every plate
+        # query's own, which is then applied to each plate's records.
+        dataset_queries: list[Tuple[str, list[PlateQuery], Optional[datetime], Optional[datetime]]] = []
+        for endpoint, positions in datasets:
+            since, until = self._find_covering_time_range(
+                time_ranges=[time_ranges[position] for position in positions])
 
-            fiscal_year_database_data: dict[str, str] = \
-                fiscal_year_database_response['data']
+            dataset_queries.append(
+                (endpoint, [plate_queries[position] for position in positions], since, until))
 
-            LOG.debug(
-                f'Fiscal year data for {plate_query.state}:{plate_query.plate}'
-                f'{":" + plate_query.plate_types if plate_query.plate_types else ""} for {year}: '
-                f'{fiscal_year_database_data}')
+        # Each record is normalized as soon as it is decoded, so neither the
+        # response bodies nor the raw records are ever held in memory whole.
+        for dataset_position, records in self._fetch_dataset_records(
+                dataset_queries=dataset_queries):
 
-            for record in fiscal_year_database_data:
-                record = self._normalize_fiscal_year_database_summons(
-                    summons=record)
+            endpoint, positions = datasets[dataset_position]
 
-                # structure response and only use the data we need
-                new_data: dict[str, Any] = {
-                    needed_field: record.get(needed_field) for needed_field in FISCAL_YEAR_DATABASE_NEEDED_FIELDS}
+            records_by_plate_query: list[Iterable[dict[str, Any]]] = self._demultiplex_records(
+                endpoint=endpoint,
+                plate_queries=[plate_queries[position] for position in positions],
+                records=records)
 
-                if new_data.get('has_date'):
-                    try:
-                        issue_date: datetime = datetime.strptime(new_data['issue_date'], self.TIME_FORMAT)
+            for position, plate_query_records in zip(positions, records_by_plate_query):
+                since, until = time_ranges[position]
 
-                        if (since is None or issue_date >= since) and (until is None or issue_date <= until):
-                            violations[new_data['summons_number']] = new_data
+                if endpoint == OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT:
+                    violations_by_endpoint[position][endpoint].update(
+                        self._process_open_parking_and_camera_violations_records(
+                            plate_query=plate_queries[position],
+                            records=plate_query_records,
+                            since=since,
+                            until=until))
+                else:
+                    normalized_records, num_unresolved = \
+                        self._normalize_fiscal_year_database_records(
+                            endpoint=endpoint,
+                            plate_query=plate_queries[position],
+                            records=plate_query_records)
+
+                    if (endpoint, position) in records_to_cache:
+                        if num_unresolved:
+                            # Geocoding may yet find these boroughs, which
+                            # a cached record would go without for good.
+                            LOG.debug(
+                                f'Not caching {endpoint} records with '
+                                f'{num_unresolved} unresolved boroughs')
 
+                            del records_to_cache[(endpoint, position)]
                         else:
-                            LOG.debug(
-                                f"record {new_data['summons_number']} ({new_data['issue_date']}) "
-                                f"is not within time range "
-                                f"({since.strftime(self.TIME_FORMAT) if since else 'any'}<->"
-                                f"{until.strftime(self.TIME_FORMAT) if until else 'any'}")
+                            records_to_cache[(endpoint, position)].extend(normalized_records)
 
-                        continue
+                    for summons in normalized_records:
+                        self._add_violation_if_within_time_range(
+                            summons=summons,
+                            since=since,
+                            until=until,
+                            violations=violations_by_endpoint[position][endpoint])
 
-                    except ValueError as ve:
-                        LOG.info(f"Issue time could not be determined for {new_data['summons_number']}")
+        # Only cache once every dataset has come back in full.
+        for (endpoint, position), normalized_records in records_to_cache.items():
+            self.fiscal_year_database_cache.set(
+                endpoint=endpoint,
+                plate_query=plate_queries[position],
+                records=[summons.to_dict() for summons in normalized_records])
 
-                violations[new_data['summons_number']] = new_data
+        lookup_results: list[OpenDataServicePlateLookup] = []
 
-        return violations
+        for plate_query, plate_query_violations in zip(plate_queries, violations_by_endpoint):
+            # Merge in dataset order so that results do not depend on which
+            # response happened to arrive first.
+            opacv_result: dict[str, Summons] = plate_query_violations[
+                OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT]
 
-    def _perform_medallion_query(self, plate_query: PlateQuery
-                                 ) -> PlateQuery:
-        medallion_query_string: str = (
-            f'{MEDALLION_ENDPOINT}?'
-            f'license_number={plate_query.plate}')
+            fiscal_year_result: dict[str, Summons] = {}
+            for endpoint in FISCAL_YEAR_DATABASE_ENDPOINTS.values():
+                fiscal_year_result.update(plate_query_violations[endpoint])
 
-        LOG.debug(
-            f'Querying medallion data from {medallion_query_string}')
+            violations: dict[str, Summons] = self._merge_violations(opacv_result, fiscal_year_result)
 
-        medallion_response: dict[str, dict[str, Any]] = self._perform_query(query_string=medallion_query_string)
+            lookup_results.append(
+                self._calculate_aggregate_data(plate_query=plate_query,
+                                               violations=violations))
 
-        medallion_data: dict[str, Any] = medallion_response['data']
+        return lookup_results
+
+    def _perform_medallion_query(self, plate_query: PlateQuery
+                                 ) -> PlateQuery:
+        medallion_data: list[dict[str, Any]] = self._fetch_medallion_records(
+            plate_query=plate_query)
 
         LOG.debug(
             f'Medallion data for {plate_query.state}:{plate_query.plate} – '
@@ -480,83 +1201,179 @@ class OpenDataService:
 
         return plate_query
 
-    def _perform_open_parking_and_camera_violations_query(self,
-                                                          plate_query: PlateQuery,
-                                                          since: datetime,
-                                                          until: datetime) -> dict[str, Any]:
-        """Grab data from 'Open Parking and Camera Violations'"""
+    def _perform_paged_queries(self,
+                               query_strings: list[str]
+                               ) -> Iterator[Tuple[str, Iterator[dict[str, Any]]]]:
+        """Yield (query string, page of records) for each of the given queries
+        as soon as the page arrives.
 
-        violations: dict[str, Any] = {}
+        Each page's records are decoded one at a time as they are read from
+        the response, so they should be consumed before the next page is
+        requested.
 
-        # response from city open data portal
-        open_parking_and_camera_violations_query_string: str = (
-            f'{OPEN_PARKING_AND_CAMERA_VIOLATIONS_ENDPOINT}?'
-            f'plate={plate_query.plate}&'
-            f'state={plate_query.state}'
-            f"{'&$where=license_type%20in(' + ','.join(['%27' + type + '%27' for type in plate_query.plate_types.split(',')]) + ')' if plate_query.plate_types is not None else ''}")
+        Socrata caps each response at MAX_RESULTS rows, so whenever a full
+        page comes back, the next page of that query is requested using a
+        stable ordering on the dataset's row id.
+        """
 
-        open_parking_and_camera_violations_response: dict[str, Any] = self._perform_query(
-            query_string=open_parking_and_camera_violations_query_string)
+        pending: dict[Future, Tuple[str, int]] = {}
 
-        open_parking_and_camera_violations_data: list[dict[str, Any]] = \
-            open_parking_and_camera_violations_response['data']
+        try:
+            for query_string in query_strings:
+                pending[self._submit_query(
+                    query_string=self._add_query_page(query_string=query_string, offset=0))
+                ] = (query_string, 0)
 
-        LOG.debug(
-            f'Open Parking and Camera Violations data for {plate_query.state}:{plate_query.plate}'
-            f'{":" + plate_query.plate_types if plate_query.plate_types else ""}: '
-            f'{open_parking_and_camera_violations_data}')
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
 
-        # only data we're looking for
-        opacv_desired_keys = OPEN_PARKING_AND_CAMERA_VIOLATIONS_NEEDED_FIELDS
+                for future in done:
+                    query_string, offset = pending.pop(future)
 
-        # add violation if it's missing
-        for record in open_parking_and_camera_violations_data:
-            record = self._normalize_open_parking_and_camera_violations_summons(
-                summons=record)
+                    records: Iterator[dict[str, Any]] = self._read_query_records(
+                        future=future, query_string=query_string)
 
-            new_data = {needed_field: record.get(needed_field) for needed_field in opacv_desired_keys}
+                    page_size: int = 0
 
-            if new_data.get('has_date'):
-                try:
-                    issue_date: datetime = datetime.strptime(new_data['issue_date'], self.TIME_FORMAT)
+                    def read_page() -> Iterator[dict[str, Any]]:
+                        nonlocal page_size
+                        for record in records:
+                            page_size += 1
+                            yield record
+
+                    page: Iterator[dict[str, Any]] = read_page()
+
+                    yield query_string, page
 
-                    if (since is None or issue_date >= since) and (until is None or issue_date <= until):
-                        violations[new_data['summons_number']] = new_data
+                    # Whatever of the page wasn't used still has to be read
+                    # to know whether there are more pages.
+                    for _ in page:
+                        pass
+
+                    if page_size >= self.MAX_RESULTS:
+                        next_offset: int = offset + page_size
 
-                    else:
                         LOG.debug(
-                            f"record {new_data['summons_number']} ({new_data['issue_date']}) "
-                            f"is not within time range "
-                            f"({since.strftime(self.TIME_FORMAT) if since else 'any'}<->"
-                            f"{until.strftime(self.TIME_FORMAT) if until else 'any'}")
+                            f'Requesting results from offset {next_offset} '
+                            f'for {query_string}')
+
+                        pending[self._submit_query(
+                            query_string=self._add_query_page(
+                                query_string=query_string, offset=next_offset))
+                        ] = (query_string, next_offset)
+
+        finally:
+            # Don't leave requests running, or responses holding on to
+            # pooled connections, for a lookup that has failed or been
+            # abandoned.
+            for future in pending:
+                if not future.cancel():
+                    future.add_done_callback(self._close_query_response)
 
-                    continue
+    def _perform_query(self, query_string: str) -> dict[str, Any]:
+        return self._read_query_response(
+            future=self._submit_query(query_string=query_string),
+            query_string=query_string)
 
-                except ValueError as ve:
-                    LOG.info(f"Issue time could not be determined for {new_data['summons_number']}")
+    def _process_open_parking_and_camera_violations_records(self,
+                                                            plate_query: PlateQuery,
+                                                            records: Iterable[dict[str, Any]],
+                                                            since: Optional[datetime],
+                                                            until: Optional[datetime]) -> dict[str, Summons]:
+        """Normalize the records from 'Open Parking and Camera Violations'"""
 
-            violations[new_data['summons_number']] = new_data
+        violations: dict[str, Summons] = {}
 
-        return violations
+        LOG.debug(
+            f'Normalizing Open Parking and Camera Violations data for '
+            f'{plate_query.state}:{plate_query.plate}'
+            f'{":" + plate_query.plate_types if plate_query.plate_types else ""}')
 
-    def _perform_query(self, query_string: str) -> dict[str, Any]:
-        full_url: str = f'{self._add_query_limit_and_token(query_string)}'
-        response = self.api.get(full_url)
+        for record in records:
+            summons: Summons = self._normalize_open_parking_and_camera_violations_summons(
+                summons=record)
 
-        result = response.result()
+            self._add_violation_if_within_time_range(
+                summons=summons, since=since, until=until, violations=violations)
 
-        if result.status_code in range(200, 300):
-            # Only attempt to read json on a successful response.
-            return {'data': result.json()}
-        elif result.status_code in range(300, 400):
+        return violations
+
+    def _raise_for_query_status(self, status_code: int, query_string: str) -> None:
+        if status_code in range(300, 400):
             raise APIFailureException(
                 f'redirect error when accessing {query_string}')
-        elif result.status_code in range(400, 500):
+        elif status_code in range(400, 500):
             raise APIFailureException(
                 f'user error when accessing {query_string}')
-        elif result.status_code in range(500, 600):
+        elif status_code in range(500, 600):
             raise APIFailureException(
                 f'server error when accessing {query_string}')
         else:
             raise APIFailureException(
                 f'unknown error when accessing {query_string}')
+
+    def _read_query_records(self,
+                            future: Future,
+                            query_string: str) -> Iterator[dict[str, Any]]:
+        """Return an iterator decoding a query's records one at a time as
+        they are read from its response.
+        """
+        try:
+            result = future.result()
+        except requests.exceptions.Timeout as exc:
+            raise APIFailureException(
+                f'timed out when accessing {query_string}: {exc}')
+
+        if result.status_code not in range(200, 300):
+            result.close()
+            self._raise_for_query_status(
+                status_code=result.status_code, query_string=query_string)
+
+        def decode_records() -> Iterator[dict[str, Any]]:
+            # Only attempt to read json on a successful response.
+            try:
+                yield from iter_json_array(
+                    result.iter_content(chunk_size=self.RESPONSE_CHUNK_SIZE))
+            except ValueError as exc:
+                raise APIFailureException(
+                    f'invalid response when accessing {query_string}: {exc}')
+            finally:
+                result.close()
+
+        return decode_records()
+
+    def _read_query_response(self, future: Future, query_string: str) -> dict[str, Any]:
+        return {'data': list(self._read_query_records(
+            future=future, query_string=query_string))}
+
+    def _record_query_outcome(self, endpoint: str, future: Future) -> None:
+        if future.cancelled():
+            self.throttle.after_cancel()
+        elif future.exception() is not None:
+            self.throttle.after_response(endpoint=endpoint, status_code=None)
+        else:
+            self.throttle.after_response(
+                endpoint=endpoint, status_code=future.result().status_code)
+
+    def _submit_query(self, query_string: str) -> Future:
+        full_url: str = f'{self._add_query_limit_and_token(query_string)}'
+
+        endpoint: str = query_string.split('?')[0]
+
+        # Fails fast while the endpoint's circuit breaker is open, so the
+        # lookup can be retried later.
+        self.throttle.before_request(endpoint=endpoint)
+
+        try:
+            # Stream the body so that records can be decoded as they arrive.
+            future: Future = self.api.get(
+                full_url, stream=True, timeout=self.QUERY_TIMEOUT_SECONDS)
+        except Exception:
+            self.throttle.after_cancel()
+            raise
+
+        future.add_done_callback(
+            lambda done_future: self._record_query_outcome(
+                endpoint=endpoint, future=done_future))
+
+        return future
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+
+from typing import Any, Optional
+
+from traffic_violations.models.plate_query import PlateQuery
+
+LOG = logging.getLogger(__name__)
+
+
+class FiscalYearDatabaseCache:
+    """ A disk-backed store of normalized fiscal year database results.
+
+    Closed fiscal year datasets no longer change, so the normalized records
+    for a plate query against one of them can be kept forever. The store is
+    a local SQLite file, so it survives restarts and can be shared by every
+    process on the host.
+    """
+
+    # Bump when the normalized record format changes to orphan old entries.
+    CACHE_VERSION = 2
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, timeout=30)
+
+        # Write-ahead logging lets readers in other processes proceed while
+        # one process is writing.
+        self._connection.execute('PRAGMA journal_mode=WAL')
+
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS fiscal_year_database_results ('
+                'cache_key TEXT PRIMARY KEY, '
+                'records TEXT NOT NULL)')
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get(self,
+            endpoint: str,
+            plate_query: PlateQuery) -> Optional[list[dict[str, Any]]]:
+        """Return the cached normalized records, or None on a miss."""
+
+        cache_key: str = self._build_cache_key(
+            endpoint=endpoint, plate_query=plate_query)
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT records FROM fiscal_year_database_results '
+                'WHERE cache_key = ?', (cache_key,)).fetchone()
+
+        if row is None:
+            return None
+
+        LOG.debug(
+            f'Using cached fiscal year data for {plate_query.state}:{plate_query.plate}'
+            f'{":" + plate_query.plate_types if plate_query.plate_types else ""} from {endpoint}')
+
+        return json.loads(row[0])
+
+    def set(self,
+            endpoint: str,
+            plate_query: PlateQuery,
+            records: list[dict[str, Any]]) -> None:
+
+        cache_key: str = self._build_cache_key(
+            endpoint=endpoint, plate_query=plate_query)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO fiscal_year_database_results '
+                '(cache_key, records) VALUES (?, ?)',
+                (cache_key, json.dumps(records)))
+
+    def _build_cache_key(self, endpoint: str, plate_query: PlateQuery) -> str:
+        key_parts: list[Any] = [self.CACHE_VERSION,
+                                endpoint,
+                                plate_query.plate,
+                                plate_query.state,
+                                plate_query.plate_types]
+
+        return hashlib.sha256(json.dumps(key_parts).encode('utf-8')).hexdigest()
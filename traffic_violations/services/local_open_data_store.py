@@ -0,0 +1,245 @@
+import json
+import logging
+import sqlite3
+import threading
+
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+
+class LocalOpenDataStore:
+    """ A local SQLite mirror of the raw NYC Open Data violation datasets.
+
+    Rows are kept exactly as the portal returns them, keyed by dataset
+    endpoint and a per-row key (such as the summons number), and indexed
+    on (plate, state) so a vehicle's records can be read without a full
+    scan.
+
+    Each batch of records written also logs the vehicles it changed, so
+    that other processes sharing the file, like the bot's, can tell which
+    of their cached lookups are out of date.
+    """
+
+    # Rows are written in batches of this size when bulk loading.
+    LOAD_BATCH_SIZE = 10_000
+
+    # How many of the latest vehicle changes are logged. A reader that
+    # falls further behind than this can't tell which vehicles changed.
+    MAX_LOGGED_VEHICLE_CHANGES = 1_000_000
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+
+        # The last logged vehicle change this store has handed out.
+        self._seen_change_id: int = 0
+
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, timeout=30)
+
+        # Write-ahead logging lets lookups proceed while a load is running.
+        self._connection.execute('PRAGMA journal_mode=WAL')
+
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS open_data_records ('
+                'dataset TEXT NOT NULL, '
+                'record_key TEXT NOT NULL, '
+                'plate TEXT NOT NULL, '
+                'state TEXT NOT NULL, '
+                'record TEXT NOT NULL, '
+                'PRIMARY KEY (dataset, record_key))')
+
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS open_data_records_vehicle '
+                'ON open_data_records (dataset, plate, state)')
+
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS sync_watermarks ('
+                'dataset TEXT PRIMARY KEY, '
+                'updated_at TEXT NOT NULL)')
+
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS vehicle_totals ('
+                'dataset TEXT NOT NULL, '
+                'plate TEXT NOT NULL, '
+                'state TEXT NOT NULL, '
+                'totals TEXT NOT NULL, '
+                'PRIMARY KEY (dataset, plate, state))')
+
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS vehicle_changes ('
+                'change_id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'dataset TEXT NOT NULL, '
+                'plate TEXT NOT NULL, '
+                'state TEXT NOT NULL)')
+
+            # Changes made before this store was opened can't be cached by
+            # whoever opened it.
+            self._seen_change_id = self._connection.execute(
+                'SELECT COALESCE(MAX(change_id), 0) FROM vehicle_changes').fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get_records(self,
+                    dataset: str,
+                    plate: str,
+                    state: str) -> list[dict[str, Any]]:
+        """Return the raw records of a dataset for a vehicle, in the order
+        they were loaded, which for a full export is the portal's own.
+        """
+
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT record FROM open_data_records '
+                'WHERE dataset = ? AND plate = ? AND state = ? '
+                'ORDER BY rowid',
+                (dataset, plate, state)).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def get_new_vehicle_changes(self) -> Optional[set[Tuple[str, str, str]]]:
+        """Return the (dataset, plate, state) of the vehicles whose records
+        have been written since this store last returned them, from any
+        process, or None if too many have been to tell.
+        """
+
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT change_id, dataset, plate, state FROM vehicle_changes '
+                'WHERE change_id > ? ORDER BY change_id',
+                (self._seen_change_id,)).fetchall()
+
+            if not rows:
+                return set()
+
+            # Changes are only ever dropped from the front of the log, so
+            # one right after the last seen means none were missed.
+            is_complete: bool = rows[0][0] == self._seen_change_id + 1
+
+            self._seen_change_id = rows[-1][0]
+
+        if not is_complete:
+            return None
+
+        return {(dataset, plate, state) for _, dataset, plate, state in rows}
+
+    def get_vehicle_totals(self,
+                           dataset: str,
+                           plate: str,
+                           state: str) -> Optional[dict[str, int]]:
+        """Return the stored totals of a dataset for a vehicle, if any."""
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT totals FROM vehicle_totals '
+                'WHERE dataset = ? AND plate = ? AND state = ?',
+                (dataset, plate, state)).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def get_watermark(self, dataset: str) -> Optional[str]:
+        """Return the ':updated_at' up to which a dataset has been synced."""
+
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT updated_at FROM sync_watermarks WHERE dataset = ?',
+                (dataset,)).fetchone()
+
+        return row[0] if row else None
+
+    def load_records(self,
+                     dataset: str,
+                     records: Iterable[dict[str, Any]],
+                     key_fields: list[str],
+                     plate_field: str,
+                     state_field: Optional[str] = None,
+                     on_batch_written: Optional[Callable[[set[Tuple[str, str]]], None]] = None) -> int:
+        """Insert or replace records of a dataset, returning the number
+        written.
+
+        A record's key joins its key_fields, which together must identify
+        it within the dataset. Records without a key or plate are skipped.
+        Datasets without a state field, like the medallion dataset, are
+        stored with an empty state. on_batch_written, if given, is called
+        with the (plate, state) of the vehicles in each batch once it is
+        written.
+        """
+
+        num_written: int = 0
+        batch: list[tuple[str, str, str, str, str]] = []
+
+        for record in records:
+            key_values: list[Optional[str]] = [
+                record.get(key_field) for key_field in key_fields]
+            plate: Optional[str] = record.get(plate_field)
+
+            if not all(key_values) or not plate:
+                LOG.debug(f'Skipping {dataset} record without a key or plate: {record}')
+                continue
+
+            batch.append((dataset,
+                          ':'.join(str(key_value) for key_value in key_values),
+                          plate,
+                          record.get(state_field, '') if state_field else '',
+                          json.dumps(record)))
+
+            if len(batch) >= self.LOAD_BATCH_SIZE:
+                num_written += self._write_batch(
+                    dataset=dataset, batch=batch, on_batch_written=on_batch_written)
+                batch = []
+
+        if batch:
+            num_written += self._write_batch(
+                dataset=dataset, batch=batch, on_batch_written=on_batch_written)
+
+        return num_written
+
+    def set_vehicle_totals(self,
+                           dataset: str,
+                           totals_by_vehicle: dict[Tuple[str, str], dict[str, int]]) -> None:
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO vehicle_totals '
+                '(dataset, plate, state, totals) VALUES (?, ?, ?, ?)',
+                [(dataset, plate, state, json.dumps(totals))
+                 for (plate, state), totals in totals_by_vehicle.items()])
+
+    def set_watermark(self, dataset: str, updated_at: str) -> None:
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO sync_watermarks '
+                '(dataset, updated_at) VALUES (?, ?)',
+                (dataset, updated_at))
+
+    def _write_batch(self,
+                     dataset: str,
+                     batch: list[tuple[str, str, str, str, str]],
+                     on_batch_written: Optional[Callable[[set[Tuple[str, str]]], None]]) -> int:
+        vehicles: set[Tuple[str, str]] = {(plate, state) for _, _, plate, state, _ in batch}
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO open_data_records '
+                '(dataset, record_key, plate, state, record) '
+                'VALUES (?, ?, ?, ?, ?)', batch)
+
+            # Log the changed vehicles along with their records, dropping
+            # the oldest changes past the most that are kept.
+            self._connection.executemany(
+                'INSERT INTO vehicle_changes (dataset, plate, state) VALUES (?, ?, ?)',
+                [(dataset, plate, state) for plate, state in vehicles])
+
+            self._connection.execute(
+                'DELETE FROM vehicle_changes WHERE change_id <= '
+                '(SELECT MAX(change_id) FROM vehicle_changes) - ?',
+                (self.MAX_LOGGED_VEHICLE_CHANGES,))
+
+        if on_batch_written is not None:
+            on_batch_written(vehicles)
+
+        return len(batch)
@@ -0,0 +1,265 @@
+import logging
+import math
+import threading
+import time
+
+from typing import Callable, Optional
+
+from traffic_violations.services.constants.exceptions import \
+    APIFailureException
+
+LOG = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """ Limits the rate of requests to rate per second, allowing bursts of
+    up to capacity.
+    """
+
+    def __init__(self,
+                 rate: float,
+                 capacity: float,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        self._tokens: float = capacity
+        self._updated_at: float = clock()
+
+    def acquire(self) -> None:
+        """Take a token, waiting for one to be added if there are none."""
+        while True:
+            with self._lock:
+                now: float = self._clock()
+
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_seconds: float = (1 - self._tokens) / self.rate
+
+            self._sleep(wait_seconds)
+
+
+class AdaptiveConcurrencyLimiter:
+    """ Limits the number of requests in flight, adapting the limit to how
+    the server is coping.
+
+    The limit grows by about one for each limit's worth of requests that
+    succeed, and is halved when the server is throttled or overloaded
+    (additive increase, multiplicative decrease). Halvings closer together
+    than decrease_interval_seconds count as one, so a burst of failures
+    from requests already in flight doesn't collapse the limit.
+
+    A request that can't get a slot within acquire_timeout_seconds is
+    refused, so that requests stuck in flight can't hold up every other.
+    """
+
+    def __init__(self,
+                 min_limit: int,
+                 max_limit: int,
+                 decrease_interval_seconds: float = 1.0,
+                 acquire_timeout_seconds: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_interval_seconds = decrease_interval_seconds
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+
+        self._clock = clock
+        self._condition = threading.Condition()
+
+        self._in_flight: int = 0
+        self._limit: float = float(max_limit)
+        self._decreased_at: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        with self._condition:
+            return math.floor(self._limit)
+
+    def acquire(self) -> None:
+        """Wait for a request to be allowed in flight, raising
+        APIFailureException if none is within acquire_timeout_seconds.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                    lambda: self._in_flight < math.floor(self._limit),
+                    timeout=self.acquire_timeout_seconds):
+                raise APIFailureException(
+                    f'no request slot free after {self.acquire_timeout_seconds} seconds')
+
+            self._in_flight += 1
+
+    def release(self, overloaded: Optional[bool]) -> None:
+        """Mark a request as no longer in flight, noting whether the server
+        was overloaded, or None if that isn't known.
+        """
+        with self._condition:
+            self._in_flight -= 1
+
+            if overloaded:
+                now: float = self._clock()
+
+                if (self._decreased_at is None or
+                        now - self._decreased_at >= self.decrease_interval_seconds):
+                    self._limit = max(float(self.min_limit), self._limit / 2)
+                    self._decreased_at = now
+
+                    LOG.debug(f'Concurrency limit decreased to {math.floor(self._limit)}')
+
+            elif overloaded is not None:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+            self._condition.notify_all()
+
+
+class CircuitBreaker:
+    """ Stops sending requests to a server that keeps failing.
+
+    After failure_threshold failures in a row, the breaker opens and
+    requests are refused for reset_seconds. Then a single trial request is
+    let through each reset_seconds: once one succeeds, the breaker closes,
+    and each that fails opens it again.
+    """
+
+    CLOSED = 'closed'
+    HALF_OPEN = 'half-open'
+    OPEN = 'open'
+
+    def __init__(self,
+                 failure_threshold: int,
+                 reset_seconds: float,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._failures: int = 0
+        self._opened_at: Optional[float] = None
+        self._state: str = self.CLOSED
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._clock() - self._opened_at < self.reset_seconds:
+                return False
+
+            # Let one request through to see whether the server is back,
+            # and another if that one hasn't finished by the next period.
+            self._state = self.HALF_OPEN
+            self._opened_at = self._clock()
+            return True
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+
+class OpenDataThrottle:
+    """ Paces requests to the open data portal across every thread in the
+    process.
+
+    Each request takes a token from a shared token bucket and a slot from
+    an adaptive concurrency limit, and is refused outright while its
+    endpoint's circuit breaker is open.
+    """
+
+    # Responses with which Socrata says it is throttling us.
+    THROTTLED_STATUS_CODES = [403, 429]
+
+    def __init__(self,
+                 requests_per_second: float,
+                 burst: int,
+                 max_concurrent_requests: int,
+                 failure_threshold: int,
+                 reset_seconds: float,
+                 acquire_timeout_seconds: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.token_bucket = TokenBucket(
+            rate=requests_per_second, capacity=burst, clock=clock, sleep=sleep)
+
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            min_limit=1,
+            max_limit=max_concurrent_requests,
+            acquire_timeout_seconds=acquire_timeout_seconds,
+            clock=clock)
+
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+
+    def after_cancel(self) -> None:
+        """Give back the slot of a request that was never sent."""
+        self.concurrency_limiter.release(overloaded=None)
+
+    def after_response(self, endpoint: str, status_code: Optional[int]) -> None:
+        """Record how a request to endpoint went, given its response's status
+        code, or None if it never got one.
+        """
+        circuit_breaker: CircuitBreaker = self.get_circuit_breaker(endpoint=endpoint)
+
+        overloaded: bool = (status_code is None or
+                            status_code in self.THROTTLED_STATUS_CODES or
+                            status_code >= 500)
+
+        if overloaded:
+            LOG.warning(f'Request to {endpoint} failed with status {status_code}')
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+
+        self.concurrency_limiter.release(overloaded=overloaded)
+
+    def before_request(self, endpoint: str) -> None:
+        """Wait until a request to endpoint may be sent, raising
+        APIFailureException if its circuit breaker is open or no request
+        slot frees up in time.
+        """
+        if not self.get_circuit_breaker(endpoint=endpoint).allow_request():
+            raise APIFailureException(
+                f'circuit breaker open for {endpoint}')
+
+        self.token_bucket.acquire()
+        self.concurrency_limiter.acquire()
+
+    def get_circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            if endpoint not in self._circuit_breakers:
+                self._circuit_breakers[endpoint] = CircuitBreaker(
+                    failure_threshold=self.failure_threshold,
+                    reset_seconds=self.reset_seconds,
+                    clock=self._clock)
+
+            return self._circuit_breakers[endpoint]
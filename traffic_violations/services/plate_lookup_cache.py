@@ -0,0 +1,176 @@
+import logging
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, Optional, Tuple
+
+import traffic_violations.db.database as db
+
+from traffic_violations.models.response.open_data_service_response import \
+    OpenDataServiceResponse
+
+LOG = logging.getLogger(__name__)
+
+
+class PlateLookupCache:
+    """ A bounded, in-memory cache of recent vehicle lookup responses.
+
+    A response is served as is for ttl_seconds after it is loaded. For
+    max_stale_seconds after that, it is still served, but a background
+    refresh is started so that plates that keep being looked up stay
+    current without anyone waiting on the portal. Older responses are
+    loaded again, and the least recently used responses are evicted past
+    max_size. Only successful responses are cached.
+
+    Refreshes run on a pool of max_refresh_workers threads, so a burst of
+    stale lookups queues its refreshes rather than querying the portal all
+    at once.
+
+    Responses known to be out of date can be dropped with invalidate.
+    """
+
+    def __init__(self,
+                 max_size: int,
+                 ttl_seconds: float,
+                 max_stale_seconds: float,
+                 max_refresh_workers: int = 2,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=max_refresh_workers, thread_name_prefix='plate-lookup-refresh')
+
+        # Least recently used first, each with the time it was loaded.
+        self._entries: OrderedDict[Hashable, Tuple[OpenDataServiceResponse, float]] = OrderedDict()
+        self._refreshing: set[Hashable] = set()
+
+        # Bumped on each invalidation, so that loads begun before one don't
+        # store what it made out of date.
+        self._generation = 0
+
+        self._evictions = 0
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._stale_hits = 0
+
+    def get(self,
+            key: Hashable,
+            load: Callable[[], OpenDataServiceResponse]) -> OpenDataServiceResponse:
+        """Return the cached response for key, calling load to get it if it
+        isn't cached or is too old to serve.
+        """
+        should_refresh: bool = False
+
+        with self._lock:
+            entry: Optional[Tuple[OpenDataServiceResponse, float]] = self._entries.get(key)
+
+            if entry is not None:
+                response, loaded_at = entry
+                age: float = self._clock() - loaded_at
+
+                if age < self.ttl_seconds:
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    return response
+
+                if age < self.ttl_seconds + self.max_stale_seconds:
+                    self._stale_hits += 1
+                    self._entries.move_to_end(key)
+
+                    # One refresh per key at a time is plenty.
+                    should_refresh = key not in self._refreshing
+                    self._refreshing.add(key)
+                else:
+                    del self._entries[key]
+                    entry = None
+
+            if entry is None:
+                self._misses += 1
+
+            generation: int = self._generation
+
+        if entry is not None:
+            if should_refresh:
+                LOG.debug(f'Refreshing stale lookup for {key}')
+                self._refresh_executor.submit(self._refresh, key, load, generation)
+
+            return response
+
+        response = load()
+        self._store(key=key, response=response, generation=generation)
+
+        return response
+
+    def invalidate(self, should_invalidate: Callable[[Hashable], bool]) -> int:
+        """Drop the cached responses whose keys should_invalidate is true
+        for, returning the number dropped.
+        """
+        with self._lock:
+            self._generation += 1
+
+            invalidated_keys: list[Hashable] = [
+                key for key in self._entries if should_invalidate(key)]
+
+            for key in invalidated_keys:
+                del self._entries[key]
+
+        return len(invalidated_keys)
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache's counters and current size."""
+        with self._lock:
+            return {'evictions': self._evictions,
+                    'hits': self._hits,
+                    'misses': self._misses,
+                    'refreshes': self._refreshes,
+                    'size': len(self._entries),
+                    'stale_hits': self._stale_hits}
+
+    def _refresh(self,
+                 key: Hashable,
+                 load: Callable[[], OpenDataServiceResponse],
+                 generation: int) -> None:
+        try:
+            self._store(key=key, response=load(), generation=generation)
+
+            with self._lock:
+                self._refreshes += 1
+
+        except Exception as exc:
+            # The stale response keeps being served until a refresh works.
+            LOG.error(f'Failed to refresh lookup for {key}: {exc}')
+
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+            # Close the worker thread's scoped session, which the lookup
+            # may have used to geocode summonses.
+            db.init_database().session.remove()
+
+    def _store(self,
+               key: Hashable,
+               response: OpenDataServiceResponse,
+               generation: int) -> None:
+        if not response.success:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                # It may have loaded from before an invalidation, so
+                # don't serve it again.
+                return
+
+            self._entries[key] = (response, self._clock())
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
@@ -0,0 +1,53 @@
+import logging
+import threading
+
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+LOG = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """ Coalesces concurrent calls for the same key into one.
+
+    While a call for a key is in flight, later callers with the same key
+    wait for it and share its result (or its exception) instead of making
+    the call again. Once it finishes, the next call for that key starts a
+    new one, so results are never served after the fact.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Call function, or wait for the in-flight call for key to finish,
+        and return its result.
+        """
+        with self._lock:
+            future: Future = self._in_flight.get(key)
+            is_leader: bool = future is None
+
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            LOG.debug(f'Waiting for in-flight call for {key}')
+            return future.result()
+
+        try:
+            result: Any = function()
+        except BaseException as exc:
+            self._finish(key=key)
+            future.set_exception(exc)
+            raise
+
+        self._finish(key=key)
+        future.set_result(result)
+
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._in_flight[key]
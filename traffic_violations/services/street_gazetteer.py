@@ -0,0 +1,218 @@
+import json
+import re
+
+from collections import Counter
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+
+class StreetGazetteer:
+    """ An offline index of the boroughs that New York City streets run
+    through, used to place a summons from its street names without an
+    external geocoder.
+
+    Street names are canonicalized (abbreviations expanded, ordinals and
+    punctuation dropped) and held in a trie keyed by their words, each
+    street counting how often it has been seen in each borough. A street
+    found in only one borough gives its borough away, and for one that
+    crosses boroughs, the intersecting street can narrow it down to one.
+    Streets seen too rarely to trust are left to the geocoder.
+    """
+
+    # Bump when the canonical form or file format changes.
+    FORMAT_VERSION = 1
+
+    # Boroughs with less than this share of a street's sightings are taken
+    # to be mistakes in the geocodes it was built from.
+    MIN_BOROUGH_SHARE = 0.05
+
+    # Streets seen fewer times than this are treated as unknown, since a
+    # stray geocode or two is too little to place a summons by.
+    MIN_SIGHTINGS = 3
+
+    # Suffix used to build geocoding lookup strings from street names.
+    LOOKUP_STRING_SUFFIX = ' New York NY'
+
+    ABBREVIATIONS = {
+        'AV': 'AVENUE', 'AVE': 'AVENUE', 'AVN': 'AVENUE', 'BCH': 'BEACH',
+        'BL': 'BOULEVARD', 'BLVD': 'BOULEVARD', 'BRG': 'BRIDGE', 'CT': 'COURT',
+        'DR': 'DRIVE', 'E': 'EAST', 'EXPWY': 'EXPRESSWAY', 'EXPY': 'EXPRESSWAY',
+        'HWY': 'HIGHWAY', 'LN': 'LANE', 'N': 'NORTH', 'PK': 'PARK',
+        'PKWY': 'PARKWAY', 'PKY': 'PARKWAY', 'PL': 'PLACE', 'PLZ': 'PLAZA',
+        'RD': 'ROAD', 'S': 'SOUTH', 'SQ': 'SQUARE', 'STR': 'STREET',
+        'TER': 'TERRACE', 'TPKE': 'TURNPIKE', 'W': 'WEST'}
+
+    # Where a summons was written relative to the street, e.g. 'EB' or
+    # '20ft N/of', which says nothing about the street itself.
+    NOISE_PATTERN = re.compile(
+        r'\b(?:\d+\s*FT\s+)?[NSEW]/?\s*OF\b|\b\d+\s*FT\b|\b[NSEW]/?B\b|\(.*?\)')
+    ORDINAL_PATTERN = re.compile(r'^(\d+)(?:ST|ND|RD|TH)$')
+    PUNCTUATION_PATTERN = re.compile(r'[^A-Z0-9 ]+')
+
+    # The key under which a trie node holds the boroughs of the street
+    # ending there.
+    _BOROUGHS = ''
+
+    def __init__(self):
+        self._trie: dict[str, Any] = {}
+        self.num_streets = 0
+
+    @classmethod
+    def canonicalize(cls, street: str) -> str:
+        """Reduce a street name to a canonical form, so that 'W 4th St.' and
+        'WEST 4 STREET' are the same street.
+        """
+        street = cls.NOISE_PATTERN.sub(' ', street.upper())
+        words: list[str] = cls.PUNCTUATION_PATTERN.sub(' ', street).split()
+
+        canonical_words: list[str] = []
+        for position, word in enumerate(words):
+            ordinal = cls.ORDINAL_PATTERN.match(word)
+
+            if ordinal:
+                word = ordinal.group(1)
+            elif word == 'ST':
+                # 'ST' ends 'W 4 ST', but starts 'ST MARKS PL'.
+                word = 'STREET' if position == len(words) - 1 else 'SAINT'
+            else:
+                word = cls.ABBREVIATIONS.get(word, word)
+
+            canonical_words.append(word)
+
+        return ' '.join(canonical_words)
+
+    @classmethod
+    def load(cls, path: str) -> 'StreetGazetteer':
+        with open(path) as gazetteer_file:
+            data: dict[str, Any] = json.load(gazetteer_file)
+
+        if data.get('version') != cls.FORMAT_VERSION:
+            raise ValueError(
+                f'{path} is a version {data.get("version")} gazetteer, '
+                f'not version {cls.FORMAT_VERSION}')
+
+        gazetteer = cls()
+        for street, borough_counts in data['streets'].items():
+            for borough, count in borough_counts.items():
+                gazetteer._add_canonical(street=street, borough=borough, count=count)
+
+        return gazetteer
+
+    def add(self, street: str, borough: str, count: int = 1) -> None:
+        """Record that street runs through borough."""
+        canonical_street: str = self.canonicalize(street)
+
+        if canonical_street:
+            self._add_canonical(street=canonical_street, borough=borough, count=count)
+
+    def add_lookup_string(self, lookup_string: str, borough: str) -> bool:
+        """Record the borough of a geocoded lookup string, made of a street
+        and an intersecting street, returning whether its streets could be
+        told apart.
+        """
+        streets: Optional[Tuple[str, str]] = self.split_lookup_string(
+            lookup_string=lookup_string)
+
+        if streets is None:
+            return False
+
+        for street in streets:
+            if street:
+                self._add_canonical(street=street, borough=borough, count=1)
+
+        return True
+
+    def find_borough(self, location_parts: Sequence[str]) -> Optional[str]:
+        """Return the borough of a location given as a street and, maybe,
+        an intersecting street, or None if the gazetteer can't tell.
+        """
+        candidates: Optional[set[str]] = None
+
+        for location_part in location_parts:
+            boroughs: Optional[Counter] = self._find_boroughs(
+                canonical_street=self.canonicalize(location_part))
+
+            if boroughs is None:
+                continue
+
+            total: int = sum(boroughs.values())
+            if total < self.MIN_SIGHTINGS:
+                continue
+
+            street_boroughs: set[str] = {
+                borough for borough, count in boroughs.items()
+                if count >= total * self.MIN_BOROUGH_SHARE}
+
+            candidates = (street_boroughs if candidates is None
+                          else candidates & street_boroughs)
+
+        if candidates is not None and len(candidates) == 1:
+            return next(iter(candidates))
+
+        return None
+
+    def iter_streets(self) -> Iterable[Tuple[str, Counter]]:
+        """Yield (canonical street, borough counts) for every street."""
+        stack: list[Tuple[list[str], dict[str, Any]]] = [([], self._trie)]
+
+        while stack:
+            words, node = stack.pop()
+
+            for word, child in node.items():
+                if word == self._BOROUGHS:
+                    yield ' '.join(words), child
+                else:
+                    stack.append((words + [word], child))
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as gazetteer_file:
+            json.dump({'version': self.FORMAT_VERSION,
+                       'streets': {street: dict(boroughs)
+                                   for street, boroughs in sorted(self.iter_streets())}},
+                      gazetteer_file)
+
+    def split_lookup_string(self, lookup_string: str) -> Optional[Tuple[str, str]]:
+        """Split a geocoding lookup string back into its canonical street and
+        intersecting street, using the longest known street it starts
+        with, or return None if it doesn't start with one.
+        """
+        if lookup_string.endswith(self.LOOKUP_STRING_SUFFIX):
+            lookup_string = lookup_string[:-len(self.LOOKUP_STRING_SUFFIX)]
+
+        # A lookup string without an intersecting street is the street alone.
+        if lookup_string.endswith(' '):
+            return self.canonicalize(lookup_string), ''
+
+        # Each prefix is canonicalized by itself, since whether 'ST' is
+        # 'STREET' or 'SAINT' depends on where the street ends.
+        words: list[str] = lookup_string.split()
+
+        for length in range(len(words), 0, -1):
+            street: str = self.canonicalize(' '.join(words[:length]))
+
+            if self._find_boroughs(canonical_street=street) is not None:
+                return street, self.canonicalize(' '.join(words[length:]))
+
+        return None
+
+    def _add_canonical(self, street: str, borough: str, count: int) -> None:
+        node: dict[str, Any] = self._trie
+        for word in street.split():
+            node = node.setdefault(word, {})
+
+        if self._BOROUGHS not in node:
+            node[self._BOROUGHS] = Counter()
+            self.num_streets += 1
+
+        node[self._BOROUGHS][borough] += count
+
+    def _find_boroughs(self, canonical_street: str) -> Optional[Counter]:
+        if not canonical_street:
+            return None
+
+        node: Optional[dict[str, Any]] = self._trie
+        for word in canonical_street.split():
+            node = node.get(word)
+            if node is None:
+                return None
+
+        return node.get(self._BOROUGHS)
@@ -0,0 +1,154 @@
+import hashlib
+import hmac
+import logging
+import os
+import string
+import threading
+
+from typing import Callable, Iterable
+
+from traffic_violations.models.plate_lookup import PlateLookup
+from traffic_violations.models.unique_identifier_sequence import \
+    UniqueIdentifierSequence
+
+LOG = logging.getLogger(__name__)
+
+_UNIQUE_IDENTIFIER_ALLOCATOR = None
+_UNIQUE_IDENTIFIER_ALLOCATOR_LOCK = threading.Lock()
+
+
+def get_unique_identifier_allocator() -> 'UniqueIdentifierAllocator':
+    """Return the process-wide allocator of plate lookup identifiers,
+    keyed with UNIQUE_IDENTIFIER_KEY, creating it on first use.
+    """
+    global _UNIQUE_IDENTIFIER_ALLOCATOR  # pylint: disable=global-statement
+    with _UNIQUE_IDENTIFIER_ALLOCATOR_LOCK:
+        if not _UNIQUE_IDENTIFIER_ALLOCATOR:
+            key: str = os.getenv('UNIQUE_IDENTIFIER_KEY') or ''
+            if not key:
+                LOG.warning('UNIQUE_IDENTIFIER_KEY is not set, so identifiers can be guessed')
+
+            _UNIQUE_IDENTIFIER_ALLOCATOR = UniqueIdentifierAllocator(
+                key=key.encode(),
+                reserve_block=UniqueIdentifierSequence.reserve_block,
+                find_existing_identifiers=_find_existing_identifiers)
+
+        return _UNIQUE_IDENTIFIER_ALLOCATOR
+
+
+def _find_existing_identifiers(identifiers: list[str]) -> list[str]:
+    return [plate_lookup.unique_identifier for plate_lookup in PlateLookup.query.with_entities(
+        PlateLookup.unique_identifier).filter(PlateLookup.unique_identifier.in_(identifiers))]
+
+
+class UniqueIdentifierAllocator:
+    """ Allocates the unique identifiers of plate lookups without checking
+    each one against the plate_lookups table.
+
+    Each identifier encodes a number from a shared sequence through a keyed
+    permutation, so distinct numbers always give distinct identifiers, and
+    knowing one identifier doesn't give away the next. Numbers are reserved
+    from the sequence block_size at a time, so allocating usually needs no
+    round trip at all. Identifiers saved before this allocator, which were
+    random, are looked up once per block and skipped.
+    """
+
+    ALPHABET = string.ascii_lowercase + string.digits
+    IDENTIFIER_LENGTH = 8
+
+    # Identifiers are encoded from numbers below DOMAIN_SIZE, using a
+    # Feistel network over the smallest even number of bits that covers
+    # it, and re-encoding any number that lands outside it.
+    DOMAIN_SIZE = len(ALPHABET) ** IDENTIFIER_LENGTH
+    HALF_BITS = (DOMAIN_SIZE.bit_length() + 1) // 2
+    HALF_MASK = (1 << HALF_BITS) - 1
+    ROUNDS = 4
+
+    # The most numbers reserved at once, which bounds the lookup of
+    # identifiers already in use.
+    MAX_BLOCK_SIZE = 10_000
+
+    def __init__(self,
+                 key: bytes,
+                 reserve_block: Callable[[int], int],
+                 find_existing_identifiers: Callable[[list[str]], Iterable[str]],
+                 block_size: int = 100):
+        """reserve_block(size) returns the first of size numbers reserved
+        from the sequence, and find_existing_identifiers(identifiers)
+        those of identifiers that have already been saved.
+        """
+        self.block_size = block_size
+
+        self._key = key
+        self._reserve_block = reserve_block
+        self._find_existing_identifiers = find_existing_identifiers
+
+        self._lock = threading.Lock()
+        self._identifiers: list[str] = []
+
+    def allocate(self) -> str:
+        return self.allocate_many(count=1)[0]
+
+    def allocate_many(self, count: int) -> list[str]:
+        """Allocate count identifiers, reserving as many blocks as needed."""
+        with self._lock:
+            while len(self._identifiers) < count:
+                self._identifiers.extend(self._reserve_identifiers(size=min(
+                    self.MAX_BLOCK_SIZE,
+                    max(self.block_size, count - len(self._identifiers)))))
+
+            identifiers: list[str] = self._identifiers[:count]
+            del self._identifiers[:count]
+
+        return identifiers
+
+    def encode(self, number: int) -> str:
+        """Encode a number from the sequence as an identifier."""
+        if not 0 <= number < self.DOMAIN_SIZE:
+            raise ValueError(f'{number} is outside the identifier sequence')
+
+        # Walk the permutation's cycle until it comes back into the
+        # domain, which keeps it a permutation of the domain.
+        permuted: int = self._permute(number)
+        while permuted >= self.DOMAIN_SIZE:
+            permuted = self._permute(permuted)
+
+        characters: list[str] = []
+        for _ in range(self.IDENTIFIER_LENGTH):
+            permuted, index = divmod(permuted, len(self.ALPHABET))
+            characters.append(self.ALPHABET[index])
+
+        return ''.join(characters)
+
+    def _permute(self, number: int) -> int:
+        left: int = number >> self.HALF_BITS
+        right: int = number & self.HALF_MASK
+
+        for round_number in range(self.ROUNDS):
+            left, right = right, left ^ self._round_function(
+                round_number=round_number, half=right)
+
+        return (left << self.HALF_BITS) | right
+
+    def _reserve_identifiers(self, size: int) -> list[str]:
+        first_number: int = self._reserve_block(size)
+
+        identifiers: list[str] = [
+            self.encode(number) for number in range(first_number, first_number + size)]
+
+        existing_identifiers: set[str] = set(
+            self._find_existing_identifiers(identifiers))
+
+        if existing_identifiers:
+            LOG.info(f'Skipping {len(existing_identifiers)} identifiers already in use')
+
+        return [identifier for identifier in identifiers
+                if identifier not in existing_identifiers]
+
+    def _round_function(self, round_number: int, half: int) -> int:
+        digest: bytes = hmac.new(
+            self._key,
+            round_number.to_bytes(1, 'big') + half.to_bytes(8, 'big'),
+            hashlib.sha256).digest()
+
+        return int.from_bytes(digest[:8], 'big') & self.HALF_MASK
@@ -1,22 +1,24 @@
 import logging
 import pytz
-import random
 import re
 import requests
 import requests_futures.sessions
-import string
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from requests.packages.urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from sqlalchemy import and_, func
-from typing import Any, Optional, Tuple, Type, Union
+from typing import Any, Iterator, Optional, Tuple, Type, Union
+
+import traffic_violations.db.database as db
 
 from traffic_violations.constants import (L10N, endpoints, lookup_sources,
     thresholds, twitter as twitter_constants, regexps as regexp_constants)
 
 from traffic_violations.models.camera_streak_data import CameraStreakData
 from traffic_violations.models.campaign import Campaign
+from traffic_violations.models.campaign_vehicle_lookup import CampaignVehicleLookup
 from traffic_violations.models.failed_plate_lookup import FailedPlateLookup
 from traffic_violations.models.fine_data import FineData
 from traffic_violations.models.plate_lookup import PlateLookup
@@ -36,10 +38,16 @@ from traffic_violations.models.response.traffic_violations_aggregator_response \
 from traffic_violations.models.response.valid_vehicle_response \
     import ValidVehicleResponse
 from traffic_violations.models.vehicle import Vehicle
+from traffic_violations.models.vehicle_lookup_stats import VehicleLookupStats
 
-from traffic_violations.services.apis.open_data_service import OpenDataService
+from traffic_violations.services.apis.open_data_service import \
+    OpenDataService, create_open_data_service, get_max_concurrent_lookups
 from traffic_violations.services.apis.tweet_detection_service import \
     TweetDetectionService
+from traffic_violations.services.unique_identifier_allocator import \
+    get_unique_identifier_allocator
+
+from traffic_violations.utils import plate_tokenizer
 
 LOG = logging.getLogger(__name__)
 
@@ -60,14 +68,15 @@ class TrafficViolationsAggregator:
 
     MYSQL_TIME_FORMAT: str = '%Y-%m-%d %H:%M:%S'
 
-    UNIQUE_IDENTIFIER_STRING_LENGTH = 8
-
     def __init__(self):
         self.tweet_detection_service = TweetDetectionService()
 
         self.eastern = pytz.timezone('US/Eastern')
         self.utc = pytz.timezone('UTC')
 
+        # Serializes writes from vehicles looked up at the same time.
+        self._database_write_lock = threading.Lock()
+
     def initiate_reply(self, lookup_request: Type[BaseLookupRequest]):
         """Look up the plates in a request and return the results."""
         LOG.debug('Calling initiate_reply')
@@ -169,14 +178,19 @@ class TrafficViolationsAggregator:
 
             summary: TrafficViolationsAggregatorResponse = TrafficViolationsAggregatorResponse()
 
+            # Valid vehicles are looked up at the same time, and their
+            # responses are gathered back in the order they were given.
+            valid_vehicle_responses: Iterator[ValidVehicleResponse] = iter(
+                self._process_valid_vehicles(
+                    campaigns=included_campaigns,
+                    request_object=request_object,
+                    vehicles=[potential_vehicle for potential_vehicle in potential_vehicles
+                              if potential_vehicle.valid_plate]))
+
             for potential_vehicle in potential_vehicles:
 
                 if potential_vehicle.valid_plate:
-                    # If the plate is valid, process it by doing a lookup.
-                    vehicle_response: ValidVehicleResponse = self._process_valid_vehicle(
-                        campaigns=included_campaigns,
-                        request_object=request_object,
-                        vehicle=potential_vehicle)
+                    vehicle_response: ValidVehicleResponse = next(valid_vehicle_responses)
 
                     # Add lookup to summary
                     if vehicle_response.plate_lookup:
@@ -260,17 +274,14 @@ class TrafficViolationsAggregator:
                 [regexp_constants.HASHTAG_PATTERN.sub('', string) for string in string_tokens]))
 
     def _detect_plate_types(self, plate_types_input) -> bool:
-        if ',' in plate_types_input:
-            parts = plate_types_input.upper().split(',')
-            return any([regexp_constants.PLATE_TYPES_PATTERN.search(part) != None for part in parts])
-        else:
-            return regexp_constants.PLATE_TYPES_PATTERN.search(plate_types_input.upper()) != None
+        return any(part in regexp_constants.PLATE_TYPES_SET
+                   for part in plate_types_input.upper().split(','))
 
     def _detect_state(self, state_input) -> bool:
         # or state_full_pattern.search(state_input.upper()) != None
         """ Does this input constitute a valid state abbreviation """
         if state_input is not None:
-            return regexp_constants.STATE_ABBREVIATIONS_PATTERN.search(state_input.upper()) != None
+            return state_input.upper() in regexp_constants.STATE_ABBREVIATIONS_SET
 
         return False
 
@@ -333,7 +344,7 @@ class TrafficViolationsAggregator:
     def _find_potential_vehicles_using_combined_fields(self, list_of_strings: list[str]) -> list[Vehicle]:
         """Parse tweet text for vehicles using new logic of '<state>:<plate>'"""
 
-        plate_tuples: Union[Tuple[str, str, str], Tuple[str, str]] = [[part.strip() for part in match.split(':')] for match in re.findall(regexp_constants.PLATE_FORMAT_REGEX, ' '.join(
+        plate_tuples: Union[Tuple[str, str, str], Tuple[str, str]] = [[part.strip() for part in match.split(':')] for match in plate_tokenizer.find_plate_strings(' '.join(
             list_of_strings)) if all(substr not in match.lower() for substr in ['://', 'state:', 'plate:'])]
 
         return self._infer_plate_and_state_data(plate_tuples)
@@ -567,16 +578,8 @@ class TrafficViolationsAggregator:
                 f"with at least {'${:,.2f}'.format(aggregate_fines.fined - aggregate_fines.reduced)} "
                 f"in fines, of which {'${:,.2f}'.format(aggregate_fines.paid)} has been paid.\n\n"]
 
-    def _generate_unique_identifier(self):
-        return ''.join(
-            random.SystemRandom().choice(
-                string.ascii_lowercase + string.digits) for _ in range(self.UNIQUE_IDENTIFIER_STRING_LENGTH))
-
-    def _get_unique_identifier(self):
-        unique_identifier = self._generate_unique_identifier()
-        while PlateLookup.query.filter(PlateLookup.unique_identifier == unique_identifier).all():
-            unique_identifier = self._generate_unique_identifier()
-        return unique_identifier
+    def _get_unique_identifier(self) -> str:
+        return get_unique_identifier_allocator().allocate()
 
     def _get_plate_query(self, request_object: Type[BaseLookupRequest], vehicle: Vehicle) -> PlateQuery:
         """Transform a request object into plate query"""
@@ -772,23 +775,8 @@ class TrafficViolationsAggregator:
 
         for campaign in included_campaigns:
 
-            subquery = campaign.plate_lookups.session.query(
-                PlateLookup.plate, PlateLookup.state, func.max(PlateLookup.created_at).label(
-                    'most_recent_campaign_lookup'),).group_by(
-                PlateLookup.plate, PlateLookup.state).filter(
-                    and_(PlateLookup.campaigns.any(Campaign.id.in_([campaign.id])), PlateLookup.count_towards_frequency == True)).subquery('subquery')
-
-            full_query = PlateLookup.query.join(subquery,
-                                                (PlateLookup.plate == subquery.c.plate) &
-                                                (PlateLookup.state == subquery.c.state) &
-                                                (PlateLookup.created_at ==
-                                                    subquery.c.most_recent_campaign_lookup)).order_by(subquery.c.most_recent_campaign_lookup.desc(), PlateLookup.created_at.desc())
-
-            campaign_lookups = full_query.all()
-
-            campaign_vehicles: int = len(campaign_lookups)
-            campaign_tickets: int = sum(
-                [lookup.num_tickets for lookup in campaign_lookups])
+            campaign_vehicles, campaign_tickets = CampaignVehicleLookup.get_totals_for_campaign(
+                campaign_id=campaign.id)
 
             result.append(
                 (campaign.hashtag, campaign_vehicles, campaign_tickets))
@@ -802,7 +790,7 @@ class TrafficViolationsAggregator:
 
         LOG.debug('Performing lookup for plate.')
 
-        nyc_open_data_service: OpenDataService = OpenDataService()
+        nyc_open_data_service: OpenDataService = create_open_data_service()
         open_data_response: OpenDataServiceResponse = nyc_open_data_service.look_up_vehicle(
             plate_query=plate_query)
 
@@ -862,9 +850,20 @@ class TrafficViolationsAggregator:
                     # insert join record for campaign lookup
                     new_lookup.campaigns.append(campaign)
 
-                # Insert plate lookup
-                PlateLookup.query.session.add(new_lookup)
-                PlateLookup.query.session.commit()
+                # Insert plate lookup, counting it in the vehicle's stats
+                # and making it the vehicle's latest with each campaign in
+                # the same transaction.
+                with self._database_write_lock:
+                    PlateLookup.query.session.add(new_lookup)
+                    PlateLookup.query.session.flush()
+
+                    VehicleLookupStats.record_lookup(plate_lookup=new_lookup)
+
+                    for campaign in campaigns:
+                        CampaignVehicleLookup.record_lookup(
+                            campaign_id=campaign.id, plate_lookup=new_lookup)
+
+                    PlateLookup.query.session.commit()
 
         else:
             LOG.info('open data plate lookup failed')
@@ -1070,27 +1069,66 @@ class TrafficViolationsAggregator:
                                     response_parts=plate_lookup_response_parts,
                                     success_on_lookup=success_on_plate_lookup)
 
+    def _process_valid_vehicle_in_own_session(self,
+                                              campaigns: list[Campaign],
+                                              request_object: BaseLookupRequest,
+                                              vehicle: Vehicle) -> ValidVehicleResponse:
+        """Process a valid vehicle on a worker thread, which has its own
+        scoped session, closed once the vehicle is processed.
+        """
+        session = db.init_database().session
+
+        try:
+            # The campaigns belong to the request's session, so the new
+            # lookup is tied to copies of them in this thread's session.
+            return self._process_valid_vehicle(
+                campaigns=[session.merge(campaign, load=False) for campaign in campaigns],
+                request_object=request_object,
+                vehicle=vehicle)
+
+        finally:
+            session.remove()
+
+    def _process_valid_vehicles(self,
+                                campaigns: list[Campaign],
+                                request_object: BaseLookupRequest,
+                                vehicles: list[Vehicle]) -> list[ValidVehicleResponse]:
+        """Process valid vehicles at the same time, up to as many as the open
+        data service is sized for, returning their responses in order.
+
+        A request naming several vehicles then takes about as long as the
+        slowest of their lookups rather than all of them in turn.
+        """
+        if len(vehicles) < 2:
+            return [self._process_valid_vehicle(campaigns=campaigns,
+                                                request_object=request_object,
+                                                vehicle=vehicle)
+                    for vehicle in vehicles]
+
+        with ThreadPoolExecutor(
+                max_workers=min(get_max_concurrent_lookups(), len(vehicles))) as executor:
+            return list(executor.map(
+                lambda vehicle: self._process_valid_vehicle_in_own_session(
+                    campaigns=campaigns,
+                    request_object=request_object,
+                    vehicle=vehicle),
+                vehicles))
+
     def _query_for_lookup_frequency(self, plate_query: PlateQuery) -> int:
         """How many times has this plate been queried before?"""
-        return len(PlateLookup.get_all_by(
+        vehicle_lookup_stats: Optional[VehicleLookupStats] = VehicleLookupStats.get_for_vehicle(
             plate=plate_query.plate,
-            plate_types=plate_query.plate_types,
             state=plate_query.state,
-            count_towards_frequency=True))
+            plate_types=plate_query.plate_types)
+
+        return vehicle_lookup_stats.num_lookups if vehicle_lookup_stats else 0
 
     def _query_for_previous_lookup(self, plate_query: PlateQuery) -> Optional[PlateLookup]:
         """ See if we've seen this vehicle before. """
 
-        lookups_for_vehicle: list[PlateLookup] = PlateLookup.get_all_by(
+        vehicle_lookup_stats: Optional[VehicleLookupStats] = VehicleLookupStats.get_for_vehicle(
             plate=plate_query.plate,
             state=plate_query.state,
-            plate_types=plate_query.plate_types,
-            count_towards_frequency=True)
-
-        if lookups_for_vehicle:
-            lookups_for_vehicle.sort(key=lambda x: x.created_at, reverse=True)
+            plate_types=plate_query.plate_types)
 
-            return lookups_for_vehicle[0]
-
-        else:
-            return None
+        return vehicle_lookup_stats.latest_plate_lookup if vehicle_lookup_stats else None
@@ -0,0 +1,106 @@
+import codecs
+import json
+
+from typing import Any, Iterable, Iterator
+
+_DECODER = json.JSONDecoder()
+
+_WHITESPACE = ' \t\n\r'
+
+# How much already-parsed text to keep before trimming the buffer.
+_MAX_PARSED_TEXT = 1 << 16
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a UTF-8 encoded JSON array one at a time as
+    its chunks arrive, without holding the whole document or the whole
+    decoded list in memory.
+    """
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    chunk_iterator: Iterator[bytes] = iter(chunks)
+
+    buffer: str = ''
+    index: int = 0
+    exhausted: bool = False
+
+    def read_more() -> bool:
+        nonlocal buffer, exhausted, index
+
+        if exhausted:
+            return False
+
+        # Drop the parsed text so that the buffer never holds more than
+        # the element being parsed and a little more.
+        if index > _MAX_PARSED_TEXT:
+            buffer = buffer[index:]
+            index = 0
+
+        chunk: Any = next(chunk_iterator, None)
+
+        if chunk is None:
+            buffer += text_decoder.decode(b'', final=True)
+            exhausted = True
+        else:
+            buffer += text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+        return True
+
+    def skip_whitespace() -> bool:
+        """Advance to the next significant character, returning whether
+        there is one.
+        """
+        nonlocal index
+
+        while True:
+            while index < len(buffer) and buffer[index] in _WHITESPACE:
+                index += 1
+
+            if index < len(buffer):
+                return True
+
+            if not read_more():
+                return False
+
+    if not skip_whitespace() or buffer[index] != '[':
+        raise ValueError('expected a JSON array')
+    index += 1
+
+    expecting_element: bool = True
+    is_first: bool = True
+
+    while True:
+        if not skip_whitespace():
+            raise ValueError('unterminated JSON array')
+
+        if buffer[index] == ']' and (is_first or not expecting_element):
+            return
+
+        if not expecting_element:
+            if buffer[index] != ',':
+                raise ValueError(f"expected ',' or ']' at {index}")
+
+            index += 1
+            expecting_element = True
+            continue
+
+        # Parse the next element, reading more whenever it is cut off. An
+        # element that runs to the very end of the buffer (a number, say)
+        # may also continue in the next chunk.
+        while True:
+            try:
+                element, end = _DECODER.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                if read_more():
+                    continue
+                raise
+
+            if end == len(buffer) and read_more():
+                continue
+
+            break
+
+        index = end
+        expecting_element = False
+        is_first = False
+
+        yield element
@@ -0,0 +1,221 @@
+import string
+
+from typing import Optional
+
+_ALPHANUMERIC_CHARACTERS = frozenset(string.ascii_letters + string.digits)
+_STATE_CHARACTERS = frozenset(string.ascii_letters + '9')
+
+# The fields of a plate string.
+_PLATE = 0
+_PLATE_TYPES = 1
+_STATE = 2
+
+# The orders that the fields can come in, tried in the same order as the
+# alternatives of regexps.PLATE_FORMAT_REGEX.
+_PLATE_FORMATS: tuple[tuple[int, ...], ...] = (
+    (_STATE, _PLATE, _PLATE_TYPES),
+    (_STATE, _PLATE_TYPES, _PLATE),
+    (_PLATE, _STATE, _PLATE_TYPES),
+    (_PLATE, _PLATE_TYPES, _STATE),
+    (_PLATE_TYPES, _STATE, _PLATE),
+    (_PLATE_TYPES, _PLATE, _STATE),
+    (_STATE, _PLATE),
+    (_PLATE, _STATE),
+)
+
+
+def find_plate_strings(text: str) -> list[str]:
+    """Find the '<state>:<plate>[:<plate types>]' strings in text, in any
+    order of their fields, giving the same strings as
+    re.findall(regexps.PLATE_FORMAT_REGEX, text) without trying each of
+    its alternatives at every position of the text.
+
+    Every such string has its first field right before a colon, so only
+    the fields before each colon are read, and each field once.
+    """
+    plate_strings: list[str] = []
+    length: int = len(text)
+
+    colon_index: int = text.find(':')
+
+    while colon_index != -1:
+        field_end: int = colon_index
+        while field_end > 0 and text[field_end - 1].isspace():
+            field_end -= 1
+
+        field_start: int = field_end
+        while field_start > 0 and text[field_start - 1] in _ALPHANUMERIC_CHARACTERS:
+            field_start -= 1
+
+        if field_start < field_end:
+            starts: list[int] = []
+
+            if _is_word_boundary(text, field_start):
+                starts.append(field_start)
+
+            # A list of plate types can also start at any of its types
+            # before the last one.
+            if field_end - field_start == 3:
+                type_start: int = field_start
+
+                while (type_start >= 4 and text[type_start - 1] == ','
+                       and _is_alphanumeric(text, type_start - 4, type_start - 1)):
+                    type_start -= 4
+
+                    if _is_word_boundary(text, type_start):
+                        starts.append(type_start)
+
+                    if type_start == 0 or text[type_start - 1] != ',':
+                        break
+
+            for start in reversed(starts):
+                plate_string: Optional[str] = _match_plate_string(text, start, length)
+
+                if plate_string is not None:
+                    plate_strings.append(plate_string)
+
+        colon_index = text.find(':', colon_index + 1)
+
+    return plate_strings
+
+
+def _is_alphanumeric(text: str, start: int, end: int) -> bool:
+    characters: str = text[start:end]
+    return characters.isascii() and characters.isalnum()
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """Whether index follows a non-word character, as \\b does before a
+    word character.
+    """
+    return index == 0 or not _is_word_character(text[index - 1])
+
+
+def _is_word_character(character: str) -> bool:
+    return character.isalnum() or character == '_'
+
+
+def _match_plate_string(text: str, start: int, length: int) -> Optional[str]:
+    # Read up to three fields separated by colons. Each is read as a run
+    # of letters and digits, and as a list of plate types, which ends
+    # wherever the run does unless it has more than one type.
+    fields: list[tuple[int, int, list[int]]] = []
+    field_start: int = start
+
+    while True:
+        run_end: int = field_start
+        while run_end < length and text[run_end] in _ALPHANUMERIC_CHARACTERS:
+            run_end += 1
+
+        if run_end == field_start:
+            break
+
+        type_ends: list[int] = _read_plate_types(text, field_start, run_end, length)
+        fields.append((field_start, run_end, type_ends))
+
+        if len(fields) == 3:
+            break
+
+        field_start = _match_separator(
+            text, type_ends[-1] if len(type_ends) > 1 else run_end, length)
+
+        if field_start == -1:
+            break
+
+    if len(fields) < 2:
+        return None
+
+    # Which fields each of the fields followed by a separator can be.
+    inner_fields: list[tuple[bool, bool, bool]] = [
+        _read_inner_fields(text, field_data) for field_data in fields[:2]]
+
+    for plate_format in _PLATE_FORMATS:
+        last_index: int = len(plate_format) - 1
+
+        if last_index >= len(fields) or not inner_fields[0][plate_format[0]] or (
+                last_index == 2 and not inner_fields[1][plate_format[1]]):
+            continue
+
+        end: int = _match_last_field(
+            text, fields[last_index], plate_format[last_index], length)
+
+        if end != -1:
+            return text[start:end]
+
+    return None
+
+
+def _read_inner_fields(text: str,
+                       field_data: tuple[int, int, list[int]]) -> tuple[bool, bool, bool]:
+    """Whether a field followed by a separator can be a plate, a list of
+    plate types and a state, in that order.
+    """
+    field_start, run_end, type_ends = field_data
+
+    if len(type_ends) > 1:
+        return (False, True, False)
+
+    return (True,
+            bool(type_ends) and run_end == type_ends[0],
+            run_end == field_start + 2 and _is_state(text, field_start))
+
+
+def _is_state(text: str, start: int) -> bool:
+    return text[start] in _STATE_CHARACTERS and text[start + 1] in _STATE_CHARACTERS
+
+
+def _match_last_field(text: str,
+                      field_data: tuple[int, int, list[int]],
+                      field: int,
+                      length: int) -> int:
+    """Where a field that ends a plate string ends, or -1 if it can't be
+    the given field.
+    """
+    field_start, run_end, type_ends = field_data
+
+    if field == _PLATE_TYPES:
+        if not type_ends:
+            return -1
+
+        # Every type but the last is followed by a comma, and so ends on
+        # a word boundary.
+        if type_ends[-1] == length or not _is_word_character(text[type_ends[-1]]):
+            return type_ends[-1]
+
+        return type_ends[-2] if len(type_ends) > 1 else -1
+
+    if run_end < length and _is_word_character(text[run_end]):
+        return -1
+
+    if field == _STATE and not (run_end == field_start + 2 and _is_state(text, field_start)):
+        return -1
+
+    return run_end
+
+
+def _match_separator(text: str, start: int, length: int) -> int:
+    end: int = start
+    while end < length and text[end].isspace():
+        end += 1
+
+    if end == length or text[end] != ':':
+        return -1
+
+    end += 1
+    while end < length and text[end].isspace():
+        end += 1
+
+    return end
+
+
+def _read_plate_types(text: str, start: int, run_end: int, length: int) -> list[int]:
+    """The ends of the plate types in a list of them starting at start."""
+    if run_end - start < 3:
+        return []
+
+    type_ends: list[int] = [start + 3]
+    while (type_ends[-1] + 4 <= length and text[type_ends[-1]] == ','
+           and _is_alphanumeric(text, type_ends[-1] + 1, type_ends[-1] + 4)):
+        type_ends.append(type_ends[-1] + 4)
+
+    return type_ends